@@ -0,0 +1,10 @@
+"""
+Multi-agent coordination for the Claude Learning Companion.
+
+Provides the file-based blackboard, claim chains, the append-only event log
+and dependency clustering used to coordinate concurrent agents.
+
+Modules are also imported by plain name (``from blackboard import ...``) with
+this directory on sys.path; importing them through the package instead keeps
+``coordinator.blackboard`` distinct from the plugin's ``blackboard`` module.
+"""
@@ -20,8 +20,11 @@ This blackboard handles REAL-TIME COORDINATION only:
 - Question/answer protocol
 """
 
+import hashlib
 import json
+import mmap
 import os
+import struct
 import time
 import random
 import tempfile
@@ -85,6 +88,93 @@ class BlockedError(Exception):
         self.conflicting_files = conflicting_files
 
 
+# claims.idx layout: a header naming the blackboard.json version it was built
+# from (magic, st_ino, st_size, st_mtime_ns), then one record per claimed file
+# of every active chain, sorted by path key: path key, expires_at (epoch
+# seconds), agent key, chain_id. Keys are 8-byte blake2b digests.
+CLAIM_INDEX_MAGIC = b"CLX1"
+CLAIM_INDEX_HEADER = struct.Struct(">4sQQq")
+CLAIM_INDEX_RECORD = struct.Struct(">8sd8s36s")
+
+
+def _claim_key(value: str) -> bytes:
+    """Fixed-width key for a file path or agent ID in claims.idx."""
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+
+
+def _file_signature(path: Path) -> tuple:
+    """(st_ino, st_size, st_mtime_ns) of ``path``; changes on every rewrite."""
+    st = path.stat()
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+@dataclass
+class ClaimIndexEntry:
+    """An active claim on one file, as recorded in claims.idx."""
+    chain_id: str
+    agent_key: bytes
+    expires_at: float
+
+    def is_owned_by(self, agent_id: str) -> bool:
+        """Whether the claim belongs to ``agent_id``."""
+        return self.agent_key == _claim_key(agent_id)
+
+
+class ClaimIndexView:
+    """Read-only mmap of claims.idx for lock-free claim lookups.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+        self._count = (len(mm) - CLAIM_INDEX_HEADER.size) // CLAIM_INDEX_RECORD.size
+
+    def __enter__(self) -> 'ClaimIndexView':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._mm.close()
+
+    def _record(self, i: int) -> tuple:
+        return CLAIM_INDEX_RECORD.unpack_from(
+            self._mm, CLAIM_INDEX_HEADER.size + i * CLAIM_INDEX_RECORD.size
+        )
+
+    def _key(self, i: int) -> bytes:
+        offset = CLAIM_INDEX_HEADER.size + i * CLAIM_INDEX_RECORD.size
+        return self._mm[offset:offset + 8]
+
+    def find(self, file_path: str) -> Optional[ClaimIndexEntry]:
+        """Get the unexpired claim on this file, like get_claim_for_file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            ClaimIndexEntry if file is claimed, None otherwise
+        """
+        key = _claim_key(str(Path(file_path)))
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        now = time.time()
+        for i in range(lo, self._count):
+            path_key, expires_at, agent_key, chain_id = self._record(i)
+            if path_key != key:
+                break
+            if now <= expires_at:
+                return ClaimIndexEntry(chain_id.rstrip(b"\0").decode("ascii"), agent_key, expires_at)
+        return None
+
+
 class Blackboard:
     """File-based shared state with thread-safe operations.
 
@@ -97,6 +187,7 @@ class Blackboard:
         self.coordination_dir = self.project_root / ".coordination"
         self.blackboard_file = self.coordination_dir / "blackboard.json"
         self.lock_file = self.coordination_dir / ".blackboard.lock"
+        self.claim_index_file = self.coordination_dir / "claims.idx"
 
     def _ensure_dir(self):
         """Create coordination directory if it doesn't exist."""
@@ -197,6 +288,48 @@ class Blackboard:
                 pass
             raise
 
+        self._write_claim_index(state)
+
+    def _write_claim_index(self, state: Dict):
+        """Rebuild claims.idx for the blackboard.json just written.
+
+        Best effort: if this fails, the old index names an older blackboard
+        version, so claim_index_view() ignores it.
+        """
+        temp_path = None
+        try:
+            records = []
+            for chain_data in state.get("claim_chains", []):
+                if chain_data["status"] != "active":
+                    continue
+                expires_at = datetime.fromisoformat(chain_data["expires_at"]).timestamp()
+                agent_key = _claim_key(chain_data["agent_id"])
+                chain_id = chain_data["chain_id"].encode("ascii")
+                for file_path in chain_data["files"]:
+                    records.append((_claim_key(file_path), expires_at, agent_key, chain_id))
+            # Stable sort: claims on the same file keep chain order
+            records.sort(key=lambda record: record[0])
+
+            header = CLAIM_INDEX_HEADER.pack(
+                CLAIM_INDEX_MAGIC, *_file_signature(self.blackboard_file)
+            )
+            temp_fd, temp_path = tempfile.mkstemp(
+                dir=self.coordination_dir,
+                prefix='.claims_',
+                suffix='.tmp'
+            )
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(header)
+                for record in records:
+                    f.write(CLAIM_INDEX_RECORD.pack(*record))
+            os.replace(temp_path, self.claim_index_file)
+        except (OSError, KeyError, ValueError, struct.error):
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
     def _default_state(self) -> Dict:
         """Return default empty blackboard state."""
         return {
@@ -853,6 +986,31 @@ class Blackboard:
             return None
         return self._with_lock(op)
 
+    def claim_index_view(self) -> Optional[ClaimIndexView]:
+        """Open claims.idx for lock-free lookups, if it is current.
+
+        The index is rewritten with every blackboard write, so a lookup
+        costs a stat() and a binary search instead of parsing the whole
+        state. Returns None if the index is missing or was built from an
+        older blackboard.json (e.g. one written by another tool); callers
+        then fall back to get_claim_for_file().
+        """
+        try:
+            signature = _file_signature(self.blackboard_file)
+            with open(self.claim_index_file, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        size = len(mm)
+        if (
+            size < CLAIM_INDEX_HEADER.size
+            or (size - CLAIM_INDEX_HEADER.size) % CLAIM_INDEX_RECORD.size
+            or CLAIM_INDEX_HEADER.unpack_from(mm) != (CLAIM_INDEX_MAGIC,) + signature
+        ):
+            mm.close()
+            return None
+        return ClaimIndexView(mm)
+
     def get_agent_chains(self, agent_id: str) -> List[ClaimChain]:
         """Get all claim chains for an agent.
 
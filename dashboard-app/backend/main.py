@@ -24,7 +24,7 @@ from fastapi.responses import FileResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 # Import utilities
-from utils import get_db, dict_from_row, ConnectionManager, auto_capture
+from utils import get_db, dict_from_row, enable_wal, ensure_indexes, close_pool, ConnectionManager, auto_capture
 
 # Import routers
 from routers import (
@@ -39,10 +39,15 @@ from routers import (
     workflows_router,
     graph_router,
 )
-from routers.tokens import router as tokens_router, init_tokens_router
+from routers.tokens import router as tokens_router, init_tokens_router, token_watcher_loop, stop_token_watcher
 
 # Import router setup functions
-from routers.heuristics import set_manager as set_heuristics_manager
+from routers.heuristics import (
+    set_manager as set_heuristics_manager,
+    init_graph_cache,
+    graph_builder_loop,
+    stop_graph_builder,
+)
 from routers.knowledge import set_manager as set_knowledge_manager
 from routers.sessions import set_session_index
 from routers.admin import set_paths as set_admin_paths
@@ -86,6 +91,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["Content-Type", "Authorization"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -292,9 +298,18 @@ async def monitor_changes():
 
 @app.on_event("startup")
 async def startup_event():
+    # WAL first so every later connection benefits
+    enable_wal()
+
     # Initialize tokens router tables
     init_tokens_router()
 
+    # Create query indexes used by the routers
+    ensure_indexes()
+
+    # Table the heuristic graph worker and endpoint share
+    init_graph_cache()
+
     # Initial session index scan
     try:
         session_count = session_index.scan()
@@ -305,6 +320,12 @@ async def startup_event():
     # Start background monitoring
     asyncio.create_task(monitor_changes())
 
+    # Keep the prebuilt heuristic graph current
+    asyncio.create_task(graph_builder_loop())
+
+    # Let token syncs skip stat() scans while no transcript has changed
+    asyncio.create_task(token_watcher_loop())
+
     # Start auto-capture background job
     asyncio.create_task(auto_capture.start())
     logger.info("Auto-capture background job started")
@@ -316,6 +337,15 @@ async def shutdown_event():
     auto_capture.stop()
     logger.info("Auto-capture background job stopped")
 
+    # The transcript watcher's thread must exit before the interpreter does
+    await stop_token_watcher()
+
+    # A rebuild after close_pool() would silently open a new pool
+    await stop_graph_builder()
+
+    # Last, once background jobs no longer need the database
+    close_pool()
+
 
 # ==============================================================================
 # WebSocket Endpoint
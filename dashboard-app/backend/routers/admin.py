@@ -12,7 +12,7 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException
 
 from models import ActionResult, OpenInEditorRequest
-from utils import get_db, dict_from_row
+from utils import get_db, get_pool, dict_from_row
 
 router = APIRouter(prefix="/api", tags=["admin"])
 logger = logging.getLogger(__name__)
@@ -99,6 +99,12 @@ async def get_ceo_inbox_item(filename: str):
         raise HTTPException(status_code=500, detail="Failed to read item")
 
 
+@router.get("/db/pool-health")
+async def get_pool_health():
+    """Database connection pool counters (open, active, idle, waits)."""
+    return get_pool().stats()
+
+
 @router.get("/export/{export_type}")
 async def export_data(export_type: str, format: str = "json"):
     """Export data in various formats."""
@@ -12,112 +12,161 @@ Part of Auto-Claude Integration (P3: Graph-Based Memory).
 
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse, Response
 
-router = APIRouter(prefix="/api/graph", tags=["graph"])
+router = APIRouter(prefix="/api/graph", tags=["graph"], default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 # Path to CLC for importing graph_store
 CLC_PATH: Optional[Path] = None
 
+# Cached graph store handle (None is cached too, so a missing graph_store
+# module isn't re-imported on every request). Rechecked after the cooldown.
+_STORE_RECHECK_SECONDS = 5.0
+_STORE = None
+_STORE_CHECKED_AT: float = 0.0
+
 
 def set_paths(clc_path: Path):
     """Set the paths for graph operations."""
     global CLC_PATH
     CLC_PATH = clc_path
+    _reset_graph_store_cache()
+
+
+def _reset_graph_store_cache():
+    """Forget the cached graph store so the next request re-resolves it."""
+    global _STORE, _STORE_CHECKED_AT
+    _STORE = None
+    _STORE_CHECKED_AT = 0.0
 
 
 def _get_graph_store():
-    """Get the graph store, dynamically importing from CLC."""
+    """Get the graph store, dynamically importing from CLC.
+
+    The result is memoized for _STORE_RECHECK_SECONDS to avoid the sys.path
+    check and import machinery on every request.
+    """
+    global _STORE, _STORE_CHECKED_AT
+
     if CLC_PATH is None:
         return None
 
+    now = time.monotonic()
+    if _STORE_CHECKED_AT and now - _STORE_CHECKED_AT < _STORE_RECHECK_SECONDS:
+        return _STORE
+
     try:
         memory_path = CLC_PATH / "memory"
         if str(memory_path) not in sys.path:
             sys.path.insert(0, str(memory_path))
 
         from graph_store import get_graph_store
-        return get_graph_store()
+        _STORE = get_graph_store()
     except ImportError as e:
         logger.warning(f"Could not import graph_store: {e}")
-        return None
+        _STORE = None
     except Exception as e:
         logger.error(f"Error getting graph store: {e}")
-        return None
+        _STORE = None
+
+    _STORE_CHECKED_AT = now
+    return _STORE
+
+
+# SQLite fallback graph, assembled by JSON1 so no per-row Python dicts are
+# built. Nodes are the top 100 heuristics followed by their distinct domains
+# (in first-seen order), truncated to the requested limit; edges link every
+# heuristic with a domain to its domain node. Nested JSON values lose their
+# JSON subtype across subqueries, hence the json() re-wrapping.
+_FALLBACK_GRAPH_SQL = """
+    WITH h AS (
+        SELECT ROW_NUMBER() OVER (ORDER BY is_golden DESC, confidence DESC) AS rn,
+               id, domain, substr(rule, 1, 200) AS content, confidence, is_golden
+        FROM heuristics
+        ORDER BY is_golden DESC, confidence DESC
+        LIMIT 100
+    ),
+    graph_nodes AS (
+        SELECT 0 AS grp, rn, json_object(
+                   'id', 'h_' || id,
+                   'label', CASE WHEN is_golden THEN 'GoldenRule' ELSE 'Heuristic' END,
+                   'properties', json_object(
+                       'content', COALESCE(content, ''),
+                       'domain', domain,
+                       'confidence', confidence,
+                       'is_golden', is_golden
+                   )
+               ) AS node
+        FROM h
+        UNION ALL
+        SELECT 1 AS grp, MIN(rn) AS rn, json_object(
+                   'id', 'd_' || domain,
+                   'label', 'Domain',
+                   'properties', json_object('name', domain)
+               ) AS node
+        FROM h
+        WHERE domain IS NOT NULL AND domain != ''
+        GROUP BY domain
+    )
+    SELECT
+        (SELECT json_group_array(json(node)) FROM (
+            SELECT node FROM graph_nodes ORDER BY grp, rn LIMIT ?
+        )),
+        (SELECT json_group_array(json(edge)) FROM (
+            SELECT json_object(
+                       'source_id', 'h_' || id,
+                       'target_id', 'd_' || domain,
+                       'relationship', 'BELONGS_TO',
+                       'properties', json_object()
+                   ) AS edge
+            FROM h
+            WHERE domain IS NOT NULL AND domain != ''
+            ORDER BY rn
+        ))
+"""
+
 
+def _get_fallback_response(limit: int, source: str = "sqlite_fallback", **extra) -> Response:
+    """Get graph data from SQLite when graph is unavailable.
 
-def _get_fallback_data():
-    """Get data from SQLite when graph is unavailable."""
+    Returns a pre-serialized JSON response; the nodes/edges arrays come
+    straight from SQLite and are spliced into the envelope as bytes.
+    """
     try:
         backend_path = Path(__file__).parent.parent
         if str(backend_path) not in sys.path:
             sys.path.insert(0, str(backend_path))
 
-        from utils import get_db, dict_from_row
+        from utils import get_db
 
         with get_db() as conn:
             cursor = conn.cursor()
-
-            # Get heuristics as nodes (including golden rules which have is_golden=1)
-            cursor.execute("""
-                SELECT id, domain, rule, confidence, is_golden
-                FROM heuristics
-                ORDER BY is_golden DESC, confidence DESC
-                LIMIT 100
-            """)
-            heuristics = [dict_from_row(r) for r in cursor.fetchall()]
-
-            # Build nodes - separate golden rules from regular heuristics
-            nodes = []
-            for h in heuristics:
-                label = "GoldenRule" if h["is_golden"] else "Heuristic"
-                nodes.append({
-                    "id": f"h_{h['id']}",
-                    "label": label,
-                    "properties": {
-                        "content": h["rule"][:200] if h["rule"] else "",
-                        "domain": h["domain"],
-                        "confidence": h["confidence"],
-                        "is_golden": h["is_golden"]
-                    }
-                })
-
-            # Get unique domains
-            domains = set()
-            for h in heuristics:
-                if h["domain"]:
-                    domains.add(h["domain"])
-
-            for domain in domains:
-                nodes.append({
-                    "id": f"d_{domain}",
-                    "label": "Domain",
-                    "properties": {"name": domain}
-                })
-
-            # Build edges (heuristic -> domain)
-            edges = []
-            for h in heuristics:
-                if h["domain"]:
-                    edges.append({
-                        "source_id": f"h_{h['id']}",
-                        "target_id": f"d_{h['domain']}",
-                        "relationship": "BELONGS_TO",
-                        "properties": {}
-                    })
-
-            return {
-                "nodes": nodes,
-                "edges": edges,
-                "source": "sqlite_fallback"
-            }
+            cursor.execute(_FALLBACK_GRAPH_SQL, (limit,))
+            nodes_json, edges_json = cursor.fetchone()
     except Exception as e:
         logger.error(f"Error getting fallback data: {e}")
-        return {"nodes": [], "edges": [], "source": "error", "error": str(e)}
+        return ORJSONResponse({
+            "nodes": [],
+            "edges": [],
+            "source": "error",
+            "error": str(e),
+            "falkordb_available": False
+        })
+
+    tail = orjson.dumps({"source": source, **extra, "falkordb_available": False})
+    body = b"".join((
+        b'{"nodes":', nodes_json.encode(),
+        b',"edges":', edges_json.encode(),
+        b",", tail[1:]
+    ))
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/stats")
@@ -192,13 +241,7 @@ async def get_knowledge_graph(
 
     if store is None or not store.is_available:
         # Return SQLite-based graph data
-        fallback = _get_fallback_data()
-        return {
-            "nodes": fallback["nodes"][:limit],
-            "edges": fallback["edges"],
-            "source": fallback.get("source", "sqlite_fallback"),
-            "falkordb_available": False
-        }
+        return _get_fallback_response(limit)
 
     try:
         result = store.get_knowledge_graph_data(limit=limit)
@@ -230,14 +273,7 @@ async def get_knowledge_graph(
         }
     except Exception as e:
         logger.error(f"Error getting knowledge graph: {e}")
-        fallback = _get_fallback_data()
-        return {
-            "nodes": fallback["nodes"][:limit],
-            "edges": fallback["edges"],
-            "source": "sqlite_fallback_on_error",
-            "error": str(e),
-            "falkordb_available": False
-        }
+        return _get_fallback_response(limit, source="sqlite_fallback_on_error", error=str(e))
 
 
 @router.get("/related/{heuristic_id}")
@@ -282,7 +318,7 @@ async def get_related_heuristics(
 
                 # Get other heuristics in same domain
                 cursor.execute("""
-                    SELECT id, domain, rule, confidence
+                    SELECT id, domain, COALESCE(substr(rule, 1, 200), '') AS content, confidence
                     FROM heuristics
                     WHERE domain = ? AND id != ?
                     ORDER BY confidence DESC
@@ -293,7 +329,7 @@ async def get_related_heuristics(
                     {
                         "id": r[0],
                         "domain": r[1],
-                        "content": r[2][:200] if r[2] else "",
+                        "content": r[2],
                         "confidence": r[3],
                         "relationship": "SAME_DOMAIN"
                     }
@@ -393,7 +429,7 @@ async def get_heuristics_by_domain(domain: str):
             with get_db() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT id, domain, rule, confidence, is_golden
+                    SELECT id, domain, COALESCE(substr(rule, 1, 200), '') AS content, confidence, is_golden
                     FROM heuristics
                     WHERE domain = ?
                     ORDER BY confidence DESC
@@ -403,7 +439,7 @@ async def get_heuristics_by_domain(domain: str):
                     {
                         "id": r[0],
                         "domain": r[1],
-                        "content": r[2][:200] if r[2] else "",
+                        "content": r[2],
                         "confidence": r[3],
                         "is_golden": r[4],
                         "relationships": []
@@ -2,39 +2,96 @@
 Heuristics Router - CRUD, graph visualization, promote/demote.
 """
 
+import asyncio
+import heapq
+import logging
 import re
+import sqlite3
+import sys
 from collections import defaultdict
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 
 from models import HeuristicUpdate, ActionResult
 from utils import get_db, dict_from_row
 from utils.time_filters import parse_time_params, build_time_filter
 
-router = APIRouter(prefix="/api", tags=["heuristics"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api", tags=["heuristics"], default_response_class=ORJSONResponse)
 
 # ConnectionManager will be injected from main.py
 manager = None
 
+# The heuristic graph is O(N^2) to build, so a background worker keeps a
+# prebuilt payload in the graph_cache table and the endpoint just reads it.
+GRAPH_REBUILD_DEBOUNCE_SECONDS = 0.5
+# Safety net for heuristics changed outside the dashboard (hooks, CLI)
+GRAPH_RECHECK_SECONDS = 60.0
+
+# UPDATE ... RETURNING needs SQLite 3.35+; older builds use SELECT + UPDATE
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_graph_dirty: Optional[asyncio.Event] = None
+_graph_stale = False
+_graph_builder_task: Optional[asyncio.Task] = None
+
 
 def set_manager(m):
     """Set the ConnectionManager for broadcasting updates."""
     global manager
     manager = m
+    m.subscribe(_on_broadcast)
+
+
+def _on_broadcast(update_type: str, data: dict):
+    """Invalidate the cached graph on any heuristic write event."""
+    if update_type.startswith("heuristic"):
+        invalidate_graph_cache()
+
+
+def invalidate_graph_cache():
+    """Mark the cached heuristic graph as out of date."""
+    global _graph_stale
+    if _graph_dirty is not None:
+        _graph_dirty.set()
+    else:
+        # No worker running - rebuild on the next request instead
+        _graph_stale = True
+
+
+def _parse_cursor(after: str):
+    """Parse a "{confidence}:{id}" keyset cursor from X-Next-Cursor."""
+    try:
+        confidence, heuristic_id = after.rsplit(":", 1)
+        return float(confidence), int(heuristic_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor, expected '<confidence>:<id>'")
 
 
 @router.get("/heuristics")
 async def get_heuristics(
+    response: Response,
     domain: Optional[str] = None,
     golden_only: bool = False,
     sort_by: str = "confidence",
     limit: int = 50,
     at_time: Optional[str] = Query(None, description="View heuristics as of this timestamp"),
-    time_range: Optional[str] = Query(None, description="Time range filter")
+    time_range: Optional[str] = Query(None, description="Time range filter"),
+    after: Optional[str] = Query(None, description="Cursor from X-Next-Cursor (sort_by=confidence only)")
 ):
-    """Get heuristics with optional filtering and time-based queries."""
+    """Get heuristics with optional filtering and time-based queries.
+
+    Pages through results by keyset: when a full page is returned, the
+    X-Next-Cursor header holds the value to pass as ``after`` for the next one.
+    """
+    if after and sort_by != "confidence":
+        raise HTTPException(status_code=400, detail="Cursor pagination requires sort_by=confidence")
+
     with get_db() as conn:
         cursor = conn.cursor()
 
@@ -61,18 +118,29 @@ async def get_heuristics(
         if golden_only:
             query += " AND is_golden = 1"
 
+        if after:
+            after_confidence, after_id = _parse_cursor(after)
+            query += " AND (confidence < ? OR (confidence = ? AND id < ?))"
+            params.extend([after_confidence, after_confidence, after_id])
+
         sort_map = {
-            "confidence": "confidence DESC",
+            "confidence": "confidence DESC, id DESC",
             "validated": "times_validated DESC",
             "violated": "times_violated DESC",
             "recent": "created_at DESC"
         }
-        query += f" ORDER BY {sort_map.get(sort_by, 'confidence DESC')}"
+        query += f" ORDER BY {sort_map.get(sort_by, 'confidence DESC, id DESC')}"
         query += " LIMIT ?"
         params.append(limit)
 
         cursor.execute(query, params)
-        return [dict_from_row(r) for r in cursor.fetchall()]
+        rows = [dict_from_row(r) for r in cursor.fetchall()]
+
+        if sort_by == "confidence" and rows and len(rows) == limit:
+            last = rows[-1]
+            response.headers["X-Next-Cursor"] = f"{last['confidence']!r}:{last['id']}"
+
+        return rows
 
 
 @router.get("/heuristics/{heuristic_id}")
@@ -89,14 +157,16 @@ async def get_heuristic(heuristic_id: int):
         if not heuristic:
             raise HTTPException(status_code=404, detail="Heuristic not found")
 
-        # Get validation/violation history from metrics
+        # Get validation/violation history from metrics.
+        # Hooks write tags as exactly "heuristic_id:N", so an equality match
+        # uses idx_metrics_tags (and doesn't match heuristic_id:N0, N1, ...).
         cursor.execute("""
             SELECT metric_type, timestamp, context
             FROM metrics
-            WHERE tags LIKE ?
+            WHERE tags = ?
             ORDER BY timestamp DESC
             LIMIT 20
-        """, (f"%heuristic_id:{heuristic_id}%",))
+        """, (f"heuristic_id:{heuristic_id}",))
         heuristic["history"] = [dict_from_row(r) for r in cursor.fetchall()]
 
         # Get related heuristics (same domain)
@@ -112,174 +182,332 @@ async def get_heuristic(heuristic_id: int):
         return heuristic
 
 
-@router.get("/heuristic-graph")
-async def get_heuristic_graph():
-    """Get heuristic graph data for force-directed visualization.
+def _build_heuristic_graph(conn) -> dict:
+    """Build heuristic graph data for force-directed visualization.
 
-    Returns nodes (heuristics) and edges (relationships based on domain similarity
-    and concept overlap).
+    Returns nodes (heuristics plus one hub node per domain) and edges
+    (domain membership and concept overlap).
     """
-    with get_db() as conn:
-        cursor = conn.cursor()
-
-        # Get all heuristics with their key properties
-        cursor.execute("""
-            SELECT id, domain, rule, explanation, confidence,
-                   times_validated, times_violated, is_golden,
-                   created_at
-            FROM heuristics
-            ORDER BY confidence DESC
-        """)
-
-        heuristics = [dict_from_row(r) for r in cursor.fetchall()]
-
-        # Create nodes
-        nodes = []
-        for h in heuristics:
-            nodes.append({
-                "id": h["id"],
-                "label": h["rule"][:50] + ("..." if len(h["rule"]) > 50 else ""),
-                "fullText": h["rule"],
-                "domain": h["domain"],
-                "confidence": h["confidence"],
-                "is_golden": bool(h["is_golden"]),
-                "times_validated": h["times_validated"],
-                "times_violated": h["times_violated"],
-                "explanation": h["explanation"],
-                "created_at": h["created_at"]
+    cursor = conn.cursor()
+
+    # Get all heuristics with their key properties
+    cursor.execute("""
+        SELECT id, domain, rule, explanation, confidence,
+               times_validated, times_violated, is_golden,
+               created_at,
+               substr(rule, 1, 50) || CASE WHEN length(rule) > 50 THEN '...' ELSE '' END AS label
+        FROM heuristics
+        ORDER BY confidence DESC
+    """)
+
+    heuristics = [dict_from_row(r) for r in cursor.fetchall()]
+
+    # Share one string object per domain across nodes, hub ids and edge
+    # labels so the pairwise domain comparisons below are identity checks
+    for h in heuristics:
+        if h["domain"]:
+            h["domain"] = sys.intern(h["domain"])
+
+    # Create nodes
+    nodes = []
+    for h in heuristics:
+        nodes.append({
+            "id": h["id"],
+            "label": h["label"],
+            "fullText": h["rule"],
+            "domain": h["domain"],
+            "confidence": h["confidence"],
+            "is_golden": bool(h["is_golden"]),
+            "times_validated": h["times_validated"],
+            "times_violated": h["times_violated"],
+            "explanation": h["explanation"],
+            "created_at": h["created_at"]
+        })
+
+    # Create edges based on:
+    # 1. Domain membership (strong connection, via a per-domain hub node)
+    # 2. Keyword overlap (weaker connection)
+    edges = []
+    edge_id = 0
+
+    # Group heuristics by domain for same-domain connections
+    domain_map = defaultdict(list)
+    for h in heuristics:
+        domain_map[h["domain"]].append(h["id"])
+
+    # One hub node per domain with a BELONGS_TO edge from each member.
+    # Linking members pairwise would emit D*(D-1)/2 edges per domain.
+    for domain, ids in domain_map.items():
+        hub_id = sys.intern(f"domain_{domain}")
+        nodes.append({
+            "id": hub_id,
+            "label": domain,
+            "domain": domain,
+            "is_hub": True,
+            "is_golden": False
+        })
+        for heuristic_id in ids:
+            edges.append({
+                "id": edge_id,
+                "source": heuristic_id,
+                "target": hub_id,
+                "strength": 1.0,
+                "type": "belongs_to",
+                "label": domain
             })
-
-        # Create edges based on:
-        # 1. Same domain (strong connection)
-        # 2. Keyword overlap (weaker connection)
-        edges = []
-        edge_id = 0
-
-        # Group heuristics by domain for same-domain connections
-        domain_map = defaultdict(list)
-        for h in heuristics:
-            domain_map[h["domain"]].append(h["id"])
-
-        # Create edges for same domain
-        for domain, ids in domain_map.items():
-            for i, id1 in enumerate(ids):
-                for id2 in ids[i+1:]:
+            edge_id += 1
+
+    # Create edges for keyword similarity (limit to avoid too many edges)
+    # Extract keywords from rules
+    def extract_keywords(text):
+        """Extract significant words from rule text."""
+        if not text:
+            return set()
+        # Remove common words and extract significant terms
+        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can'}
+        words = re.findall(r'\w+', text.lower())
+        return {w for w in words if len(w) > 3 and w not in stopwords}
+
+    # Build keyword map
+    heuristic_keywords = {}
+    for h in heuristics:
+        keywords = extract_keywords(h["rule"])
+        if h["explanation"]:
+            keywords.update(extract_keywords(h["explanation"]))
+        heuristic_keywords[h["id"]] = frozenset(keywords)
+
+    # Find keyword-based connections (only strong overlaps)
+    for i, h1 in enumerate(heuristics):
+        for h2 in heuristics[i+1:]:
+            # Skip if same domain (already connected)
+            if h1["domain"] == h2["domain"]:
+                continue
+
+            keywords1 = heuristic_keywords[h1["id"]]
+            keywords2 = heuristic_keywords[h2["id"]]
+
+            # Count overlap by probing the larger set from the smaller one;
+            # only build the overlap set for pairs that become edges
+            small, large = (keywords1, keywords2) if len(keywords1) <= len(keywords2) else (keywords2, keywords1)
+            common = 0
+            for word in small:
+                if word in large:
+                    common += 1
+            if common >= 2:  # At least 2 common keywords
+                strength = common / len(large)
+                if strength > 0.2:  # Only strong connections
+                    overlap = small & large
                     edges.append({
                         "id": edge_id,
-                        "source": id1,
-                        "target": id2,
-                        "strength": 1.0,
-                        "type": "same_domain",
-                        "label": domain
+                        "source": h1["id"],
+                        "target": h2["id"],
+                        "strength": strength,
+                        "type": "keyword_similarity",
+                        "label": ", ".join(list(overlap)[:3])
                     })
                     edge_id += 1
 
-        # Create edges for keyword similarity (limit to avoid too many edges)
-        # Extract keywords from rules
-        def extract_keywords(text):
-            """Extract significant words from rule text."""
-            if not text:
-                return set()
-            # Remove common words and extract significant terms
-            stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can'}
-            words = re.findall(r'\w+', text.lower())
-            return {w for w in words if len(w) > 3 and w not in stopwords}
-
-        # Build keyword map
-        heuristic_keywords = {}
-        for h in heuristics:
-            keywords = extract_keywords(h["rule"])
-            if h["explanation"]:
-                keywords.update(extract_keywords(h["explanation"]))
-            heuristic_keywords[h["id"]] = keywords
-
-        # Find keyword-based connections (only strong overlaps)
-        for i, h1 in enumerate(heuristics):
-            for h2 in heuristics[i+1:]:
-                # Skip if same domain (already connected)
-                if h1["domain"] == h2["domain"]:
-                    continue
-
-                keywords1 = heuristic_keywords[h1["id"]]
-                keywords2 = heuristic_keywords[h2["id"]]
-
-                # Calculate overlap
-                overlap = keywords1 & keywords2
-                if len(overlap) >= 2:  # At least 2 common keywords
-                    strength = len(overlap) / max(len(keywords1), len(keywords2))
-                    if strength > 0.2:  # Only strong connections
-                        edges.append({
-                            "id": edge_id,
-                            "source": h1["id"],
-                            "target": h2["id"],
-                            "strength": strength,
-                            "type": "keyword_similarity",
-                            "label": ", ".join(list(overlap)[:3])
-                        })
-                        edge_id += 1
-
-        # Limit edges per node to avoid clutter (keep strongest connections)
-        MAX_EDGES_PER_NODE = 10
-        node_edge_counts = defaultdict(list)
-        for edge in edges:
-            node_edge_counts[edge["source"]].append(edge)
-            node_edge_counts[edge["target"]].append(edge)
-
-        # Keep only top edges per node
-        edges_to_keep = set()
-        for node_id, node_edges in node_edge_counts.items():
-            # Sort by strength and keep top N
-            sorted_edges = sorted(node_edges, key=lambda e: e["strength"], reverse=True)
-            for edge in sorted_edges[:MAX_EDGES_PER_NODE]:
-                edges_to_keep.add(edge["id"])
-
-        filtered_edges = [e for e in edges if e["id"] in edges_to_keep]
-
-        return {
-            "nodes": nodes,
-            "edges": filtered_edges,
-            "stats": {
-                "total_nodes": len(nodes),
-                "total_edges": len(filtered_edges),
-                "golden_rules": sum(1 for n in nodes if n["is_golden"]),
-                "domains": len(domain_map)
-            }
+    # Limit edges per node to avoid clutter (keep strongest connections)
+    MAX_EDGES_PER_NODE = 10
+    # (-strength, id) tuples order strongest first with ties in creation
+    # order, so ranking needs no key function or per-edge dict lookups
+    node_edge_ranks = defaultdict(list)
+    for edge in edges:
+        rank = (-edge["strength"], edge["id"])
+        node_edge_ranks[edge["source"]].append(rank)
+        node_edge_ranks[edge["target"]].append(rank)
+
+    # Keep only top edges per node
+    edges_to_keep = set()
+    for ranks in node_edge_ranks.values():
+        for _, edge_id in heapq.nsmallest(MAX_EDGES_PER_NODE, ranks):
+            edges_to_keep.add(edge_id)
+
+    filtered_edges = [e for e in edges if e["id"] in edges_to_keep]
+
+    return {
+        "nodes": nodes,
+        "edges": filtered_edges,
+        "stats": {
+            "total_nodes": len(heuristics),
+            "total_edges": len(filtered_edges),
+            "golden_rules": sum(1 for h in heuristics if h["is_golden"]),
+            "domains": len(domain_map)
         }
+    }
 
 
-@router.post("/heuristics/{heuristic_id}/promote")
-async def promote_to_golden(heuristic_id: int) -> ActionResult:
-    """Promote a heuristic to golden rule."""
+def _signature(cursor) -> tuple:
+    """Cheap fingerprint of the heuristics table for change detection."""
+    # Hooks bump counters/confidence without always touching updated_at
+    cursor.execute("""
+        SELECT COUNT(*), MAX(id), MAX(updated_at), TOTAL(confidence),
+               TOTAL(times_validated), TOTAL(times_violated), TOTAL(is_golden)
+        FROM heuristics
+    """)
+    return tuple(cursor.fetchone())
+
+
+def init_graph_cache():
+    """Create the graph_cache table - called once from main.py at startup."""
     with get_db() as conn:
-        cursor = conn.cursor()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS graph_cache (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                payload BLOB NOT NULL,
+                signature TEXT,
+                built_at TEXT NOT NULL
+            )
+        """)
+        conn.commit()
 
-        cursor.execute("SELECT * FROM heuristics WHERE id = ?", (heuristic_id,))
-        heuristic = cursor.fetchone()
 
-        if not heuristic:
-            raise HTTPException(status_code=404, detail="Heuristic not found")
+def _rebuild_graph_cache(force: bool = False) -> Optional[bytes]:
+    """Recompute the graph and store it in graph_cache.
 
-        if heuristic["is_golden"]:
-            return ActionResult(success=False, message="Already a golden rule")
+    Skips the rebuild (returning None) when not forced and the heuristics
+    table is unchanged since the cached payload was built.
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        signature = repr(_signature(cursor))
+
+        if not force:
+            cursor.execute("SELECT signature FROM graph_cache WHERE id = 1")
+            row = cursor.fetchone()
+            if row and row["signature"] == signature:
+                return None
 
+        payload = orjson.dumps(_build_heuristic_graph(conn))
         cursor.execute("""
-            UPDATE heuristics
-            SET is_golden = 1, updated_at = ?
-            WHERE id = ?
-        """, (datetime.now().isoformat(), heuristic_id))
+            INSERT OR REPLACE INTO graph_cache (id, payload, signature, built_at)
+            VALUES (1, ?, ?, ?)
+        """, (payload, signature, datetime.now().isoformat()))
+        conn.commit()
+        return payload
+
+
+async def graph_builder_loop():
+    """Keep graph_cache fresh - started as a background task from main.py.
+
+    Rebuilds whenever a heuristic write event arrives, and every
+    GRAPH_RECHECK_SECONDS if the heuristics table changed underneath us.
+    Runs until stop_graph_builder() cancels it.
+    """
+    global _graph_dirty, _graph_builder_task
+    _graph_dirty = asyncio.Event()
+    _graph_builder_task = asyncio.current_task()
+    _graph_dirty.set()  # build once on startup
+    loop = asyncio.get_running_loop()
+
+    while True:
+        try:
+            await asyncio.wait_for(_graph_dirty.wait(), timeout=GRAPH_RECHECK_SECONDS)
+            force = True
+        except asyncio.TimeoutError:
+            force = False
+
+        # Coalesce bursts of writes into one rebuild
+        await asyncio.sleep(GRAPH_REBUILD_DEBOUNCE_SECONDS)
+        _graph_dirty.clear()
+
+        rebuild = loop.run_in_executor(None, _rebuild_graph_cache, force)
+        try:
+            await asyncio.shield(rebuild)
+        except asyncio.CancelledError:
+            # The thread cannot be cancelled; let it finish with the pool open
+            await asyncio.wait({rebuild})
+            raise
+        except Exception as e:
+            logger.error(f"Heuristic graph rebuild failed: {e}", exc_info=True)
+
+
+async def stop_graph_builder():
+    """Cancel graph_builder_loop() and wait until no rebuild is running."""
+    global _graph_dirty, _graph_builder_task
+    task = _graph_builder_task
+    if task is None:
+        return
+    _graph_builder_task = None
+    _graph_dirty = None
+    task.cancel()
+    await asyncio.wait({task})
+
+
+@router.get("/heuristic-graph")
+async def get_heuristic_graph():
+    """Get heuristic graph data for force-directed visualization.
+
+    Served from graph_cache; built inline only if the worker has not
+    produced a payload yet (or is not running and the graph was invalidated).
+    """
+    global _graph_stale
+    payload = None
+
+    if not _graph_stale:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT payload FROM graph_cache WHERE id = 1")
+            row = cursor.fetchone()
+            if row:
+                payload = row["payload"]
+
+    if payload is None:
+        _graph_stale = False
+        payload = _rebuild_graph_cache(force=True)
+
+    return Response(payload, media_type="application/json")
+
+
+@router.post("/heuristics/{heuristic_id}/promote")
+async def promote_to_golden(heuristic_id: int) -> ActionResult:
+    """Promote a heuristic to golden rule."""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        now = datetime.now().isoformat()
+
+        if _HAS_RETURNING:
+            # Update and fetch the rule in one statement; no row back means
+            # the heuristic is missing or already golden
+            cursor.execute("""
+                UPDATE heuristics
+                SET is_golden = 1, updated_at = ?
+                WHERE id = ? AND is_golden = 0
+                RETURNING rule
+            """, (now, heuristic_id))
+            promoted = cursor.fetchone()
+            rule = promoted["rule"] if promoted else None
+        else:
+            cursor.execute("SELECT rule FROM heuristics WHERE id = ? AND is_golden = 0", (heuristic_id,))
+            promoted = cursor.fetchone()
+            rule = None
+            if promoted:
+                cursor.execute("""
+                    UPDATE heuristics
+                    SET is_golden = 1, updated_at = ?
+                    WHERE id = ? AND is_golden = 0
+                """, (now, heuristic_id))
+                if cursor.rowcount:
+                    rule = promoted["rule"]
+
+        if rule is None:
+            cursor.execute("SELECT 1 FROM heuristics WHERE id = ?", (heuristic_id,))
+            if not cursor.fetchone():
+                raise HTTPException(status_code=404, detail="Heuristic not found")
+            return ActionResult(success=False, message="Already a golden rule")
 
         # Log the promotion
         cursor.execute("""
             INSERT INTO metrics (metric_type, metric_name, metric_value, context, timestamp)
             VALUES ('golden_rule_promotion', 'manual_promotion', ?, ?, ?)
-        """, (heuristic_id, heuristic["rule"][:100], datetime.now().isoformat()))
+        """, (heuristic_id, rule[:100], now))
 
         conn.commit()
 
         if manager:
-            await manager.broadcast_update("heuristic_promoted", {
+            manager.schedule_update("heuristic_promoted", {
                 "heuristic_id": heuristic_id,
-                "rule": heuristic["rule"]
+                "rule": rule
             })
 
         return ActionResult(success=True, message="Promoted to golden rule")
@@ -303,7 +531,7 @@ async def demote_from_golden(heuristic_id: int) -> ActionResult:
         conn.commit()
 
         if manager:
-            await manager.broadcast_update("heuristic_demoted", {"heuristic_id": heuristic_id})
+            manager.schedule_update("heuristic_demoted", {"heuristic_id": heuristic_id})
 
         return ActionResult(success=True, message="Demoted from golden rule")
 
@@ -314,11 +542,6 @@ async def update_heuristic(heuristic_id: int, update: HeuristicUpdate) -> Action
     with get_db() as conn:
         cursor = conn.cursor()
 
-        # Verify heuristic exists
-        cursor.execute("SELECT id FROM heuristics WHERE id = ?", (heuristic_id,))
-        if not cursor.fetchone():
-            raise HTTPException(status_code=404, detail="Heuristic not found")
-
         updates = []
         params = []
 
@@ -339,6 +562,10 @@ async def update_heuristic(heuristic_id: int, update: HeuristicUpdate) -> Action
             params.append(1 if update.is_golden else 0)
 
         if not updates:
+            # No UPDATE to report a missing row, so check existence here
+            cursor.execute("SELECT 1 FROM heuristics WHERE id = ?", (heuristic_id,))
+            if not cursor.fetchone():
+                raise HTTPException(status_code=404, detail="Heuristic not found")
             return ActionResult(success=False, message="No updates provided")
 
         updates.append("updated_at = ?")
@@ -351,10 +578,13 @@ async def update_heuristic(heuristic_id: int, update: HeuristicUpdate) -> Action
             WHERE id = ?
         """, params)
 
+        if cursor.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Heuristic not found")
+
         conn.commit()
 
         if manager:
-            await manager.broadcast_update("heuristic_updated", {"heuristic_id": heuristic_id})
+            manager.schedule_update("heuristic_updated", {"heuristic_id": heuristic_id})
 
         return ActionResult(success=True, message="Heuristic updated")
 
@@ -373,6 +603,6 @@ async def delete_heuristic(heuristic_id: int) -> ActionResult:
         conn.commit()
 
         if manager:
-            await manager.broadcast_update("heuristic_deleted", {"heuristic_id": heuristic_id})
+            manager.schedule_update("heuristic_deleted", {"heuristic_id": heuristic_id})
 
         return ActionResult(success=True, message="Heuristic deleted")
@@ -2,14 +2,20 @@
 Sessions Router - Session history and projects.
 """
 
+import asyncio
+import importlib.util
 import logging
-import subprocess
-import sys
-from dataclasses import asdict
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+import orjson
+from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from utils.http_cache import make_etag, not_modified, etag_response
 
 router = APIRouter(prefix="/api", tags=["sessions"])
 logger = logging.getLogger(__name__)
@@ -17,6 +23,20 @@ logger = logging.getLogger(__name__)
 # Path to summarizer script
 SUMMARIZER_SCRIPT = Path.home() / ".claude" / "clc" / "scripts" / "summarize-session.py"
 
+# Summarizer runs in worker threads, which cannot be killed. A timeout is
+# logged, but the semaphore slot stays held until the thread finishes, and a
+# batch starts no new session once its timeout has passed.
+SUMMARIZE_TIMEOUT_SECONDS = 60
+SUMMARIZE_BATCH_TIMEOUT_SECONDS = 300
+MAX_CONCURRENT_SUMMARIZERS = 2
+
+_summarizer = None
+_summarizer_lock = threading.Lock()
+_summarizer_semaphore: Optional[asyncio.Semaphore] = None
+
+# Streamed session bodies are flushed in chunks of roughly this size
+SESSION_STREAM_CHUNK_BYTES = 64 * 1024
+
 # SessionIndex will be injected from main.py
 session_index = None
 
@@ -28,7 +48,7 @@ def set_session_index(idx):
 
 
 @router.get("/sessions/stats")
-async def get_session_stats():
+async def get_session_stats(request: Request):
     """
     Get session statistics.
 
@@ -45,8 +65,12 @@ async def get_session_stats():
     try:
         if session_index is None:
             raise HTTPException(status_code=500, detail="Session index not initialized")
-        stats = session_index.get_stats()
-        return stats
+        # Stats only change when the index is rescanned
+        etag = make_etag("session-stats", session_index.last_scan)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        return etag_response(session_index.get_stats(), etag)
 
     except Exception as e:
         logger.error(f"Error getting session stats: {e}", exc_info=True)
@@ -95,7 +119,7 @@ async def get_sessions(
         )
 
         return {
-            "sessions": [asdict(s) for s in sessions],
+            "sessions": [s.to_dict() for s in sessions],
             "total": total,
             "offset": offset,
             "limit": limit
@@ -106,6 +130,42 @@ async def get_sessions(
         raise HTTPException(status_code=500, detail="Failed to list sessions")
 
 
+def _stream_session(metadata, messages: Iterator[Any], summary: Optional[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode a session as JSON incrementally, in the shape load_full_session returns."""
+    head = orjson.dumps({
+        "session_id": metadata.session_id,
+        "project": metadata.project,
+        "project_path": metadata.project_path,
+        "first_timestamp": metadata.first_timestamp,
+        "last_timestamp": metadata.last_timestamp,
+        "prompt_count": metadata.prompt_count,
+        "git_branch": metadata.git_branch,
+        "is_agent": metadata.is_agent,
+    })
+    tail = {"has_summary": summary is not None}
+    if summary:
+        tail["summary"] = summary
+
+    buffer = bytearray(head[:-1] + b',"messages":[')
+    first = True
+    try:
+        for message in messages:
+            if not first:
+                buffer += b","
+            buffer += orjson.dumps(message)
+            first = False
+            if len(buffer) >= SESSION_STREAM_CHUNK_BYTES:
+                yield bytes(buffer)
+                buffer.clear()
+    except Exception as e:
+        # Headers are already sent; abort the body rather than emit bad JSON
+        logger.error(f"Error streaming session {metadata.session_id}: {e}", exc_info=True)
+        raise
+
+    buffer += b"]," + orjson.dumps(tail)[1:]
+    yield bytes(buffer)
+
+
 @router.get("/sessions/{session_id}")
 async def get_session(session_id: str):
     """
@@ -142,19 +202,33 @@ async def get_session(session_id: str):
         if session_index is None:
             raise HTTPException(status_code=500, detail="Session index not initialized")
 
-        session = session_index.load_full_session(session_id)
-
-        if not session:
+        metadata = session_index.get_session_metadata(session_id)
+        if not metadata:
             raise HTTPException(status_code=404, detail="Session not found")
 
-        return session
+        summary = session_index.get_session_summary(session_id)
+
+        # Opened last: nothing below can fail and leak the file handle
+        messages = session_index.iter_session_messages(session_id)
+        if messages is None:
+            # Dropped from the index since the metadata lookup
+            raise HTTPException(status_code=404, detail="Session not found")
 
     except HTTPException:
         raise
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Session not found")
     except Exception as e:
         logger.error(f"Error loading session {session_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to load session")
 
+    # Messages are read and encoded as the body is sent, so long sessions
+    # are never held in memory as one list/JSON string
+    return StreamingResponse(
+        _stream_session(metadata, messages, summary),
+        media_type="application/json"
+    )
+
 
 @router.get("/projects")
 async def get_session_projects():
@@ -215,20 +289,89 @@ async def get_session_summary(session_id: str):
         raise HTTPException(status_code=500, detail="Failed to get session summary")
 
 
-def _run_summarizer(session_id: str, use_llm: bool = True):
-    """Background task to run the summarizer script."""
+def _load_summarizer():
+    """Import the summarizer script once and reuse it.
+
+    The file name contains a hyphen, so it is loaded by path rather than
+    imported by name.
+    """
+    global _summarizer
+    with _summarizer_lock:
+        if _summarizer is None:
+            spec = importlib.util.spec_from_file_location("summarize_session", SUMMARIZER_SCRIPT)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load summarizer from {SUMMARIZER_SCRIPT}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _summarizer = module
+    return _summarizer
+
+
+def _get_summarizer_semaphore() -> asyncio.Semaphore:
+    # Created on first use so it binds to the running loop (Python < 3.10)
+    global _summarizer_semaphore
+    if _summarizer_semaphore is None:
+        _summarizer_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIZERS)
+    return _summarizer_semaphore
+
+
+def _summarize_batch(older_than_hours: float, limit: int, use_llm: bool,
+                     deadline: float) -> Tuple[int, int]:
+    """Summarize up to `limit` unsummarized sessions; returns (succeeded, attempted).
+
+    No new session is started once time.monotonic() passes `deadline`.
+    """
+    summarizer = _load_summarizer()
+    session_ids = summarizer.get_unsummarized_sessions(older_than_hours)[:limit]
+    succeeded = attempted = 0
+    for sid in session_ids:
+        if time.monotonic() >= deadline:
+            logger.warning(f"Batch summarization deadline passed; skipped {len(session_ids) - attempted} sessions")
+            break
+        attempted += 1
+        if summarizer.summarize_session(sid, use_llm=use_llm):
+            succeeded += 1
+    return succeeded, attempted
+
+
+async def _run_in_worker(label: str, timeout: float, func, *args, **kwargs):
+    """Run func in a worker thread and wait for it, even past the timeout.
+
+    The thread cannot be cancelled, so callers holding the summarizer
+    semaphore must keep it until the thread is done; otherwise timed-out
+    work would pile up beyond MAX_CONCURRENT_SUMMARIZERS.
+
+    Raises:
+        asyncio.TimeoutError: Once the thread finishes, if it overran timeout.
+    """
+    worker = asyncio.ensure_future(run_in_threadpool(func, *args, **kwargs))
     try:
-        cmd = [sys.executable, str(SUMMARIZER_SCRIPT), session_id]
-        if not use_llm:
-            cmd.append("--no-llm")
+        return await asyncio.wait_for(asyncio.shield(worker), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"{label} timed out after {timeout}s; waiting for its thread to finish")
+        await asyncio.wait({worker})
+        if not worker.cancelled() and worker.exception() is not None:
+            logger.error(f"{label} failed after timing out: {worker.exception()}")
+        raise
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-        if result.returncode != 0:
-            logger.error(f"Summarizer failed for {session_id}: {result.stderr}")
-        else:
-            logger.info(f"Summarized session {session_id}")
-    except Exception as e:
-        logger.error(f"Error running summarizer for {session_id}: {e}")
+
+async def _run_summarizer(session_id: str, use_llm: bool = True):
+    """Background task to summarize a session in a worker thread."""
+    async with _get_summarizer_semaphore():
+        try:
+            summarizer = await run_in_threadpool(_load_summarizer)
+            success = await _run_in_worker(
+                f"Summarizer for {session_id}", SUMMARIZE_TIMEOUT_SECONDS,
+                summarizer.summarize_session, session_id, use_llm=use_llm
+            )
+            if not success:
+                logger.error(f"Summarizer failed for {session_id}")
+            else:
+                logger.info(f"Summarized session {session_id}")
+        except asyncio.TimeoutError:
+            pass  # Logged by _run_in_worker
+        except Exception as e:
+            logger.error(f"Error running summarizer for {session_id}: {e}")
 
 
 @router.post("/sessions/{session_id}/summarize")
@@ -283,25 +426,20 @@ async def trigger_batch_summarize(
         {"status": "queued", "count": N}
     """
     try:
-        cmd = [
-            sys.executable, str(SUMMARIZER_SCRIPT),
-            "--batch",
-            "--older-than", f"{older_than_hours}h",
-            "--limit", str(limit)
-        ]
-        if not use_llm:
-            cmd.append("--no-llm")
-
         # Run in background
-        def run_batch():
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-                if result.returncode != 0:
-                    logger.error(f"Batch summarizer failed: {result.stderr}")
-                else:
-                    logger.info(f"Batch summarization completed: {result.stdout}")
-            except Exception as e:
-                logger.error(f"Batch summarizer error: {e}")
+        async def run_batch():
+            async with _get_summarizer_semaphore():
+                try:
+                    deadline = time.monotonic() + SUMMARIZE_BATCH_TIMEOUT_SECONDS
+                    succeeded, attempted = await _run_in_worker(
+                        "Batch summarizer", SUMMARIZE_BATCH_TIMEOUT_SECONDS,
+                        _summarize_batch, older_than_hours, limit, use_llm, deadline
+                    )
+                    logger.info(f"Batch summarization completed: {succeeded}/{attempted} sessions")
+                except asyncio.TimeoutError:
+                    pass  # Logged by _run_in_worker
+                except Exception as e:
+                    logger.error(f"Batch summarizer error: {e}")
 
         background_tasks.add_task(run_batch)
 
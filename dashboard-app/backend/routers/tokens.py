@@ -2,29 +2,39 @@
 Tokens Router - Token accounting, usage tracking, cost analysis, and alerts.
 """
 
-import json
+import asyncio
+import glob
 import logging
+import os
+import re
 import threading
-import time
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, Callable, Iterator, List, Dict, Any, Literal, NamedTuple, Tuple
 
-from fastapi import APIRouter, Query, HTTPException
+import orjson
+from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from utils import get_db, dict_from_row
+from utils.http_cache import make_etag, not_modified, etag_response
+
+try:
+    # Installed with uvicorn[standard]; without it every sync stat()s all transcripts
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/tokens", tags=["tokens"])
+router = APIRouter(prefix="/api/tokens", tags=["tokens"], default_response_class=ORJSONResponse)
 
-# Cache TTL in seconds (5 minutes)
-_CACHE_TTL = 300
-_cache_timestamp: float = 0
 _cache_lock = threading.Lock()  # Thread-safe cache access
+_tables_lock = threading.Lock()
+_tables_ready = False
 
 CLAUDE_PROJECTS_PATH = Path.home() / ".claude" / "projects"
 
@@ -37,10 +47,38 @@ CLAUDE_PROJECTS_PATH = Path.home() / ".claude" / "projects"
 # sessions are rare and the performance cost of reading more would be prohibitive.
 JSONL_TAIL_LINES = 200  # Balance: large enough to find usage, small enough for memory efficiency
 
-# Whitelist of allowed fields for alert updates (SQL injection protection).
-# Defense-in-depth: Pydantic validates field types/values at the model layer,
-# this whitelist validates field names before SQL construction.
-ALERT_UPDATE_ALLOWED_FIELDS = {"alert_type", "threshold_value", "threshold_unit", "time_window", "is_enabled"}
+# Initial bytes read from the end of each JSONL file; typically covers
+# JSONL_TAIL_LINES in a single read.
+TAIL_READ_BYTES = 64 * 1024
+
+# Changed JSONL files parsed concurrently during a sync. Tail reads are
+# I/O-bound, so this scales with cores rather than matching them; the pool
+# is private to the sync, not FastAPI's shared threadpool.
+PARSE_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Cached response bodies kept before the cache is reset. Each distinct
+# query (endpoint, page, day window) at the current sync state is one entry.
+PAYLOAD_CACHE_MAX_ENTRIES = 256
+
+# Watcher batching window (ms). A change is visible to syncs at most this
+# long (plus the notification step) after it is written.
+WATCH_DEBOUNCE_MS = 200
+
+# Watcher wakes at least this often (ms), which is also how soon after
+# startup it starts vouching for unchanged fingerprints
+WATCH_TIMEOUT_MS = 1000
+
+# Fixed statement so SQLite's statement cache reuses one plan for every
+# partial update; a NULL parameter leaves that column unchanged
+_UPDATE_ALERT = """
+    UPDATE token_alerts SET
+        alert_type = COALESCE(?, alert_type),
+        threshold_value = COALESCE(?, threshold_value),
+        threshold_unit = COALESCE(?, threshold_unit),
+        time_window = COALESCE(?, time_window),
+        is_enabled = COALESCE(?, is_enabled)
+    WHERE id = ?
+"""
 
 
 class TokenAlertCreate(BaseModel):
@@ -59,23 +97,25 @@ class TokenAlertUpdate(BaseModel):
     is_enabled: Optional[bool] = None
 
 
-@lru_cache(maxsize=None)
 def ensure_tables_exist():
     """Ensure token tables exist - only runs once per application lifecycle.
 
-    Uses @lru_cache for thread-safe one-time initialization. While lru_cache
-    isn't atomic, CREATE TABLE IF NOT EXISTS is idempotent, so concurrent
-    calls during initial startup are harmless.
-
-    Note: token_metrics table is provisioned for future persistent storage.
-    Currently, token data is computed from JSONL files and cached in memory.
-    The table is NOT populated in this sprint - this is intentional.
+    Guarded by _tables_ready under _tables_lock, so later calls return
+    without touching the database.
 
-    Future enhancement (separate sprint):
-    - Add source='historical' when populating from JSONL files
-    - Add source='realtime' for webhook-based live capture
-    - Migrate endpoints to query DB instead of in-memory cache
+    token_metrics holds one row per (session, model) ingested from JSONL
+    files (source='historical'), and token_files records the (mtime_ns, size)
+    each file was ingested at so unchanged files are skipped - also across
+    restarts. source='realtime' is reserved for webhook-based live capture.
     """
+    global _tables_ready
+    with _tables_lock:
+        if not _tables_ready:
+            _create_tables()
+            _tables_ready = True
+
+
+def _create_tables() -> None:
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute("""
@@ -91,7 +131,19 @@ def ensure_tables_exist():
                 web_search_requests INTEGER DEFAULT 0,
                 cost_usd REAL DEFAULT 0.0,
                 source TEXT NOT NULL CHECK(source IN ('realtime', 'historical')),
-                captured_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                captured_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                source_file TEXT
+            )
+        """)
+        # Tables created before JSONL ingestion lack source_file
+        columns = {r[1] for r in cursor.execute("PRAGMA table_info(token_metrics)")}
+        if "source_file" not in columns:
+            cursor.execute("ALTER TABLE token_metrics ADD COLUMN source_file TEXT")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS token_files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
             )
         """)
         cursor.execute("""
@@ -107,150 +159,282 @@ def ensure_tables_exist():
             )
         """)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_token_metrics_session ON token_metrics(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_token_metrics_model ON token_metrics(model)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_token_metrics_captured ON token_metrics(captured_at)")
+        # Covering indexes: the per-model and per-project aggregates read the
+        # numeric columns from these packed, pre-grouped copies and never
+        # touch the table rows. They supersede the narrower indexes dropped here.
+        for old_index in ("idx_token_metrics_model", "idx_token_metrics_model_captured",
+                          "idx_token_metrics_project_captured"):
+            cursor.execute(f"DROP INDEX IF EXISTS {old_index}")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_token_metrics_model_sums ON token_metrics(
+                model, captured_at, input_tokens, output_tokens, cache_read_tokens,
+                cache_creation_tokens, web_search_requests, cost_usd)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_token_metrics_project_sums ON token_metrics(
+                project_path, captured_at, model, input_tokens, output_tokens, cache_read_tokens,
+                cache_creation_tokens, web_search_requests, cost_usd)
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_token_metrics_source_file ON token_metrics(source_file)")
+        # list_alerts pages newest-first, optionally by is_enabled; rowid (id)
+        # trails each index entry, so both orderings come straight off an index
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_token_alerts_created ON token_alerts(created_at)")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_token_alerts_enabled_created ON token_alerts(is_enabled, created_at)
+        """)
+        for name, select in _TOKEN_VIEWS.items():
+            cursor.execute(f"DROP VIEW IF EXISTS {name}")
+            cursor.execute(f"CREATE VIEW {name} AS {select}")
         conn.commit()
         logger.info("Token tables initialized")
 
 
 def init_tokens_router():
-    """Initialize the tokens router - call at application startup."""
+    """Initialize the tokens router - call at application startup.
+
+    Endpoints rely on the tables created here rather than checking per request.
+    """
     ensure_tables_exist()
 
 
-def read_last_lines(filepath: Path, num_lines: int = JSONL_TAIL_LINES) -> List[str]:
-    """Read last N lines from file without loading entire file into memory."""
-    lines = []
+def _pread(f, size: int, offset: int) -> bytes:
+    """Read size bytes at offset: one pread() syscall where available."""
+    if hasattr(os, "pread"):
+        return os.pread(f.fileno(), size, offset)
+    f.seek(offset)  # Windows has no pread
+    return f.read(size)
+
+
+def iter_last_lines(filepath: Path, num_lines: int = JSONL_TAIL_LINES,
+                    needle: Optional[bytes] = None) -> Iterator[bytes]:
+    """Yield the last N non-empty lines of a file, newest first.
+
+    Reads TAIL_READ_BYTES windows backwards from the end, so a caller that
+    stops at the first useful line usually costs a single read. Each window
+    is one positional read into an unbuffered file, and lines are located
+    by offset within it rather than by slicing or splitting the window.
+    Lines are raw bytes; orjson parses them without a separate decode step.
+
+    With needle set, only lines containing it are yielded (all lines still
+    count towards num_lines), and a window without it is skipped after one
+    substring scan.
+    """
     try:
-        with open(filepath, 'rb') as f:
-            # Seek to end
-            f.seek(0, 2)
-            file_size = f.tell()
-            if file_size == 0:
-                return []
-
-            # Read chunks from end
-            chunk_size = 8192
-            remaining = file_size
-            buffer = b''
-
-            while remaining > 0 and len(lines) < num_lines:
-                read_size = min(chunk_size, remaining)
-                remaining -= read_size
-                f.seek(remaining)
-                chunk = f.read(read_size)
-                buffer = chunk + buffer
-
-                # Split into lines
-                split_lines = buffer.split(b'\n')
-                if remaining > 0:
-                    # Keep incomplete first line in buffer
-                    buffer = split_lines[0]
-                    lines = [l.decode('utf-8') for l in split_lines[1:] if l] + lines
-                else:
-                    lines = [l.decode('utf-8') for l in split_lines if l] + lines
+        with open(filepath, 'rb', buffering=0) as f:
+            boundary = os.fstat(f.fileno()).st_size  # Lines from here on are done
+
+            window = TAIL_READ_BYTES
+            remaining = num_lines
+            while boundary > 0:
+                start = max(0, boundary - window)
+                data = _pread(f, boundary - start, start)
+                # First line is cut off by the window boundary; it is re-read
+                # whole with the next window
+                lo = data.find(b'\n') + 1 if start > 0 else 0
+                if start > 0 and lo == 0:
+                    window *= 4
+                    continue
 
-            return lines[-num_lines:]
-    except (OSError, UnicodeDecodeError) as e:
+                if needle is not None and data.find(needle, lo) == -1:
+                    segments = data.split(b'\n')
+                    remaining -= sum(1 for line in segments[1 if start > 0 else 0:] if line)
+                    if remaining <= 0:
+                        return
+                else:
+                    end = len(data)
+                    while end > lo:
+                        newline = data.rfind(b'\n', lo, end)
+                        line_start = newline + 1 if newline != -1 else lo
+                        if line_start < end:
+                            line = data[line_start:end]
+                            if needle is None or needle in line:
+                                yield line
+                            remaining -= 1
+                            if remaining == 0:
+                                return
+                        end = line_start - 1
+
+                boundary = start + lo
+                window *= 4
+    except OSError as e:
         logger.warning(f"Error reading last lines from {filepath}: {type(e).__name__}: {e}")
-        return []
 
 
-def parse_jsonl_for_tokens(project_dir: Path) -> List[Dict[str, Any]]:
-    """Parse JSONL files for token usage data.
+class TokenRecord(NamedTuple):
+    """One model's cumulative usage in a session, in token_metrics column order."""
+    session_id: str
+    project_path: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    cache_read_tokens: int
+    cache_creation_tokens: int
+    web_search_requests: int
+    cost_usd: float
+    captured_at: Optional[str]
+
+
+# Key of the cumulative usage entry; quoted so escaped mentions inside
+# message text do not match
+_USAGE_NEEDLE = b'"lastModelUsage"'
+
 
-    Claude Code JSONL logs contain cumulative token usage in the 'lastModelUsage'
-    field. The most recent entry with this field contains the final totals for
-    the session, so we only need to find and process that one entry per file.
+def _parse_jsonl_file(jsonl_file: Path, project_dir: Path) -> Tuple[TokenRecord, ...]:
+    """Extract token usage records from the tail of a single JSONL file.
 
-    We scan backwards from the end of the file to find the first valid entry
-    with 'lastModelUsage', skipping empty lines and entries without usage data.
+    One record per model of the newest lastModelUsage entry; a file holds a
+    single session, so the result is a fixed tuple rather than a growing list.
     """
-    records = []
-    if not project_dir.exists():
-        return records
+    # Newest first, so the first valid entry is the one we want; only lines
+    # mentioning the key are yielded and parsed at all
+    for line in iter_last_lines(jsonl_file, num_lines=JSONL_TAIL_LINES, needle=_USAGE_NEEDLE):
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        if "lastModelUsage" not in data:
+            continue
+
+        # Found valid entry with cumulative usage - extract data
+        session_id = data.get("sessionId", jsonl_file.stem)
+        model_usage = data.get("lastModelUsage", {})
+        captured_at = _to_utc_text(data.get("timestamp"))
+        project_path = str(project_dir)
+
+        # Only need the most recent entry (cumulative totals)
+        return tuple(
+            TokenRecord(
+                session_id, project_path, model,
+                usage.get("inputTokens", 0),
+                usage.get("outputTokens", 0),
+                usage.get("cacheReadInputTokens", 0),
+                usage.get("cacheCreationInputTokens", 0),
+                usage.get("webSearchRequests", 0),
+                usage.get("costUSD", 0.0),
+                captured_at,
+            )
+            for model, usage in model_usage.items()
+        )
+
+    logger.debug(f"No token usage found in last {JSONL_TAIL_LINES} lines of {jsonl_file}")
+    return ()
 
-    for jsonl_file in project_dir.glob("*.jsonl"):
+
+def _parse_jsonl_path(path: str) -> Tuple[TokenRecord, ...]:
+    """Parse one JSONL file by path, logging (not raising) malformed usage data."""
+    jsonl_file = Path(path)
+    try:
+        return _parse_jsonl_file(jsonl_file, jsonl_file.parent)
+    except (OSError, KeyError, TypeError) as e:
+        logger.warning(f"Error parsing {jsonl_file}: {type(e).__name__}: {e}")
+        return ()
+
+
+def _jsonl_fingerprint(project_dir: Optional[Path] = None) -> Tuple[Tuple[str, int, int], ...]:
+    """Fingerprint project JSONL files by (path, mtime_ns, size).
+
+    Covers every project, or only project_dir when given. Costs one stat()
+    per file, which is far cheaper than re-reading them. Walks with
+    os.scandir rather than glob + Path.stat so no Path is built per file;
+    the paths are the same as Path.glob("*/*.jsonl") yields.
+    """
+    if project_dir:
+        directories = [str(project_dir)]
+    else:
         try:
-            lines = read_last_lines(jsonl_file, num_lines=JSONL_TAIL_LINES)
-            if not lines:
-                continue
+            with os.scandir(CLAUDE_PROJECTS_PATH) as it:
+                directories = [d.path for d in it if d.is_dir()]
+        except OSError:
+            return ()
 
-            found_usage = False
-            # Scan backwards through lines to find the most recent entry with usage data
-            for line in reversed(lines):
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if "lastModelUsage" not in data:
-                    continue
+    entries = []
+    for directory in directories:
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(".jsonl"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            continue
+    return tuple(sorted(entries))
+
+
+# Fingerprint of the JSONL files as of the last successful sync, keyed by
+# project directory name (None = all projects)
+_synced_fingerprints: Dict[Optional[str], Tuple[Tuple[str, int, int], ...]] = {}
+
+# Bumped by token_watcher_loop() for every batch of JSONL changes. While the
+# watcher runs, a fingerprint synced at the current generation is known to
+# be current and the stat() scan is skipped.
+_change_generation = 0
+_synced_generations: Dict[Optional[str], int] = {}
+_watcher_active = False
+
+# Set by stop_token_watcher(); the watch thread polls it, so it must be set
+# before shutdown or the thread outlives the interpreter
+_watcher_stop: Optional[asyncio.Event] = None
+_watcher_task: Optional[asyncio.Task] = None
+
+# Serialized response bodies keyed by ETag (see _cached_response)
+_payload_cache: Dict[str, bytes] = {}
+
+# Fixed-width UTC text so captured_at compares correctly as a string
+_UTC_TEXT_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+# The millisecond UTC form Claude Code writes; already captured_at text
+# once padded to microseconds, so it skips datetime parsing entirely
+_FIXED_UTC_TS = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}Z")
+
+_INSERT_TOKEN_METRIC = """
+    INSERT INTO token_metrics (session_id, project_path, model, input_tokens, output_tokens,
+                               cache_read_tokens, cache_creation_tokens, web_search_requests,
+                               cost_usd, source, captured_at, source_file)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'historical', ?, ?)
+"""
+
+# Aggregate columns shared by the summary endpoints. session_count counts
+# (session, model) rows, matching the per-record counts reported before.
+_TOKEN_SUMS = """
+    COALESCE(SUM(input_tokens), 0) AS input_tokens,
+    COALESCE(SUM(output_tokens), 0) AS output_tokens,
+    COALESCE(SUM(cache_read_tokens), 0) AS cache_read_tokens,
+    COALESCE(SUM(cache_creation_tokens), 0) AS cache_creation_tokens,
+    COALESCE(SUM(web_search_requests), 0) AS web_searches,
+    TOTAL(cost_usd) AS cost_usd,
+    COUNT(*) AS session_count
+"""
 
-                # Found valid entry with cumulative usage - extract data
-                session_id = data.get("sessionId", jsonl_file.stem)
-                model_usage = data.get("lastModelUsage", {})
-                timestamp = data.get("timestamp")
-
-                for model, usage in model_usage.items():
-                    records.append({
-                        "session_id": session_id,
-                        "project_path": str(project_dir),
-                        "model": model,
-                        "input_tokens": usage.get("inputTokens", 0),
-                        "output_tokens": usage.get("outputTokens", 0),
-                        "cache_read_tokens": usage.get("cacheReadInputTokens", 0),
-                        "cache_creation_tokens": usage.get("cacheCreationInputTokens", 0),
-                        "web_search_requests": usage.get("webSearchRequests", 0),
-                        "cost_usd": usage.get("costUSD", 0.0),
-                        "timestamp": timestamp
-                    })
-                found_usage = True
-                break  # Only need the most recent entry (cumulative totals)
-
-            if not found_usage:
-                logger.debug(f"No token usage found in last {JSONL_TAIL_LINES} lines of {jsonl_file}")
-
-        except (OSError, KeyError, TypeError) as e:
-            logger.warning(f"Error parsing {jsonl_file}: {type(e).__name__}: {e}")
-    return records
-
-
-# Module-level cache for token usage data
-_usage_cache: Optional[Dict[str, Any]] = None
-
-
-def aggregate_sessions_by_model(sessions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-    """Aggregate session data by model. Reusable helper to avoid DRY violations."""
-    by_model: Dict[str, Dict[str, Any]] = defaultdict(
-        lambda: {"input_tokens": 0, "output_tokens": 0, "cache_read_tokens": 0,
-                 "cache_creation_tokens": 0, "web_searches": 0, "cost_usd": 0.0, "session_count": 0}
-    )
-    for s in sessions:
-        model = s["model"]
-        by_model[model]["input_tokens"] += s["input_tokens"]
-        by_model[model]["output_tokens"] += s["output_tokens"]
-        by_model[model]["cache_read_tokens"] += s["cache_read_tokens"]
-        by_model[model]["cache_creation_tokens"] += s["cache_creation_tokens"]
-        by_model[model]["web_searches"] += s["web_search_requests"]
-        by_model[model]["cost_usd"] += s["cost_usd"]
-        by_model[model]["session_count"] += 1
-    return dict(by_model)
-
-
-def aggregate_totals(sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Aggregate total token counts across all sessions. Reusable helper for DRY."""
-    total = {"input_tokens": 0, "output_tokens": 0, "cache_read_tokens": 0,
-             "cache_creation_tokens": 0, "web_searches": 0, "cost_usd": 0.0}
-    for s in sessions:
-        total["input_tokens"] += s["input_tokens"]
-        total["output_tokens"] += s["output_tokens"]
-        total["cache_read_tokens"] += s["cache_read_tokens"]
-        total["cache_creation_tokens"] += s["cache_creation_tokens"]
-        total["web_searches"] += s["web_search_requests"]
-        total["cost_usd"] += s["cost_usd"]
-    return total
+
+# Per-model and per-project breakdowns with their derived and rounded
+# fields computed by SQLite. Recreated at startup so definition changes apply.
+_TOKEN_VIEWS = {
+    "token_model_stats": f"""
+        SELECT model, input_tokens, output_tokens,
+               input_tokens + output_tokens AS total_tokens,
+               cache_read_tokens, cache_creation_tokens,
+               CASE WHEN input_tokens > 0
+                    THEN ROUND(100.0 * cache_read_tokens / input_tokens, 1) ELSE 0.0
+               END AS cache_efficiency_percent,
+               web_searches,
+               ROUND(cost_usd, 4) AS cost_usd,
+               session_count,
+               ROUND(cost_usd / session_count, 4) AS avg_cost_per_session
+        FROM (SELECT model, {_TOKEN_SUMS} FROM token_metrics GROUP BY model)
+    """,
+    "token_project_stats": f"""
+        SELECT project_path, input_tokens, output_tokens,
+               input_tokens + output_tokens AS total_tokens,
+               ROUND(cost_usd, 4) AS cost_usd,
+               session_count
+        FROM (SELECT project_path, {_TOKEN_SUMS} FROM token_metrics GROUP BY project_path)
+    """,
+}
 
 
 def parse_timestamp(ts: Optional[str]) -> Optional[datetime]:
@@ -273,162 +457,348 @@ def parse_timestamp(ts: Optional[str]) -> Optional[datetime]:
         return None
 
 
-def compute_token_usage() -> Dict[str, Any]:
-    """Compute token usage from JSONL files.
+def _to_utc_text(ts: Optional[str]) -> Optional[str]:
+    """Normalize an ISO 8601 timestamp to UTC text for captured_at (naive = UTC)."""
+    if ts and _FIXED_UTC_TS.fullmatch(ts):
+        return ts[:23] + "000"
+    dt = parse_timestamp(ts)
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime(_UTC_TEXT_FORMAT)
+
+
+def _project_dir(project: str) -> Optional[Path]:
+    """Resolve a project directory name under CLAUDE_PROJECTS_PATH (None if not a plain name)."""
+    if project in (".", "..") or Path(project).name != project:
+        return None
+    return CLAUDE_PROJECTS_PATH / project
 
-    Returns a dict with total, by_model, by_project, sessions list, and
-    sessions_by_id dict for O(1) session lookups.
+
+def _ingest_files(cursor, current: Dict[str, Tuple[int, int]], changed: List[str], removed: List[str]) -> None:
+    """Replace token_metrics rows for changed files and drop rows for removed ones.
+
+    current maps each changed path to its (mtime_ns, size) fingerprint.
+    Caller holds _cache_lock and commits.
     """
-    if not CLAUDE_PROJECTS_PATH.exists():
-        return {
-            "total": {"input_tokens": 0, "output_tokens": 0, "cache_read_tokens": 0,
-                      "cache_creation_tokens": 0, "web_searches": 0, "cost_usd": 0.0},
-            "by_model": {},
-            "by_project": {},
-            "sessions": [],
-            "sessions_by_id": {}
-        }
-
-    all_records = []
-    for project_dir in CLAUDE_PROJECTS_PATH.iterdir():
-        if project_dir.is_dir():
-            all_records.extend(parse_jsonl_for_tokens(project_dir))
-
-    # Use shared helper for totals (DRY)
-    total = aggregate_totals(all_records)
-
-    by_project: Dict[str, Dict[str, Any]] = defaultdict(
-        lambda: {"input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0, "session_count": 0}
-    )
-
-    # Build sessions_by_id for O(1) lookups and aggregate by_project
-    sessions_by_id: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-
-    for record in all_records:
-        project = record["project_path"]
-        by_project[project]["input_tokens"] += record["input_tokens"]
-        by_project[project]["output_tokens"] += record["output_tokens"]
-        by_project[project]["cost_usd"] += record["cost_usd"]
-        by_project[project]["session_count"] += 1
-
-        # Index by session_id for O(1) lookups
-        sessions_by_id[record["session_id"]].append(record)
-
-    # Use shared helper for model aggregation
-    by_model = aggregate_sessions_by_model(all_records)
-
-    return {
-        "total": total,
-        "by_model": by_model,
-        "by_project": dict(by_project),
-        "sessions": all_records,
-        "sessions_by_id": dict(sessions_by_id)
-    }
-
-
-def get_all_token_usage() -> Dict[str, Any]:
-    """Get token usage with TTL-based caching to avoid repeated file parsing."""
-    global _usage_cache, _cache_timestamp
+    # File reads dominate, so overlap them
+    with ThreadPoolExecutor(max_workers=PARSE_MAX_WORKERS) as pool:
+        parsed = list(pool.map(_parse_jsonl_path, changed))
+
+    cursor.executemany("DELETE FROM token_metrics WHERE source_file = ?",
+                       [(path,) for path in changed + removed])
+    cursor.executemany("DELETE FROM token_files WHERE path = ?", [(path,) for path in removed])
+    # Streamed straight from the per-file tuples; no flattened copy
+    cursor.executemany(_INSERT_TOKEN_METRIC, (
+        (*r, path)
+        for path, records in zip(changed, parsed)
+        for r in records
+    ))
+    cursor.executemany("INSERT OR REPLACE INTO token_files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                       [(path, *current[path]) for path in changed])
+
+
+def _sync_session_file_sync(session_id: str) -> bool:
+    """Ingest only the transcript named <session_id>.jsonl, if it changed.
+
+    Returns False when no such file exists (or the id is not a plain file
+    name), so the caller can fall back to a full sync.
+    """
+    if session_id in (".", "..") or Path(session_id).name != session_id:
+        return False
 
     with _cache_lock:
-        current_time = time.time()
-        if _usage_cache is None or (current_time - _cache_timestamp) > _CACHE_TTL:
-            _usage_cache = compute_token_usage()
-            _cache_timestamp = current_time
+        current = {}
+        for jsonl_file in CLAUDE_PROJECTS_PATH.glob(f"*/{glob.escape(session_id)}.jsonl"):
+            try:
+                stat = jsonl_file.stat()
+            except OSError:
+                continue
+            current[str(jsonl_file)] = (stat.st_mtime_ns, stat.st_size)
+        if not current:
+            return False
+
+        with get_db() as conn:
+            cursor = conn.cursor()
+            changed = []
+            for path, key in current.items():
+                cursor.execute("SELECT mtime_ns, size FROM token_files WHERE path = ?", (path,))
+                row = cursor.fetchone()
+                if row is None or tuple(row) != key:
+                    changed.append(path)
+            if changed:
+                _ingest_files(cursor, current, changed, [])
+                conn.commit()
+    return True
+
+
+def _is_current(project: Optional[str], generation: int) -> bool:
+    """Whether the watcher vouches that project's last sync is still current."""
+    return _watcher_active and project in _synced_fingerprints and _synced_generations.get(project) == generation
+
+
+def _sync_token_metrics_sync(project: Optional[str] = None) -> None:
+    """Ingest new or changed JSONL files into token_metrics.
+
+    Files are compared against token_files by (mtime_ns, size): only changed
+    files are re-parsed and have their rows replaced, and rows for deleted
+    files are removed. Costs one stat() per file when nothing changed.
+    With project set, only that project's directory is scanned.
+    """
+    project_dir = None
+    if project:
+        project_dir = _project_dir(project)
+        if project_dir is None:
+            return
+
+    # Double-checked: the common already-current case reads the module state
+    # without the lock (single reads are atomic under the GIL), so
+    # concurrent polling requests do not queue behind each other or an ingest
+    if _is_current(project, _change_generation):
+        return
+
+    with _cache_lock:
+        generation = _change_generation
+        if _is_current(project, generation):
+            return
+
+        fingerprint = _jsonl_fingerprint(project_dir)
+        if project in _synced_fingerprints and fingerprint == _synced_fingerprints[project]:
+            _synced_generations[project] = generation
+            return
+
+        current = {path: (mtime_ns, size) for path, mtime_ns, size in fingerprint}
+        with get_db() as conn:
+            cursor = conn.cursor()
+            if project_dir:
+                # Exact, case-sensitive prefix match on the project directory
+                prefix = os.path.join(str(project_dir), "")
+                cursor.execute("SELECT path, mtime_ns, size FROM token_files WHERE substr(path, 1, ?) = ?",
+                               (len(prefix), prefix))
+            else:
+                cursor.execute("SELECT path, mtime_ns, size FROM token_files")
+            ingested = {r[0]: (r[1], r[2]) for r in cursor.fetchall()}
+
+            changed = [path for path, key in current.items() if ingested.get(path) != key]
+            removed = [path for path in ingested if path not in current]
+
+            _ingest_files(cursor, current, changed, removed)
+            conn.commit()
+
+            if changed or removed:
+                logger.info(f"Token metrics synced: {len(changed)} file(s) ingested, {len(removed)} removed")
+
+        # Only remember existing projects so arbitrary ?project= values
+        # cannot grow the dict
+        if project_dir is None or project_dir.is_dir():
+            _synced_fingerprints[project] = fingerprint
+            _synced_generations[project] = generation
+
+
+async def sync_token_metrics(project: Optional[str] = None):
+    """Bring token_metrics up to date without blocking the event loop."""
+    await run_in_threadpool(_sync_token_metrics_sync, project)
+
+
+def _is_jsonl_change(change, path: str) -> bool:
+    return path.endswith(".jsonl")
+
+
+async def token_watcher_loop():
+    """Track transcript changes with filesystem notifications (inotify on Linux).
 
-        return _usage_cache
+    Lets syncs skip the per-file stat() scan until something actually
+    changes. Falls back to scanning on every sync if watchfiles is missing,
+    the projects directory does not exist, or the watcher fails.
+    """
+    global _change_generation, _watcher_active, _watcher_stop, _watcher_task
+
+    if awatch is None:
+        logger.info("watchfiles not installed; token syncs will scan transcripts on every request")
+        return
+    if not CLAUDE_PROJECTS_PATH.is_dir():
+        logger.info(f"{CLAUDE_PROJECTS_PATH} does not exist; not watching for token changes")
+        return
+
+    # watchfiles logs every change batch at INFO
+    logging.getLogger("watchfiles").setLevel(logging.WARNING)
+
+    # Created here so it binds to the running loop (Python 3.8)
+    _watcher_stop = asyncio.Event()
+    _watcher_task = asyncio.current_task()
+
+    try:
+        # yield_on_timeout gives an empty batch once the watch is registered
+        # and then every WATCH_TIMEOUT_MS
+        async for changes in awatch(CLAUDE_PROJECTS_PATH, watch_filter=_is_jsonl_change,
+                                    debounce=WATCH_DEBOUNCE_MS, rust_timeout=WATCH_TIMEOUT_MS,
+                                    yield_on_timeout=True, stop_event=_watcher_stop):
+            if changes or not _watcher_active:
+                # Also invalidates fingerprints taken before the watch existed
+                _change_generation += 1
+                _watcher_active = True
+                await _warm_token_metrics()
+    except Exception as e:
+        logger.warning(f"Token file watcher stopped: {type(e).__name__}: {e}")
+    finally:
+        _watcher_active = False
+
+
+async def _warm_token_metrics():
+    """Re-sync everything requests have synced before, off the request path.
+
+    Runs after each change batch so polling requests find their generation
+    current and return from the fast path instead of paying for the ingest.
+    A request arriving mid-sync waits on _cache_lock and then hits that
+    same fast path.
+    """
+    # The full sync first: it ingests every changed file, leaving the
+    # per-project syncs only their directory's stat() scan
+    for project in sorted(_synced_fingerprints, key=lambda p: p is not None):
+        try:
+            await sync_token_metrics(project)
+        except Exception as e:
+            logger.warning(f"Background token sync failed for {project or 'all projects'}: {e}")
+
+
+async def stop_token_watcher():
+    """Stop token_watcher_loop() and wait for its watch thread to exit."""
+    if _watcher_stop is None or _watcher_task is None:
+        return
+    _watcher_stop.set()
+    await asyncio.wait({_watcher_task}, timeout=WATCH_TIMEOUT_MS / 1000 + 1)
+
+
+def _metrics_etag(project: Optional[str], *params: Any) -> Optional[str]:
+    """ETag for a token_metrics query, from the fingerprint of the last sync.
+
+    None when the project has no recorded fingerprint (e.g. unknown project).
+    """
+    fingerprint = _synced_fingerprints.get(project)
+    if fingerprint is None:
+        return None
+    return make_etag(fingerprint, project, *params)
+
+
+def _cached_response(request: Request, project: Optional[str], params: Tuple, build: Callable[[], Dict[str, Any]]):
+    """Serve a token_metrics-derived body, built at most once per sync state.
+
+    Bodies are serialized once and kept under their ETag, which changes
+    whenever the synced files do, so repeat requests cost a dict lookup (or a
+    304). Without a fingerprint (unknown project) the body is built fresh.
+    """
+    etag = _metrics_etag(project, *params)
+    if etag is None:
+        return build()
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    body = _payload_cache.get(etag)
+    if body is None:
+        body = orjson.dumps(build())
+        # Superseded entries are never read again; start over when full
+        if len(_payload_cache) >= PAYLOAD_CACHE_MAX_ENTRIES:
+            _payload_cache.clear()
+        _payload_cache[etag] = body
+    return etag_response(body, etag)
 
 
 def invalidate_token_cache():
-    """Invalidate the token usage cache (call after new data is added)."""
-    global _usage_cache, _cache_timestamp
+    """Force the next request to re-check JSONL files against token_files."""
     with _cache_lock:
-        _usage_cache = None
-        _cache_timestamp = 0
+        _synced_fingerprints.clear()
+        _synced_generations.clear()
+        _payload_cache.clear()
 
 
 @router.get("/current")
-async def get_current_session_tokens(session_id: Optional[str] = Query(None)):
+def get_current_session_tokens(session_id: Optional[str] = Query(None)):
     """Get token usage for current or specified session."""
-    ensure_tables_exist()
-    # Note: get_all_token_usage() uses TTL-based caching (5 min) to avoid
-    # repeated file parsing. For single-session lookups, caching provides
-    # adequate performance. Future optimization could add session-specific queries.
-    usage_data = get_all_token_usage()
-
-    if not usage_data["sessions"]:
-        return {"session_id": None, "project_path": None, "models": {}, "total_input_tokens": 0,
-                "total_output_tokens": 0, "total_cost_usd": 0.0}
-
-    if session_id:
-        # O(1) lookup using sessions_by_id dict
-        session_records = usage_data["sessions_by_id"].get(session_id, [])
-    else:
-        # Find latest session by timestamp using max() O(N) instead of sort O(N log N)
-        # Filter to sessions with parseable timestamps for proper chronological comparison
-        # Walrus operator (:=) parses timestamp and assigns to 'dt' in one expression,
-        # then filters out None results - avoids parsing twice (once to check, once to use)
-        sessions_with_dt = [
-            (s, dt)
-            for s in usage_data["sessions"]
-            if (dt := parse_timestamp(s.get("timestamp"))) is not None
-        ]
-        if sessions_with_dt:
-            latest_session, _ = max(sessions_with_dt, key=lambda x: x[1])
-            latest_session_id = latest_session["session_id"]
-            session_records = usage_data["sessions_by_id"].get(latest_session_id, [])
-        else:
-            # If no sessions have parseable timestamps, we cannot determine the latest one.
-            # Return empty to trigger 404 - better than returning arbitrary session.
-            session_records = []
-
-    if not session_records:
+    # A named session only needs its own transcript; the latest session
+    # needs everything to be current
+    if not session_id or not _sync_session_file_sync(session_id):
+        _sync_token_metrics_sync()
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT 1 FROM token_metrics LIMIT 1")
+        if not cursor.fetchone():
+            return {"session_id": None, "project_path": None, "models": {}, "total_input_tokens": 0,
+                    "total_output_tokens": 0, "total_cost_usd": 0.0}
+
+        if not session_id:
+            # Latest session by timestamp. Rows without a parseable timestamp
+            # have NULL captured_at and are never picked - if none are left we
+            # return 404 rather than an arbitrary session.
+            cursor.execute("""
+                SELECT session_id FROM token_metrics
+                WHERE captured_at IS NOT NULL
+                ORDER BY captured_at DESC
+                LIMIT 1
+            """)
+            row = cursor.fetchone()
+            session_id = row[0] if row else None
+
+        by_model = []
+        if session_id:
+            # One grouped pass in SQL instead of accumulating rows in Python
+            cursor.execute("""
+                SELECT model, MIN(project_path) AS project_path,
+                       SUM(input_tokens) AS input_tokens, SUM(output_tokens) AS output_tokens,
+                       SUM(cache_read_tokens) AS cache_read_tokens,
+                       SUM(cache_creation_tokens) AS cache_creation_tokens,
+                       TOTAL(cost_usd) AS cost_usd
+                FROM token_metrics
+                WHERE session_id = ?
+                GROUP BY model
+                ORDER BY MIN(id)
+            """, (session_id,))
+            by_model = cursor.fetchall()
+
+    if not by_model:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Use defaultdict to avoid if-check on each iteration
-    models: Dict[str, Dict[str, Any]] = defaultdict(
-        lambda: {"input_tokens": 0, "output_tokens": 0,
-                 "cache_read_tokens": 0, "cache_creation_tokens": 0, "cost_usd": 0.0}
-    )
+    # Per-model entries and the session totals in one pass over the rows
+    models = {}
     total_input = total_output = 0
     total_cost = 0.0
+    for r in by_model:
+        models[r["model"]] = {"input_tokens": r["input_tokens"], "output_tokens": r["output_tokens"],
+                              "cache_read_tokens": r["cache_read_tokens"],
+                              "cache_creation_tokens": r["cache_creation_tokens"], "cost_usd": r["cost_usd"]}
+        total_input += r["input_tokens"]
+        total_output += r["output_tokens"]
+        total_cost += r["cost_usd"]
 
-    for record in session_records:
-        model = record["model"]
-        models[model]["input_tokens"] += record["input_tokens"]
-        models[model]["output_tokens"] += record["output_tokens"]
-        models[model]["cache_read_tokens"] += record["cache_read_tokens"]
-        models[model]["cache_creation_tokens"] += record["cache_creation_tokens"]
-        models[model]["cost_usd"] += record["cost_usd"]
-        total_input += record["input_tokens"]
-        total_output += record["output_tokens"]
-        total_cost += record["cost_usd"]
+    return {"session_id": session_id,
+            "project_path": by_model[0]["project_path"],
+            "models": models,
+            "total_input_tokens": total_input,
+            "total_output_tokens": total_output,
+            "total_cost_usd": round(total_cost, 6)}
 
-    return {"session_id": session_records[0]["session_id"],
-            "project_path": session_records[0]["project_path"],
-            "models": dict(models), "total_input_tokens": total_input,
-            "total_output_tokens": total_output, "total_cost_usd": round(total_cost, 6)}
 
-
-def _filter_sessions_by_days(sessions: List[Dict[str, Any]], days: int) -> List[Dict[str, Any]]:
-    """Filter sessions to only include those within the specified number of days.
+def _days_cutoff(days: int) -> Optional[str]:
+    """Return the captured_at lower bound for a look-back window.
 
     Uses UTC timezone-aware datetimes for consistent cross-timezone comparisons.
 
     Args:
-        sessions: List of session records to filter.
         days: Number of days to look back:
-              - days < 0: no time-based filtering, returns all sessions
-              - days = 0: returns sessions from today (since midnight UTC)
-              - days > 0: returns sessions from the last N days
+              - days < 0: no time-based filtering, returns None
+              - days = 0: sessions from today (since midnight UTC)
+              - days > 0: sessions from the last N days
 
     Returns:
-        Filtered list of sessions within the time window, or all sessions if days < 0.
+        Cutoff in captured_at's text format, or None for no filtering.
+        Sessions without timestamps (NULL captured_at) never match a cutoff.
     """
     if days < 0:
-        return sessions
+        return None
 
-    # Use timezone-aware UTC datetime for consistent comparison
     if days == 0:
         # Today only: midnight UTC today
         now = datetime.now(timezone.utc)
@@ -436,134 +806,178 @@ def _filter_sessions_by_days(sessions: List[Dict[str, Any]], days: int) -> List[
     else:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-    filtered = []
-    for s in sessions:
-        session_dt = parse_timestamp(s.get("timestamp"))
-        if session_dt is not None:
-            if session_dt >= cutoff:
-                filtered.append(s)
-        else:
-            # Log sessions with unparseable/missing timestamps for debugging
-            ts = s.get("timestamp")
-            if ts:  # Only log if timestamp exists but failed to parse
-                logger.debug(f"Skipping session {s.get('session_id', 'unknown')}: unparseable timestamp '{ts}'")
-        # Sessions without timestamps are excluded - cannot verify time window
+    return cutoff.strftime(_UTC_TEXT_FORMAT)
 
-    return filtered
 
+_SUMMARY_TOTALS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_creation_tokens",
+                   "web_searches", "cost_usd", "session_count")
 
-@router.get("/summary")
-async def get_token_summary(days: int = Query(30), project: Optional[str] = Query(None)):
-    """Get aggregated token summary across all sessions."""
-    ensure_tables_exist()
-    usage_data = get_all_token_usage()
 
-    # Filter by days first
-    filtered_sessions = _filter_sessions_by_days(usage_data["sessions"], days)
+def _summary_body(days: int, project: Optional[str], cutoff: Optional[str]) -> Dict[str, Any]:
+    conditions = []
+    params: List[Any] = []
 
-    # Then filter by project if specified (match against project directory name)
-    # Use Path().name for cross-platform compatibility (Windows uses backslashes)
+    if cutoff is not None:
+        conditions.append("captured_at >= ?")
+        params.append(cutoff)
+
+    # project is the project directory name under ~/.claude/projects
     if project:
-        filtered_sessions = [s for s in filtered_sessions
-                             if Path(s["project_path"]).name == project]
+        conditions.append("project_path = ?")
+        params.append(str(CLAUDE_PROJECTS_PATH / project))
 
-    # Use shared helpers for aggregation (DRY)
-    total = aggregate_totals(filtered_sessions)
-    by_model = aggregate_sessions_by_model(filtered_sessions)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+        # Single scan; totals accumulate from the per-model rows as they are read
+        cursor.execute(f"SELECT model, {_TOKEN_SUMS} FROM token_metrics {where} GROUP BY model", params)
+        by_model: Dict[str, Dict[str, Any]] = {}
+        totals: Dict[str, Any] = dict.fromkeys(_SUMMARY_TOTALS, 0)
+        totals["cost_usd"] = 0.0
+        for row in cursor:
+            sums = dict_from_row(row)
+            by_model[sums.pop("model")] = sums
+            for key in _SUMMARY_TOTALS:
+                totals[key] += sums[key]
 
     return {"period_days": days,
-            "total_input_tokens": total["input_tokens"],
-            "total_output_tokens": total["output_tokens"],
-            "total_cache_read_tokens": total["cache_read_tokens"],
-            "total_cache_creation_tokens": total["cache_creation_tokens"],
-            "total_web_searches": total["web_searches"],
-            "total_cost_usd": round(total["cost_usd"], 2),
-            "session_count": len(filtered_sessions),
+            "total_input_tokens": totals["input_tokens"],
+            "total_output_tokens": totals["output_tokens"],
+            "total_cache_read_tokens": totals["cache_read_tokens"],
+            "total_cache_creation_tokens": totals["cache_creation_tokens"],
+            "total_web_searches": totals["web_searches"],
+            "total_cost_usd": round(totals["cost_usd"], 2),
+            "session_count": totals["session_count"],
             "model_breakdown": by_model}
 
 
+@router.get("/summary")
+def get_token_summary(request: Request, days: int = Query(30), project: Optional[str] = Query(None)):
+    """Get aggregated token summary across all sessions."""
+    # A project summary only needs that project's files to be current
+    _sync_token_metrics_sync(project)
+
+    cutoff = _days_cutoff(days)
+    # The window's lower bound is keyed at minute resolution, so a record
+    # can outlive the cutoff by up to a minute in a cached response
+    return _cached_response(request, project, ("summary", days, cutoff and cutoff[:16]),
+                            lambda: _summary_body(days, project, cutoff))
+
+
+def _models_body(limit: int, offset: int) -> Dict[str, Any]:
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(DISTINCT model) FROM token_metrics")
+        total_models = cursor.fetchone()[0]
+        cursor.execute("""
+            SELECT * FROM token_model_stats
+            ORDER BY cost_usd DESC, model
+            LIMIT ? OFFSET ?
+        """, (limit, offset))
+        models = [dict_from_row(r) for r in cursor.fetchall()]
+
+    return {"models": models, "total_models": total_models, "offset": offset, "limit": limit}
+
+
 @router.get("/models")
-async def get_model_breakdown():
-    """Get token usage breakdown by model."""
-    ensure_tables_exist()
-    usage_data = get_all_token_usage()
-    models = []
-    for model, data in usage_data["by_model"].items():
-        total_tokens = data["input_tokens"] + data["output_tokens"]
-        # Check before division to avoid division by zero
-        if data["input_tokens"] > 0:
-            cache_efficiency = (data["cache_read_tokens"] / data["input_tokens"]) * 100
-        else:
-            cache_efficiency = 0.0
-        if data["session_count"] > 0:
-            avg_cost = data["cost_usd"] / data["session_count"]
-        else:
-            avg_cost = 0.0
-        models.append({
-            "model": model,
-            "input_tokens": data["input_tokens"],
-            "output_tokens": data["output_tokens"],
-            "total_tokens": total_tokens,
-            "cache_read_tokens": data["cache_read_tokens"],
-            "cache_creation_tokens": data["cache_creation_tokens"],
-            "cache_efficiency_percent": round(cache_efficiency, 1),
-            "web_searches": data["web_searches"],
-            "cost_usd": round(data["cost_usd"], 4),
-            "session_count": data["session_count"],
-            "avg_cost_per_session": round(avg_cost, 4)
-        })
-    models.sort(key=lambda x: x["cost_usd"], reverse=True)
-    return {"models": models, "total_models": len(models)}
+def get_model_breakdown(request: Request, limit: int = Query(50, ge=1, le=500),
+                        offset: int = Query(0, ge=0)):
+    """Get token usage breakdown by model, most expensive first (paginated)."""
+    _sync_token_metrics_sync()
+    return _cached_response(request, None, ("models", limit, offset), lambda: _models_body(limit, offset))
 
 
-@router.get("/projects")
-async def get_project_breakdown():
-    """Get token usage breakdown by project."""
-    ensure_tables_exist()
-    usage_data = get_all_token_usage()
+def _projects_body(limit: int, offset: int) -> Dict[str, Any]:
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(DISTINCT project_path) FROM token_metrics")
+        total_projects = cursor.fetchone()[0]
+        cursor.execute("""
+            SELECT * FROM token_project_stats
+            ORDER BY cost_usd DESC, project_path
+            LIMIT ? OFFSET ?
+        """, (limit, offset))
+        rows = cursor.fetchall()
+
     projects = []
-    for project_path, data in usage_data["by_project"].items():
-        projects.append({"project_path": project_path, "project_name": Path(project_path).name,
-                         "input_tokens": data["input_tokens"], "output_tokens": data["output_tokens"],
-                         "total_tokens": data["input_tokens"] + data["output_tokens"],
-                         "cost_usd": round(data["cost_usd"], 4), "session_count": data["session_count"]})
-    projects.sort(key=lambda x: x["cost_usd"], reverse=True)
-    return {"projects": projects, "total_projects": len(projects)}
+    for row in rows:
+        data = dict_from_row(row)
+        # Re-assigning project_path keeps it first, ahead of project_name.
+        # Stored paths are str(Path) of a project dir, so basename is its name.
+        projects.append({"project_path": data["project_path"],
+                         "project_name": os.path.basename(data["project_path"]), **data})
+    return {"projects": projects, "total_projects": total_projects, "offset": offset, "limit": limit}
+
+
+@router.get("/projects")
+def get_project_breakdown(request: Request, limit: int = Query(50, ge=1, le=500),
+                          offset: int = Query(0, ge=0)):
+    """Get token usage breakdown by project, most expensive first (paginated)."""
+    _sync_token_metrics_sync()
+    return _cached_response(request, None, ("projects", limit, offset), lambda: _projects_body(limit, offset))
+
+
+def _stats_body() -> Dict[str, Any]:
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT {_TOKEN_SUMS},
+                   COUNT(DISTINCT model) AS model_count,
+                   COUNT(DISTINCT project_path) AS project_count
+            FROM token_metrics
+        """)
+        total = dict_from_row(cursor.fetchone())
+
+    return {"total_tokens": total["input_tokens"] + total["output_tokens"],
+            "total_cost_usd": round(total["cost_usd"], 2),
+            "input_tokens": total["input_tokens"],
+            "output_tokens": total["output_tokens"],
+            "cache_read_tokens": total["cache_read_tokens"],
+            "cache_creation_tokens": total["cache_creation_tokens"],
+            "web_searches": total["web_searches"],
+            "session_count": total["session_count"],
+            "model_count": total["model_count"],
+            "project_count": total["project_count"]}
 
 
 @router.get("/stats")
-async def get_token_stats():
+def get_token_stats(request: Request):
     """Get quick token usage statistics for dashboard display."""
-    ensure_tables_exist()
-    usage_data = get_all_token_usage()
-    total_tokens = usage_data["total"]["input_tokens"] + usage_data["total"]["output_tokens"]
-    return {"total_tokens": total_tokens,
-            "total_cost_usd": round(usage_data["total"]["cost_usd"], 2),
-            "input_tokens": usage_data["total"]["input_tokens"],
-            "output_tokens": usage_data["total"]["output_tokens"],
-            "cache_read_tokens": usage_data["total"]["cache_read_tokens"],
-            "cache_creation_tokens": usage_data["total"]["cache_creation_tokens"],
-            "web_searches": usage_data["total"]["web_searches"],
-            "session_count": len(usage_data["sessions"]),
-            "model_count": len(usage_data["by_model"]),
-            "project_count": len(usage_data["by_project"])}
+    _sync_token_metrics_sync()
+    return _cached_response(request, None, ("stats",), _stats_body)
 
 
 @router.get("/alerts")
-async def list_alerts():
-    """List all token usage alerts."""
-    ensure_tables_exist()
+def list_alerts(
+    is_enabled: Optional[bool] = Query(None),
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    """List token usage alerts, newest first (optionally only enabled/disabled)."""
+    where = ""
+    params: List[Any] = []
+    if is_enabled is not None:
+        where = "WHERE is_enabled = ?"
+        params.append(1 if is_enabled else 0)
+
     with get_db() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT id, alert_type, threshold_value, threshold_unit, time_window, is_enabled, last_triggered_at, created_at FROM token_alerts ORDER BY created_at DESC")
+        cursor.execute(f"SELECT COUNT(*) FROM token_alerts {where}", params)
+        total = cursor.fetchone()[0]
+        cursor.execute(f"""
+            SELECT id, alert_type, threshold_value, threshold_unit, time_window, is_enabled, last_triggered_at, created_at
+            FROM token_alerts {where}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ? OFFSET ?
+        """, params + [limit, offset])
         alerts = [dict_from_row(r) for r in cursor.fetchall()]
-    return {"alerts": alerts, "count": len(alerts)}
+    return {"alerts": alerts, "count": len(alerts), "total": total, "offset": offset, "limit": limit}
 
 
 @router.post("/alerts")
-async def create_alert(alert: TokenAlertCreate):
+def create_alert(alert: TokenAlertCreate):
     """Create a new token usage alert."""
-    ensure_tables_exist()
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute("INSERT INTO token_alerts (alert_type, threshold_value, threshold_unit, time_window, is_enabled) VALUES (?, ?, ?, ?, ?)",
@@ -574,44 +988,18 @@ async def create_alert(alert: TokenAlertCreate):
 
 
 @router.put("/alerts/{alert_id}")
-async def update_alert(alert_id: int, alert: TokenAlertUpdate):
+def update_alert(alert_id: int, alert: TokenAlertUpdate):
     """Update an existing token usage alert."""
-    ensure_tables_exist()
-
-    # Use Pydantic's model_dump to get only set fields
-    update_data = alert.model_dump(exclude_unset=True)
-    if not update_data:
+    if not alert.model_fields_set:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    # Validate fields against whitelist to prevent SQL injection via column names.
-    # While Pydantic model fields are predefined, this explicit check ensures safety
-    # if the model is modified and guards against any potential manipulation.
-    # Use set difference for idiomatic field validation
-    invalid_fields = set(update_data.keys()) - ALERT_UPDATE_ALLOWED_FIELDS
-    if invalid_fields:
-        raise HTTPException(status_code=400, detail=f"Invalid fields for update: {sorted(invalid_fields)}")
-
     # Convert is_enabled to integer for SQLite
-    if "is_enabled" in update_data:
-        update_data["is_enabled"] = 1 if update_data["is_enabled"] else 0
-
-    # Build dynamic update query using only validated field names.
-    # ┌──────────────────────────────────────────────────────────────────────────┐
-    # │ SECURITY: Why f-string interpolation of field names is safe here:        │
-    # │ 1. Field names come ONLY from update_data.keys()                         │
-    # │ 2. update_data is validated against ALERT_UPDATE_ALLOWED_FIELDS (line 589)   │
-    # │ 3. ALERT_UPDATE_ALLOWED_FIELDS is a hardcoded whitelist of safe names    │
-    # │ 4. Values use parameterized placeholders (?) - never interpolated        │
-    # │ This is NOT the same as interpolating user input into SQL.               │
-    # └──────────────────────────────────────────────────────────────────────────┘
-    set_clauses = [f"{field} = ?" for field in update_data.keys()]
-    values = list(update_data.values())
-    values.append(alert_id)
+    is_enabled = None if alert.is_enabled is None else int(alert.is_enabled)
 
     with get_db() as conn:
         cursor = conn.cursor()
-        query = f"UPDATE token_alerts SET {', '.join(set_clauses)} WHERE id = ?"
-        cursor.execute(query, values)
+        cursor.execute(_UPDATE_ALERT, (alert.alert_type, alert.threshold_value, alert.threshold_unit,
+                                       alert.time_window, is_enabled, alert_id))
         conn.commit()
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="Alert not found")
@@ -619,9 +1007,8 @@ async def update_alert(alert_id: int, alert: TokenAlertUpdate):
 
 
 @router.delete("/alerts/{alert_id}")
-async def delete_alert(alert_id: int):
+def delete_alert(alert_id: int):
     """Delete a token usage alert."""
-    ensure_tables_exist()
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM token_alerts WHERE id = ?", (alert_id,))
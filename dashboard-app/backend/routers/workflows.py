@@ -2,14 +2,17 @@
 Workflows Router - Workflow management and Kanban board.
 """
 
-import json
 import logging
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse, Response
 
 from models import (
     WorkflowCreate,
@@ -18,22 +21,112 @@ from models import (
     KanbanTaskUpdate,
     KanbanTaskStatusUpdate,
 )
-from utils import get_db, dict_from_row
+from utils import get_db, dicts_from_cursor
 
-router = APIRouter(prefix="/api", tags=["workflows"])
+router = APIRouter(prefix="/api", tags=["workflows"], default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 # Path will be set from main.py
 CLC_PATH = None
 
+# Conductor class and kanban_automation's stats function, imported from
+# CLC on first successful use
+_CONDUCTOR_CLS = None
+_AUTO_CREATION_STATS = None
+
 # Valid Kanban statuses
 KANBAN_STATUSES = ["pending", "in_progress", "review", "done"]
 
+# /kanban/stats result memo; this router's task writes reset it, writes
+# from elsewhere (e.g. kanban_automation) show up once it expires
+_STATS_TTL_SECONDS = 5.0
+_STATS = None
+_STATS_CACHED_AT: float = 0.0
+
+# kanban_tasks columns holding JSON-encoded lists
+TASK_JSON_FIELDS = ("linked_learnings", "linked_heuristics", "tags")
+
+
+# Kanban tasks in board order, each serialized to a JSON object by SQLite
+# with its JSON list fields inlined (empty/NULL lists become []). Only the
+# columns the board renders are listed; /kanban/tasks/{id} returns the rest.
+_KANBAN_TASKS_SQL = """
+    SELECT status, json_object(
+        'id', id,
+        'title', title,
+        'description', description,
+        'status', status,
+        'priority', priority,
+        'tags', json(COALESCE(NULLIF(tags, ''), '[]')),
+        'linked_learnings', json(COALESCE(NULLIF(linked_learnings, ''), '[]')),
+        'linked_heuristics', json(COALESCE(NULLIF(linked_heuristics, ''), '[]')),
+        'auto_created', auto_created,
+        'created_at', created_at,
+        'updated_at', updated_at,
+        'completed_at', completed_at
+    )
+    FROM kanban_tasks
+    ORDER BY priority DESC, created_at ASC
+"""
+
+
+def _json_list(value) -> list:
+    """Decode a JSON list column; NULL/empty values become a new empty list."""
+    return orjson.loads(value) if value else []
+
+
+def _decode_task(task: dict) -> dict:
+    """Decode a kanban_tasks row dict's JSON list fields in place."""
+    for field in TASK_JSON_FIELDS:
+        task[field] = _json_list(task.get(field))
+    return task
+
+
+def _json_text(value) -> str:
+    """Encode value as JSON text for a TEXT column."""
+    return orjson.dumps(value).decode()
+
+
+@lru_cache(maxsize=128)
+def _task_update_sql(columns: Tuple[str, ...]) -> str:
+    """UPDATE statement for a kanban task setting columns plus updated_at.
+
+    Memoized so each field combination reuses one SQL string, which also
+    keeps sqlite3's per-connection statement cache hitting.
+    """
+    assignments = ", ".join(f"{column} = ?" for column in columns + ("updated_at",))
+    return f"UPDATE kanban_tasks SET {assignments} WHERE id = ?"
+
+
+def _invalidate_kanban_stats():
+    """Forget the memoized /kanban/stats result after a task write."""
+    global _STATS, _STATS_CACHED_AT
+    _STATS = None
+    _STATS_CACHED_AT = 0.0
+
 
 def set_paths(clc_path: Path):
     """Set the paths for workflow operations."""
-    global CLC_PATH
+    global CLC_PATH, _CONDUCTOR_CLS
     CLC_PATH = clc_path
+    _CONDUCTOR_CLS = None
+
+
+def _add_sys_path(path: Path):
+    """Put path at the front of sys.path unless it is already there."""
+    entry = str(path)
+    if entry not in sys.path:
+        sys.path.insert(0, entry)
+
+
+def _get_conductor_class():
+    """Import Conductor from CLC once; raises ImportError if unavailable."""
+    global _CONDUCTOR_CLS
+    if _CONDUCTOR_CLS is None:
+        _add_sys_path(CLC_PATH / "conductor")
+        from conductor import Conductor
+        _CONDUCTOR_CLS = Conductor
+    return _CONDUCTOR_CLS
 
 
 @router.get("/workflows")
@@ -41,14 +134,17 @@ async def get_workflows():
     """Get all workflow definitions."""
     with get_db() as conn:
         cursor = conn.cursor()
+        # Edge counts come from idx_edges_workflow per row, so the wide
+        # nodes_json/config_json rows are not carried through a GROUP BY
         cursor.execute("""
-            SELECT w.*, COUNT(DISTINCT we.id) as edge_count
+            SELECT w.id, w.name, w.description, w.nodes_json, w.config_json,
+                   w.created_at, w.updated_at,
+                   (SELECT COUNT(*) FROM workflow_edges we
+                    WHERE we.workflow_id = w.id) as edge_count
             FROM workflows w
-            LEFT JOIN workflow_edges we ON w.id = we.workflow_id
-            GROUP BY w.id
             ORDER BY w.created_at DESC
         """)
-        return [dict_from_row(r) for r in cursor.fetchall()]
+        return dicts_from_cursor(cursor)
 
 
 @router.post("/workflows")
@@ -58,10 +154,7 @@ async def create_workflow(workflow: WorkflowCreate) -> ActionResult:
         if CLC_PATH is None:
             return ActionResult(success=False, message="Paths not configured")
 
-        sys.path.insert(0, str(CLC_PATH / "conductor"))
-        from conductor import Conductor
-
-        conductor = Conductor()
+        conductor = _get_conductor_class()()
         workflow_id = conductor.create_workflow(
             name=workflow.name,
             description=workflow.description,
@@ -84,39 +177,39 @@ async def create_workflow(workflow: WorkflowCreate) -> ActionResult:
 
 
 @router.get("/kanban/tasks")
-async def get_kanban_tasks():
-    """Get all Kanban tasks grouped by status."""
+async def get_kanban_tasks() -> Response:
+    """Get all Kanban tasks grouped by status.
+
+    Each task is serialized by SQLite; the rows are spliced into the
+    tasks and grouped arrays as bytes.
+    """
     with get_db() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM kanban_tasks
-            ORDER BY priority DESC, created_at ASC
-        """)
-        tasks = [dict_from_row(r) for r in cursor.fetchall()]
-
-        # Parse JSON fields
-        for task in tasks:
-            task["linked_learnings"] = json.loads(task.get("linked_learnings") or "[]")
-            task["linked_heuristics"] = json.loads(task.get("linked_heuristics") or "[]")
-            task["tags"] = json.loads(task.get("tags") or "[]")
-
-        # Group by status
-        grouped = {status: [] for status in KANBAN_STATUSES}
-        for task in tasks:
-            status = task.get("status", "pending")
-            if status in grouped:
-                grouped[status].append(task)
-
-        return {
-            "tasks": tasks,
-            "grouped": grouped,
-            "statuses": KANBAN_STATUSES
-        }
+        cursor.execute(_KANBAN_TASKS_SQL)
+        rows = cursor.fetchall()
+
+    # One pass builds both the flat list and the per-status groups
+    tasks = []
+    grouped = {status: [] for status in KANBAN_STATUSES}
+    for status, task in rows:
+        tasks.append(task)
+        group = grouped.get(status)
+        if group is not None:
+            group.append(task)
+
+    parts = [b'{"tasks":[', ",".join(tasks).encode(), b'],"grouped":{']
+    parts.append(b",".join(
+        orjson.dumps(status) + b":[" + ",".join(tasks).encode() + b"]"
+        for status, tasks in grouped.items()
+    ))
+    parts.append(b'},"statuses":' + orjson.dumps(KANBAN_STATUSES) + b"}")
+    return Response(content=b"".join(parts), media_type="application/json")
 
 
 @router.post("/kanban/tasks")
 async def create_kanban_task(task: KanbanTaskCreate) -> ActionResult:
     """Create a new Kanban task."""
+    now = datetime.now().isoformat()
     try:
         with get_db() as conn:
             cursor = conn.cursor()
@@ -128,12 +221,13 @@ async def create_kanban_task(task: KanbanTaskCreate) -> ActionResult:
                 task.description,
                 task.status or "pending",
                 task.priority or 0,
-                json.dumps(task.tags or []),
-                datetime.now().isoformat(),
-                datetime.now().isoformat()
+                _json_text(task.tags or []),
+                now,
+                now
             ))
             task_id = cursor.lastrowid
             conn.commit()
+            _invalidate_kanban_stats()
 
             return ActionResult(
                 success=True,
@@ -151,72 +245,66 @@ async def get_kanban_task(task_id: int):
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM kanban_tasks WHERE id = ?", (task_id,))
-        row = cursor.fetchone()
-        if not row:
+        tasks = dicts_from_cursor(cursor)
+        if not tasks:
             return {"error": "Task not found"}
-        task = dict_from_row(row)
-        task["linked_learnings"] = json.loads(task.get("linked_learnings") or "[]")
-        task["linked_heuristics"] = json.loads(task.get("linked_heuristics") or "[]")
-        task["tags"] = json.loads(task.get("tags") or "[]")
-        return task
+        return _decode_task(tasks[0])
 
 
 @router.patch("/kanban/tasks/{task_id}")
 async def update_kanban_task(task_id: int, update: KanbanTaskUpdate) -> ActionResult:
     """Update a Kanban task."""
+    now = datetime.now().isoformat()
     try:
         with get_db() as conn:
             cursor = conn.cursor()
 
-            # Build update query dynamically
-            updates = []
+            # Columns are collected in a fixed order so each
+            # field combination maps to one cached statement text
+            columns = []
             values = []
 
             if update.title is not None:
-                updates.append("title = ?")
+                columns.append("title")
                 values.append(update.title)
             if update.description is not None:
-                updates.append("description = ?")
+                columns.append("description")
                 values.append(update.description)
             if update.status is not None:
                 if update.status not in KANBAN_STATUSES:
                     return ActionResult(success=False, message=f"Invalid status. Must be one of: {KANBAN_STATUSES}")
-                updates.append("status = ?")
+                columns.append("status")
                 values.append(update.status)
                 # Set completed_at if moving to done
                 if update.status == "done":
-                    updates.append("completed_at = ?")
-                    values.append(datetime.now().isoformat())
+                    columns.append("completed_at")
+                    values.append(now)
             if update.priority is not None:
-                updates.append("priority = ?")
+                columns.append("priority")
                 values.append(update.priority)
             if update.tags is not None:
-                updates.append("tags = ?")
-                values.append(json.dumps(update.tags))
+                columns.append("tags")
+                values.append(_json_text(update.tags))
             if update.linked_learnings is not None:
-                updates.append("linked_learnings = ?")
-                values.append(json.dumps(update.linked_learnings))
+                columns.append("linked_learnings")
+                values.append(_json_text(update.linked_learnings))
             if update.linked_heuristics is not None:
-                updates.append("linked_heuristics = ?")
-                values.append(json.dumps(update.linked_heuristics))
+                columns.append("linked_heuristics")
+                values.append(_json_text(update.linked_heuristics))
 
-            if not updates:
+            if not columns:
                 return ActionResult(success=False, message="No updates provided")
 
-            updates.append("updated_at = ?")
-            values.append(datetime.now().isoformat())
+            values.append(now)
             values.append(task_id)
 
-            cursor.execute(f"""
-                UPDATE kanban_tasks
-                SET {", ".join(updates)}
-                WHERE id = ?
-            """, values)
+            cursor.execute(_task_update_sql(tuple(columns)), values)
             conn.commit()
 
             if cursor.rowcount == 0:
                 return ActionResult(success=False, message="Task not found")
 
+            _invalidate_kanban_stats()
             return ActionResult(success=True, message="Task updated")
     except Exception as e:
         logger.error(f"Error updating Kanban task {task_id}: {e}", exc_info=True)
@@ -233,18 +321,20 @@ async def update_kanban_task_status(task_id: int, update: KanbanTaskStatusUpdate
         with get_db() as conn:
             cursor = conn.cursor()
 
-            completed_at = datetime.now().isoformat() if update.status == "done" else None
+            now = datetime.now().isoformat()
+            completed_at = now if update.status == "done" else None
 
             cursor.execute("""
                 UPDATE kanban_tasks
                 SET status = ?, updated_at = ?, completed_at = COALESCE(?, completed_at)
                 WHERE id = ?
-            """, (update.status, datetime.now().isoformat(), completed_at, task_id))
+            """, (update.status, now, completed_at, task_id))
             conn.commit()
 
             if cursor.rowcount == 0:
                 return ActionResult(success=False, message="Task not found")
 
+            _invalidate_kanban_stats()
             return ActionResult(success=True, message=f"Task moved to {update.status}")
     except Exception as e:
         logger.error(f"Error updating task status: {e}", exc_info=True)
@@ -263,6 +353,7 @@ async def delete_kanban_task(task_id: int) -> ActionResult:
             if cursor.rowcount == 0:
                 return ActionResult(success=False, message="Task not found")
 
+            _invalidate_kanban_stats()
             return ActionResult(success=True, message="Task deleted")
     except Exception as e:
         logger.error(f"Error deleting Kanban task {task_id}: {e}", exc_info=True)
@@ -282,15 +373,16 @@ async def link_task_to_learning(task_id: int, learning_id: str) -> ActionResult:
             if not row:
                 return ActionResult(success=False, message="Task not found")
 
-            linked = json.loads(row[0] or "[]")
+            linked = _json_list(row[0])
             if learning_id not in linked:
                 linked.append(learning_id)
+            now = datetime.now().isoformat()
 
             cursor.execute("""
                 UPDATE kanban_tasks
                 SET linked_learnings = ?, updated_at = ?
                 WHERE id = ?
-            """, (json.dumps(linked), datetime.now().isoformat(), task_id))
+            """, (_json_text(linked), now, task_id))
             conn.commit()
 
             return ActionResult(success=True, message=f"Linked learning {learning_id} to task")
@@ -308,35 +400,18 @@ async def get_kanban_stats():
     - Auto-created vs manual
     - Source type (failure, CEO inbox, heuristic)
     - Status (pending, in_progress, review, done)
+
+    Results are memoized for _STATS_TTL_SECONDS so polling dashboards
+    share one computation.
     """
+    global _STATS, _STATS_CACHED_AT
+
+    now = time.monotonic()
+    if _STATS is not None and now - _STATS_CACHED_AT < _STATS_TTL_SECONDS:
+        return _STATS
+
     try:
-        # Try importing kanban_automation for detailed stats
-        # TODO(utils): Extract CLC path setup to shared utility (also used in auto_capture.py)
-        try:
-            clc_path = Path.home() / ".claude" / "clc"
-            if str(clc_path) not in sys.path:
-                sys.path.insert(0, str(clc_path))
-            from memory.kanban_automation import get_auto_creation_stats
-            return get_auto_creation_stats()
-        except ImportError:
-            # Fallback: calculate stats directly
-            with get_db() as conn:
-                cursor = conn.cursor()
-
-                # Basic counts
-                cursor.execute("SELECT COUNT(*) FROM kanban_tasks WHERE auto_created = 1")
-                auto_total = cursor.fetchone()[0]
-
-                cursor.execute("SELECT COUNT(*) FROM kanban_tasks WHERE auto_created = 0")
-                manual_total = cursor.fetchone()[0]
-
-                return {
-                    'auto_created_total': auto_total,
-                    'manually_created_total': manual_total,
-                    'failures_pending': 0,
-                    'ceo_decisions_pending': 0,
-                    'validations_pending': 0
-                }
+        stats = _compute_kanban_stats()
     except Exception as e:
         logger.error(f"Error getting Kanban stats: {e}", exc_info=True)
         return {
@@ -346,3 +421,41 @@ async def get_kanban_stats():
             'ceo_decisions_pending': 0,
             'validations_pending': 0
         }
+
+    _STATS = stats
+    _STATS_CACHED_AT = now
+    return stats
+
+
+def _compute_kanban_stats() -> dict:
+    """Compute /kanban/stats, via kanban_automation when it is available."""
+    global _AUTO_CREATION_STATS
+
+    # Try importing kanban_automation for detailed stats
+    # TODO(utils): Extract CLC path setup to shared utility (also used in auto_capture.py)
+    try:
+        if _AUTO_CREATION_STATS is None:
+            _add_sys_path(Path.home() / ".claude" / "clc")
+            from memory.kanban_automation import get_auto_creation_stats
+            _AUTO_CREATION_STATS = get_auto_creation_stats
+        return _AUTO_CREATION_STATS()
+    except ImportError:
+        # Fallback: calculate stats directly
+        with get_db() as conn:
+            cursor = conn.cursor()
+
+            # Basic counts, both from one pass over kanban_tasks
+            cursor.execute("""
+                SELECT COUNT(CASE WHEN auto_created = 1 THEN 1 END),
+                       COUNT(CASE WHEN auto_created = 0 THEN 1 END)
+                FROM kanban_tasks
+            """)
+            auto_total, manual_total = cursor.fetchone()
+
+            return {
+                'auto_created_total': auto_total,
+                'manually_created_total': manual_total,
+                'failures_pending': 0,
+                'ceo_decisions_pending': 0,
+                'validations_pending': 0
+            }
@@ -6,20 +6,73 @@ Scans ~/.claude/projects/*/jsonl files and extracts metadata WITHOUT
 loading full content for performance. Provides lazy loading for full sessions.
 """
 
-import json
 import logging
+import os
+import sqlite3
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterator, Optional, Any, BinaryIO, Tuple
 import re
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Threads reading session files during a scan; the work is mostly file I/O
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Top-level markers of entries the index never uses, as written in compact
+# JSONL. Checked on raw bytes so these lines (snapshots can be large) are
+# not parsed at all; quotes inside string values are escaped, so message
+# text cannot match. Other spellings still get filtered after parsing.
+SKIPPED_LINE_MARKERS = (b'"type":"file-history-snapshot"', b'"isSidechain":true')
+
+
+def _is_skipped_line(line: bytes) -> bool:
+    return any(marker in line for marker in SKIPPED_LINE_MARKERS)
+
+
+# One row per scanned transcript: its (mtime_ns, size) when last read and
+# the SessionMetadata extracted (NULL if it held no session), as JSON
+_CREATE_SESSION_FILES = """
+    CREATE TABLE IF NOT EXISTS session_files (
+        path TEXT PRIMARY KEY,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        metadata TEXT
+    )
+"""
+
+
+def _timestamp_epoch(ts: str) -> Optional[float]:
+    """Epoch seconds for an ISO 8601 timestamp, or None if unparseable.
+
+    Claude Code writes fixed-width UTC (2024-01-15T10:30:00.123Z), which is
+    sliced directly; anything else goes through fromisoformat.
+    """
+    try:
+        if len(ts) == 24 and ts[19] == '.' and ts[23] == 'Z':
+            return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]), int(ts[11:13]),
+                            int(ts[14:16]), int(ts[17:19]), int(ts[20:23]) * 1000,
+                            tzinfo=timezone.utc).timestamp()
+        return datetime.fromisoformat(ts.replace('Z', '+00:00')).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return None
+
 
 @dataclass
 class SessionMetadata:
     """Lightweight metadata for a session."""
+    # One instance per indexed session lives for the life of the process.
+    # Declared by hand because dataclass(slots=True) needs Python 3.10.
+    __slots__ = (
+        "session_id", "project", "project_path", "first_timestamp", "last_timestamp",
+        "prompt_count", "first_prompt_preview", "git_branch", "is_agent", "file_path", "file_size",
+    )
+
     session_id: str
     project: str
     project_path: str
@@ -32,6 +85,22 @@ class SessionMetadata:
     file_path: str
     file_size: int
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict for API responses (all fields are scalars, so no deep copy)."""
+        return {
+            "session_id": self.session_id,
+            "project": self.project,
+            "project_path": self.project_path,
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+            "prompt_count": self.prompt_count,
+            "first_prompt_preview": self.first_prompt_preview,
+            "git_branch": self.git_branch,
+            "is_agent": self.is_agent,
+            "file_path": self.file_path,
+            "file_size": self.file_size,
+        }
+
 
 @dataclass
 class SessionMessage:
@@ -60,6 +129,18 @@ class SessionIndex:
         self.projects_dir = projects_dir or Path.home() / ".claude" / "projects"
         self._index: Dict[str, SessionMetadata] = {}
         self._last_scan: Optional[datetime] = None
+        # Derived from _index at the end of each scan so list_sessions does no
+        # per-request lowercasing, timestamp parsing or sorting
+        self._by_recency: List[SessionMetadata] = []
+        self._search_keys: Dict[str, str] = {}
+        self._neg_epochs: List[float] = []
+        self._totals: Dict[str, int] = {}
+        # path -> (mtime_ns, size, metadata) from the last scan; unchanged
+        # files reuse their metadata (or None) instead of being re-read
+        self._file_cache: Dict[str, Tuple[int, int, Optional[SessionMetadata]]] = {}
+        # The first scan seeds _file_cache from session_files in index.db, so
+        # a restart only re-reads files that changed while it was down
+        self._file_cache_loaded = False
         self._db_path = Path.home() / ".claude" / "clc" / "memory" / "index.db"
 
     # Tools that commonly have large inputs (file contents)
@@ -136,8 +217,8 @@ class SessionIndex:
                 "tool_summary": row["tool_summary"],
                 "content_summary": row["content_summary"],
                 "conversation_summary": row["conversation_summary"],
-                "files_touched": json.loads(row["files_touched"]) if row["files_touched"] else [],
-                "tool_counts": json.loads(row["tool_counts"]) if row["tool_counts"] else {},
+                "files_touched": orjson.loads(row["files_touched"]) if row["files_touched"] else [],
+                "tool_counts": orjson.loads(row["tool_counts"]) if row["tool_counts"] else {},
                 "message_count": row["message_count"],
                 "summarized_at": row["summarized_at"],
                 "summarizer_model": row["summarizer_model"],
@@ -156,36 +237,159 @@ class SessionIndex:
             Number of sessions indexed
         """
         logger.info(f"Scanning projects directory: {self.projects_dir}")
-        self._index.clear()
 
         if not self.projects_dir.exists():
             logger.warning(f"Projects directory does not exist: {self.projects_dir}")
+            self._index.clear()
+            self._build_lookups()
             return 0
 
-        session_count = 0
+        if not self._file_cache_loaded:
+            self._file_cache_loaded = True
+            self._file_cache = self._load_file_cache()
 
-        # Scan all project directories
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
+        # Find all JSONL files in all project directories
+        files = [
+            (jsonl_file, project_dir.name)
+            for project_dir in self.projects_dir.iterdir() if project_dir.is_dir()
+            for jsonl_file in project_dir.glob("*.jsonl")
+        ]
 
-            project_name = project_dir.name
-
-            # Find all JSONL files in this project
-            for jsonl_file in project_dir.glob("*.jsonl"):
-                try:
-                    metadata = self._extract_metadata(jsonl_file, project_name)
-                    if metadata:
-                        self._index[metadata.session_id] = metadata
-                        session_count += 1
-                except Exception as e:
-                    logger.error(f"Error indexing {jsonl_file}: {e}", exc_info=True)
-                    continue
+        # Reads overlap across threads; map() keeps file order, so duplicate
+        # session IDs resolve exactly as in a sequential scan
+        with ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS) as pool:
+            results = list(pool.map(lambda item: self._index_file(*item), files))
 
+        index: Dict[str, SessionMetadata] = {}
+        file_cache: Dict[str, Tuple[int, int, Optional[SessionMetadata]]] = {}
+        session_count = 0
+        for (jsonl_file, _), (fingerprint, metadata) in zip(files, results):
+            # Only files seen in this scan are kept, so deleted files drop out
+            if fingerprint:
+                file_cache[str(jsonl_file)] = (*fingerprint, metadata)
+            if metadata:
+                index[metadata.session_id] = metadata
+                session_count += 1
+
+        self._save_file_cache(self._file_cache, file_cache)
+
+        # Swap in the finished index rather than filling the live one
+        self._index = index
+        self._file_cache = file_cache
+        self._build_lookups()
         self._last_scan = datetime.now()
         logger.info(f"Indexed {session_count} sessions from {len(list(self.projects_dir.iterdir()))} projects")
         return session_count
 
+    def _index_file(
+        self, jsonl_file: Path, project_name: str
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[SessionMetadata]]:
+        """
+        Extract metadata for one file, reusing the last scan's result if the
+        file's (mtime_ns, size) is unchanged. Failures are logged, not raised.
+
+        Returns:
+            ((mtime_ns, size) or None if the result must not be cached, metadata)
+        """
+        try:
+            stat = jsonl_file.stat()
+        except OSError as e:
+            logger.error(f"Error indexing {jsonl_file}: {e}")
+            return None, None
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._file_cache.get(str(jsonl_file))
+        if cached and cached[:2] == fingerprint:
+            return fingerprint, cached[2]
+
+        try:
+            return fingerprint, self._extract_metadata(jsonl_file, project_name)
+        except Exception as e:
+            logger.error(f"Error indexing {jsonl_file}: {e}", exc_info=True)
+            return None, None
+
+    def _load_file_cache(self) -> Dict[str, Tuple[int, int, Optional[SessionMetadata]]]:
+        """Read the persisted per-file scan results (empty if unavailable)."""
+        try:
+            conn = sqlite3.connect(str(self._db_path))
+            try:
+                conn.execute(_CREATE_SESSION_FILES)
+                rows = conn.execute("SELECT path, mtime_ns, size, metadata FROM session_files").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Session file cache unavailable, rescanning all files: {e}")
+            return {}
+
+        cache = {}
+        for path, mtime_ns, size, metadata in rows:
+            try:
+                cache[path] = (mtime_ns, size, SessionMetadata(**orjson.loads(metadata)) if metadata else None)
+            except (orjson.JSONDecodeError, TypeError):
+                continue  # Stale layout; the file is simply re-read
+        return cache
+
+    def _save_file_cache(
+        self,
+        old: Dict[str, Tuple[int, int, Optional[SessionMetadata]]],
+        new: Dict[str, Tuple[int, int, Optional[SessionMetadata]]],
+    ) -> None:
+        """Write the rows that differ between two scans' file caches."""
+        changed = [
+            (path, mtime_ns, size, orjson.dumps(metadata.to_dict()).decode() if metadata else None)
+            for path, (mtime_ns, size, metadata) in new.items()
+            if old.get(path, ())[:2] != (mtime_ns, size)
+        ]
+        removed = [(path,) for path in old if path not in new]
+        if not changed and not removed:
+            return
+        try:
+            conn = sqlite3.connect(str(self._db_path))
+            try:
+                with conn:
+                    conn.execute(_CREATE_SESSION_FILES)
+                    conn.executemany("DELETE FROM session_files WHERE path = ?", removed)
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO session_files (path, mtime_ns, size, metadata) VALUES (?, ?, ?, ?)",
+                        changed,
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not persist session file cache: {e}")
+
+    def _build_lookups(self) -> None:
+        """Precompute the sort order and filter keys used by list_sessions."""
+        epochs = {s.session_id: _timestamp_epoch(s.last_timestamp) for s in self._index.values()}
+
+        def recency(s: SessionMetadata) -> Tuple[bool, float, str]:
+            epoch = epochs[s.session_id]
+            # Unparseable timestamps sort last and never pass a days filter
+            return (epoch is not None, epoch or 0.0, s.last_timestamp)
+
+        self._by_recency = sorted(self._index.values(), key=recency, reverse=True)
+        # NUL cannot occur in either field, so a search never spans both
+        self._search_keys = {
+            s.session_id: f"{s.first_prompt_preview}\0{s.project}".lower() for s in self._by_recency
+        }
+        # Negated so the list ascends and bisect can find a days cutoff
+        self._neg_epochs = [-epochs[s.session_id] for s in self._by_recency if epochs[s.session_id] is not None]
+
+        # Counts for get_stats, gathered in one pass
+        agent_sessions = total_prompts = 0
+        projects = set()
+        for s in self._by_recency:
+            agent_sessions += s.is_agent
+            total_prompts += s.prompt_count
+            projects.add(s.project)
+        self._totals = {
+            "total_sessions": len(self._by_recency),
+            "agent_sessions": agent_sessions,
+            "user_sessions": len(self._by_recency) - agent_sessions,
+            "total_prompts": total_prompts,
+            "projects_count": len(projects),
+        }
+
     def _extract_metadata(self, file_path: Path, project_name: str) -> Optional[SessionMetadata]:
         """
         Extract metadata from a session file without loading full content.
@@ -219,15 +423,16 @@ class SessionIndex:
             first_prompt_preview = ""
             git_branch = ""
 
-            with open(file_path, 'r', encoding='utf-8') as f:
+            # Binary lines go straight to orjson, which validates UTF-8 itself
+            with open(file_path, 'rb') as f:
                 for line in f:
-                    # Skip empty lines
-                    if not line.strip():
+                    # Skip empty, sidechain and snapshot lines before parsing
+                    if not line.strip() or _is_skipped_line(line):
                         continue
 
                     try:
-                        data = json.loads(line)
-                    except json.JSONDecodeError as e:
+                        data = orjson.loads(line)
+                    except orjson.JSONDecodeError as e:
                         logger.warning(f"JSON parse error in {file_path}: {e}")
                         continue
 
@@ -323,35 +528,27 @@ class SessionIndex:
         Returns:
             Tuple of (sessions, total_count)
         """
-        sessions = list(self._index.values())
+        # Already most recent first; filtering keeps that order
+        sessions = self._by_recency
+
+        # Filter by days: a prefix of the recency order, found by bisection
+        if days is not None:
+            cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
+            sessions = sessions[:bisect_left(self._neg_epochs, -cutoff)]
 
         # Filter by agent files
         if not include_agent:
             sessions = [s for s in sessions if not s.is_agent]
 
-        # Filter by days
-        if days is not None:
-            cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
-            sessions = [
-                s for s in sessions
-                if datetime.fromisoformat(s.last_timestamp.replace('Z', '+00:00')).timestamp() > cutoff
-            ]
-
         # Filter by project
         if project:
             sessions = [s for s in sessions if s.project == project]
 
-        # Filter by search
+        # Filter by search (first prompt preview or project name)
         if search:
             search_lower = search.lower()
-            sessions = [
-                s for s in sessions
-                if search_lower in s.first_prompt_preview.lower()
-                or search_lower in s.project.lower()
-            ]
-
-        # Sort by last timestamp (most recent first)
-        sessions.sort(key=lambda s: s.last_timestamp, reverse=True)
+            keys = self._search_keys
+            sessions = [s for s in sessions if search_lower in keys[s.session_id]]
 
         total_count = len(sessions)
 
@@ -364,6 +561,125 @@ class SessionIndex:
         """Get metadata for a specific session."""
         return self._index.get(session_id)
 
+    def _parse_message(self, data: Dict[str, Any]) -> Optional[SessionMessage]:
+        """Build a SessionMessage from one parsed JSONL entry (None if not a chat message)."""
+        # Skip sidechains and snapshots
+        if data.get("isSidechain") or data.get("type") == "file-history-snapshot":
+            return None
+
+        msg_type = data.get("type")
+        if msg_type not in ["user", "assistant"]:
+            return None
+
+        uuid = data.get("uuid", "")
+        timestamp = data.get("timestamp", "")
+
+        # Extract content
+        message_data = data.get("message", {})
+        content = ""
+        tool_use = []
+        thinking = None
+        is_command = False
+
+        if msg_type == "user":
+            # User message
+            msg_content = message_data.get("content", "")
+            if isinstance(msg_content, str):
+                content = msg_content
+            elif isinstance(msg_content, list):
+                # Handle tool results
+                for item in msg_content:
+                    if isinstance(item, dict):
+                        if item.get("type") == "tool_result":
+                            # This is a tool result, skip or summarize
+                            continue
+                        elif "text" in item:
+                            content = item["text"]
+                            break
+                    elif isinstance(item, str):
+                        content = item
+                        break
+
+            # Check if it's a command (single word or starts with /)
+            if content and (not " " in content.strip() or content.strip().startswith("/")):
+                is_command = True
+
+        elif msg_type == "assistant":
+            # Assistant message
+            msg_content = message_data.get("content", [])
+
+            # Extract text and tool uses
+            text_parts = []
+            for item in msg_content:
+                if isinstance(item, dict):
+                    if item.get("type") == "text":
+                        text_parts.append(item.get("text", ""))
+                    elif item.get("type") == "tool_use":
+                        tool_name = item.get("name", "")
+                        raw_input = item.get("input", {})
+
+                        # Truncate tool inputs to prevent context flooding
+                        truncated_input = self._truncate_tool_input(tool_name, raw_input)
+
+                        tool_use.append({
+                            "id": item.get("id", ""),
+                            "name": tool_name,
+                            "input": truncated_input
+                        })
+                    elif item.get("type") == "thinking":
+                        # Check if thinking is encrypted (has signature)
+                        if "signature" in item:
+                            thinking = "[Encrypted thinking]"
+                        else:
+                            thinking = item.get("thinking", "")
+
+            content = "\n".join(text_parts)
+
+        return SessionMessage(
+            uuid=uuid,
+            type=msg_type,
+            timestamp=timestamp,
+            content=content,
+            is_command=is_command,
+            tool_use=tool_use if tool_use else None,
+            thinking=thinking
+        )
+
+    def _iter_messages(self, f: BinaryIO) -> Iterator[SessionMessage]:
+        """Yield messages from an open session file, closing it when done."""
+        with f:
+            for line in f:
+                if not line.strip() or _is_skipped_line(line):
+                    continue
+
+                try:
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+
+                message = self._parse_message(data)
+                if message:
+                    yield message
+
+    def iter_session_messages(self, session_id: str) -> Optional[Iterator[SessionMessage]]:
+        """
+        Stream a session's messages one JSONL line at a time.
+
+        The file is opened immediately, so a missing file raises here rather
+        than part-way through a response; lines are read as the iterator is
+        consumed.
+
+        Args:
+            session_id: Session ID to load
+
+        Returns:
+            Iterator of SessionMessage, or None if the session is not indexed
+        """
+        metadata = self._index.get(session_id)
+        if not metadata:
+            return None
+        return self._iter_messages(open(metadata.file_path, 'rb'))
+
     def load_full_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Lazy-load full session content on demand.
@@ -380,100 +696,7 @@ class SessionIndex:
             return None
 
         try:
-            messages = []
-            file_path = Path(metadata.file_path)
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    # Skip sidechains and snapshots
-                    if data.get("isSidechain") or data.get("type") == "file-history-snapshot":
-                        continue
-
-                    msg_type = data.get("type")
-                    if msg_type not in ["user", "assistant"]:
-                        continue
-
-                    uuid = data.get("uuid", "")
-                    timestamp = data.get("timestamp", "")
-
-                    # Extract content
-                    message_data = data.get("message", {})
-                    content = ""
-                    tool_use = []
-                    thinking = None
-                    is_command = False
-
-                    if msg_type == "user":
-                        # User message
-                        msg_content = message_data.get("content", "")
-                        if isinstance(msg_content, str):
-                            content = msg_content
-                        elif isinstance(msg_content, list):
-                            # Handle tool results
-                            for item in msg_content:
-                                if isinstance(item, dict):
-                                    if item.get("type") == "tool_result":
-                                        # This is a tool result, skip or summarize
-                                        continue
-                                    elif "text" in item:
-                                        content = item["text"]
-                                        break
-                                elif isinstance(item, str):
-                                    content = item
-                                    break
-
-                        # Check if it's a command (single word or starts with /)
-                        if content and (not " " in content.strip() or content.strip().startswith("/")):
-                            is_command = True
-
-                    elif msg_type == "assistant":
-                        # Assistant message
-                        msg_content = message_data.get("content", [])
-
-                        # Extract text and tool uses
-                        text_parts = []
-                        for item in msg_content:
-                            if isinstance(item, dict):
-                                if item.get("type") == "text":
-                                    text_parts.append(item.get("text", ""))
-                                elif item.get("type") == "tool_use":
-                                    tool_name = item.get("name", "")
-                                    raw_input = item.get("input", {})
-
-                                    # Truncate tool inputs to prevent context flooding
-                                    truncated_input = self._truncate_tool_input(tool_name, raw_input)
-
-                                    tool_use.append({
-                                        "id": item.get("id", ""),
-                                        "name": tool_name,
-                                        "input": truncated_input
-                                    })
-                                elif item.get("type") == "thinking":
-                                    # Check if thinking is encrypted (has signature)
-                                    if "signature" in item:
-                                        thinking = "[Encrypted thinking]"
-                                    else:
-                                        thinking = item.get("thinking", "")
-
-                        content = "\n".join(text_parts)
-
-                    messages.append(SessionMessage(
-                        uuid=uuid,
-                        type=msg_type,
-                        timestamp=timestamp,
-                        content=content,
-                        is_command=is_command,
-                        tool_use=tool_use if tool_use else None,
-                        thinking=thinking
-                    ))
+            messages = list(self.iter_session_messages(session_id))
 
             # Try to get summary from database
             summary = self.get_session_summary(session_id)
@@ -532,17 +755,19 @@ class SessionIndex:
 
         return project_list
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Get statistics about indexed sessions."""
-        total_sessions = len(self._index)
-        agent_sessions = sum(1 for m in self._index.values() if m.is_agent)
-        total_prompts = sum(m.prompt_count for m in self._index.values())
+    @property
+    def last_scan(self) -> Optional[datetime]:
+        """Time the index was last rebuilt (None before the first scan)."""
+        return self._last_scan
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about indexed sessions (counts are precomputed per scan)."""
+        totals = self._totals
         return {
-            "total_sessions": total_sessions,
-            "agent_sessions": agent_sessions,
-            "user_sessions": total_sessions - agent_sessions,
-            "total_prompts": total_prompts,
+            "total_sessions": totals.get("total_sessions", 0),
+            "agent_sessions": totals.get("agent_sessions", 0),
+            "user_sessions": totals.get("user_sessions", 0),
+            "total_prompts": totals.get("total_prompts", 0),
             "last_scan": self._last_scan.isoformat() if self._last_scan else None,
-            "projects_count": len(set(m.project for m in self._index.values()))
+            "projects_count": totals.get("projects_count", 0)
         }
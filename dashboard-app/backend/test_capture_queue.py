@@ -0,0 +1,112 @@
+"""
+Tests for the capture_queue triggers used by utils/auto_capture.py.
+
+Run from dashboard-app/backend: python -m pytest test_capture_queue.py
+"""
+
+import sqlite3
+
+import pytest
+
+from utils import database
+from utils.auto_capture import AutoCapture
+from utils.database import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    """Point get_db() at a temp database with a workflow_runs table."""
+    path = str(tmp_path / "index.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE workflow_runs (id INTEGER PRIMARY KEY, status TEXT, phase TEXT)")
+    conn.commit()
+    conn.close()
+
+    pool = ConnectionPool(path, max_size=2)
+    monkeypatch.setattr(database, "_pool", pool)
+    yield pool
+    pool.close_all()
+
+
+@pytest.fixture
+def capture(pool):
+    capture = AutoCapture()
+    assert capture._ensure_capture_queue()
+    return capture
+
+
+def _execute(pool, sql, params=()):
+    conn = pool.acquire()
+    try:
+        conn.execute(sql, params)
+        conn.commit()
+    finally:
+        pool.release(conn)
+
+
+def _queued(pool):
+    conn = pool.acquire()
+    try:
+        return [tuple(row) for row in conn.execute("SELECT run_id, status FROM capture_queue ORDER BY id")]
+    finally:
+        pool.release(conn)
+
+
+class TestTriggers:
+    @pytest.mark.parametrize("status", ["failed", "cancelled", "completed"])
+    def test_insert_with_terminal_status_is_queued(self, pool, capture, status):
+        _execute(pool, "INSERT INTO workflow_runs (id, status) VALUES (1, ?)", (status,))
+
+        assert _queued(pool) == [(1, status)]
+
+    def test_insert_while_running_is_not_queued(self, pool, capture):
+        _execute(pool, "INSERT INTO workflow_runs (id, status) VALUES (1, 'running')")
+
+        assert _queued(pool) == []
+        assert capture._queued_marker() is None
+
+    def test_status_change_to_terminal_is_queued(self, pool, capture):
+        _execute(pool, "INSERT INTO workflow_runs (id, status) VALUES (1, 'running')")
+        _execute(pool, "UPDATE workflow_runs SET status = 'failed' WHERE id = 1")
+
+        assert _queued(pool) == [(1, "failed")]
+
+    def test_unchanged_status_is_not_queued_again(self, pool, capture):
+        _execute(pool, "INSERT INTO workflow_runs (id, status) VALUES (1, 'completed')")
+        _execute(pool, "UPDATE workflow_runs SET status = 'completed' WHERE id = 1")
+        _execute(pool, "UPDATE workflow_runs SET phase = 'done' WHERE id = 1")
+
+        assert _queued(pool) == [(1, "completed")]
+
+    def test_schema_is_idempotent(self, pool, capture):
+        assert capture._ensure_capture_queue()
+        _execute(pool, "INSERT INTO workflow_runs (id, status) VALUES (1, 'failed')")
+
+        assert _queued(pool) == [(1, "failed")]
+
+    def test_missing_workflow_runs_disables_queue(self, pool):
+        _execute(pool, "DROP TABLE workflow_runs")
+
+        assert not AutoCapture()._ensure_capture_queue()
+
+
+class TestClearQueue:
+    def test_clears_markers_up_to_last_pass(self, pool, capture):
+        _execute(pool, "INSERT INTO workflow_runs (id, status) VALUES (1, 'failed')")
+        _execute(pool, "INSERT INTO workflow_runs (id, status) VALUES (2, 'completed')")
+        marker = capture._queued_marker()
+        # Queued while the pass ran; must survive for the next one
+        _execute(pool, "INSERT INTO workflow_runs (id, status) VALUES (3, 'cancelled')")
+
+        capture._clear_queue(marker)
+
+        assert _queued(pool) == [(3, "cancelled")]
+        assert capture._queued_marker() > marker
+
+    def test_clearing_everything_empties_marker(self, pool, capture):
+        _execute(pool, "INSERT INTO workflow_runs (id, status) VALUES (1, 'failed')")
+
+        capture._clear_queue(capture._queued_marker())
+
+        assert _queued(pool) == []
+        assert capture._queued_marker() is None
@@ -0,0 +1,127 @@
+"""
+Tests for the SQLite ConnectionPool in utils/database.py.
+
+Run from dashboard-app/backend: python -m pytest test_connection_pool.py
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from utils.database import ConnectionPool
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "pool.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def _count(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestAcquire:
+    def test_reuses_released_connection(self, db_path):
+        pool = ConnectionPool(db_path, max_size=2)
+        conn = pool.acquire()
+        pool.release(conn)
+
+        assert pool.acquire() is conn
+        assert pool.stats()["open"] == 1
+
+    def test_full_pool_times_out(self, db_path):
+        pool = ConnectionPool(db_path, max_size=1, wait_seconds=0.2)
+        pool.acquire()
+
+        started = time.monotonic()
+        with pytest.raises(sqlite3.OperationalError, match="No database connection available"):
+            pool.acquire()
+
+        assert time.monotonic() - started >= 0.2
+        stats = pool.stats()
+        assert stats["waits"] == 1
+        assert stats["open"] == 1
+        assert stats["active"] == 1
+
+    def test_full_pool_waits_for_release(self, db_path):
+        pool = ConnectionPool(db_path, max_size=1, wait_seconds=5.0)
+        conn = pool.acquire()
+        timer = threading.Timer(0.1, pool.release, args=(conn,))
+        timer.start()
+        try:
+            assert pool.acquire() is conn
+        finally:
+            timer.join()
+
+        assert pool.stats()["waits"] == 1
+
+
+class TestRelease:
+    def test_rolls_back_open_transaction(self, db_path):
+        pool = ConnectionPool(db_path, max_size=1)
+        conn = pool.acquire()
+        conn.execute("INSERT INTO items (name) VALUES ('uncommitted')")
+        assert conn.in_transaction
+
+        pool.release(conn)
+
+        assert not conn.in_transaction
+        assert _count(db_path) == 0
+        assert pool.stats() == {"max_size": 1, "open": 1, "active": 0, "idle": 1, "waits": 0}
+
+    def test_keeps_committed_work(self, db_path):
+        pool = ConnectionPool(db_path, max_size=1)
+        conn = pool.acquire()
+        conn.execute("INSERT INTO items (name) VALUES ('committed')")
+        conn.commit()
+
+        pool.release(conn)
+
+        assert _count(db_path) == 1
+
+    def test_discards_connection_that_cannot_roll_back(self, db_path):
+        pool = ConnectionPool(db_path, max_size=1)
+        conn = pool.acquire()
+        conn.close()
+
+        pool.release(conn)
+
+        assert pool.stats()["open"] == 0
+        assert pool.acquire() is not conn
+
+
+class TestCloseAll:
+    def test_closes_idle_connections(self, db_path):
+        pool = ConnectionPool(db_path, max_size=2)
+        conn = pool.acquire()
+        pool.release(conn)
+
+        pool.close_all()
+
+        assert pool.stats()["open"] == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_late_release_closes_connection(self, db_path):
+        pool = ConnectionPool(db_path, max_size=2)
+        conn = pool.acquire()
+        conn.execute("INSERT INTO items (name) VALUES ('in flight')")
+
+        pool.close_all()
+        pool.release(conn)
+
+        assert pool.stats() == {"max_size": 2, "open": 0, "active": 0, "idle": 0, "waits": 0}
+        assert _count(db_path) == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -8,15 +8,20 @@ Modules:
 - auto_capture: Background job for automatic failure capture
 """
 
-from .database import get_db, dict_from_row, escape_like
+from .database import get_db, get_pool, close_pool, dict_from_row, dicts_from_cursor, escape_like, enable_wal, ensure_indexes
 from .broadcast import ConnectionManager
 from .repository import BaseRepository
 from .auto_capture import AutoCapture, auto_capture
 
 __all__ = [
     'get_db',
+    'get_pool',
+    'close_pool',
     'dict_from_row',
+    'dicts_from_cursor',
     'escape_like',
+    'enable_wal',
+    'ensure_indexes',
     'ConnectionManager',
     'BaseRepository',
     'AutoCapture',
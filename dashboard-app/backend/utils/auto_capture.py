@@ -5,6 +5,11 @@ This module provides a background job that automatically captures workflow outco
 (both failures AND successes) as learnings, enabling continuous learning without
 manual intervention.
 
+Triggers on workflow_runs queue a marker row in capture_queue whenever a run
+reaches a terminal status, so the job only scans workflow_runs when there is
+something to capture. While the queue is empty it backs off from
+QUEUE_POLL_MIN_SECONDS up to interval_seconds between (cheap) queue checks.
+
 Usage:
     from utils.auto_capture import AutoCapture
 
@@ -21,13 +26,17 @@ Usage:
 """
 
 import asyncio
-import json
 import logging
 import os
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
+
+import orjson
+from fastapi.concurrency import run_in_threadpool
 
-from utils.database import get_db
+from utils.database import get_db, get_pool
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +57,108 @@ except ImportError as e:
     KANBAN_AVAILABLE = False
 
 
+# Minimum delay between capture_queue checks; doubles while idle
+QUEUE_POLL_MIN_SECONDS = 1.0
+
+# Terminal run statuses queued for capture by the workflow_runs triggers
+_CAPTURE_QUEUE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS capture_queue (
+        id INTEGER PRIMARY KEY,
+        run_id INTEGER NOT NULL,
+        status TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS workflow_runs_capture_insert
+    AFTER INSERT ON workflow_runs
+    WHEN NEW.status IN ('failed', 'cancelled', 'completed')
+    BEGIN
+        INSERT INTO capture_queue (run_id, status) VALUES (NEW.id, NEW.status);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS workflow_runs_capture_update
+    AFTER UPDATE OF status ON workflow_runs
+    WHEN NEW.status IN ('failed', 'cancelled', 'completed')
+    AND NEW.status IS NOT OLD.status
+    BEGIN
+        INSERT INTO capture_queue (run_id, status) VALUES (NEW.id, NEW.status);
+    END
+    """,
+)
+
+# Rows are (type, filepath, title, summary, severity, created_at)
+_INSERT_LEARNING = """
+    INSERT INTO learnings (type, filepath, title, summary, domain, severity, created_at)
+    VALUES (?, ?, ?, ?, 'workflow', ?, ?)
+"""
+
+# Failed/cancelled and completed runs in the lookback window that have no
+# learning of the matching type yet, failures first, in one statement
+_UNCAPTURED_RUNS = """
+    SELECT 'failure', wr.id, wr.workflow_name, wr.error_message, wr.created_at,
+           NULL, NULL
+    FROM workflow_runs wr
+    WHERE wr.status IN ('failed', 'cancelled')
+    AND wr.created_at > datetime('now', :lookback)
+    AND NOT EXISTS (
+        SELECT 1 FROM learnings l
+        WHERE l.filepath = 'workflow_runs/' || wr.id
+        AND l.type = 'failure'
+    )
+    UNION ALL
+    SELECT 'success', wr.id, wr.workflow_name, wr.output_json, wr.created_at,
+           wr.completed_nodes, wr.total_nodes
+    FROM workflow_runs wr
+    WHERE wr.status = 'completed'
+    AND wr.created_at > datetime('now', :lookback)
+    AND NOT EXISTS (
+        SELECT 1 FROM learnings l
+        WHERE l.filepath = 'workflow_runs/' || wr.id
+        AND l.type = 'success'
+    )
+"""
+
+_INSERT_METRIC = """
+    INSERT INTO metrics (metric_type, metric_name, metric_value, context)
+    VALUES (?, 'background_job', ?, 'auto_capture.py')
+"""
+
+
+def _insert_learnings(cursor, rows: List[Tuple]) -> List[Tuple]:
+    """Insert learning rows with one executemany; return the rows inserted.
+
+    If the batch fails it is rolled back to a savepoint and retried row by
+    row, so one bad row is logged and skipped as before without losing the
+    rest. Rows are shaped for _INSERT_LEARNING.
+    """
+    if not rows:
+        return []
+    # Inside an explicit transaction, RELEASE does not commit; the caller
+    # commits the learnings together with its metric rows
+    if not cursor.connection.in_transaction:
+        cursor.execute("BEGIN")
+    cursor.execute("SAVEPOINT capture_batch")
+    try:
+        cursor.executemany(_INSERT_LEARNING, rows)
+        return rows
+    except sqlite3.Error as e:
+        logger.warning(f"Batch capture failed ({e}); retrying run by run")
+        cursor.execute("ROLLBACK TO capture_batch")
+    finally:
+        cursor.execute("RELEASE capture_batch")
+
+    inserted = []
+    for row in rows:
+        try:
+            cursor.execute(_INSERT_LEARNING, row)
+            inserted.append(row)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to capture {row[0]} {row[1]}: {e}")
+    return inserted
+
+
 class AutoCapture:
     """
     Background job that monitors workflow_runs for outcomes (failures AND successes)
@@ -57,6 +168,8 @@ class AutoCapture:
         interval_seconds: How often to check for new outcomes (default: 60)
         lookback_hours: How far back to look for outcomes (default: 24)
         running: Whether the capture loop is running
+        queue_enabled: Whether capture is driven by the capture_queue triggers
+            (False falls back to scanning every interval_seconds)
         last_check: Timestamp of the last successful check
         stats: Capture statistics (failures and successes tracked separately)
     """
@@ -72,7 +185,11 @@ class AutoCapture:
         self.interval = interval_seconds
         self.lookback_hours = lookback_hours
         self.running = False
+        self.queue_enabled = False
         self.last_check: Optional[datetime] = None
+        # Pooled connection held by the running loop (see _connection)
+        self._pool = None
+        self._conn: Optional[sqlite3.Connection] = None
         self.stats = {
             "failures_captured": 0,
             "successes_captured": 0,
@@ -85,202 +202,236 @@ class AutoCapture:
     async def start(self):
         """Start the auto-capture background loop."""
         self.running = True
+        self._pool = get_pool()
+        self._conn = await run_in_threadpool(self._pool.acquire)
+        try:
+            await self._run()
+        finally:
+            self._release_connection()
+
+    async def _run(self):
+        """The capture loop; runs on the connection start() acquired."""
+        self.queue_enabled = await run_in_threadpool(self._ensure_capture_queue)
         logger.info(
-            f"AutoCapture started: interval={self.interval}s, lookback={self.lookback_hours}h"
+            f"AutoCapture started: interval={self.interval}s, lookback={self.lookback_hours}h, "
+            f"queue={'on' if self.queue_enabled else 'off'}"
         )
 
+        # Catch up on runs that finished while the dashboard was down
+        await self._capture_pass()
+
+        delay = QUEUE_POLL_MIN_SECONDS
         while self.running:
+            await asyncio.sleep(delay if self.queue_enabled else self.interval)
+            if not self.running:
+                break
+            if not self.queue_enabled:
+                await self._capture_pass()
+                continue
+
             try:
-                # Capture both failures and successes
-                failures = await self.capture_new_failures()
-                successes = await self.capture_new_successes()
-                total = failures + successes
-
-                self.stats["runs"] += 1
-                self.stats["last_batch_size"] = total
-
-                if failures > 0:
-                    logger.info(f"AutoCapture: captured {failures} new failure(s)")
-                if successes > 0:
-                    logger.info(f"AutoCapture: captured {successes} new success(es)")
-            except Exception as e:
+                queued = await run_in_threadpool(self._queued_marker)
+            except sqlite3.Error as e:
                 self.stats["errors"] += 1
-                logger.error(f"AutoCapture error: {e}")
-
-            await asyncio.sleep(self.interval)
+                logger.error(f"AutoCapture queue check failed: {e}")
+                queued = None
+
+            if queued is None:
+                delay = min(delay * 2, self.interval)
+                continue
+            # Markers are only cleared once the pass succeeded, so a failed
+            # pass is retried on the next check
+            if await self._capture_pass():
+                await run_in_threadpool(self._clear_queue, queued)
+            delay = QUEUE_POLL_MIN_SECONDS
+
+    async def _capture_pass(self) -> bool:
+        """Capture new failures and successes; return False if the pass errored."""
+        try:
+            failures, successes = await self.capture_new_outcomes()
+            total = failures + successes
+
+            self.stats["runs"] += 1
+            self.stats["last_batch_size"] = total
+
+            if failures > 0:
+                logger.info(f"AutoCapture: captured {failures} new failure(s)")
+            if successes > 0:
+                logger.info(f"AutoCapture: captured {successes} new success(es)")
+            return True
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"AutoCapture error: {e}")
+            return False
+
+    @contextmanager
+    def _connection(self):
+        """The connection held by the loop, or a pooled one when not running.
+
+        Holding one connection across ticks keeps its prepared statements
+        warm. Like the pool on release, any transaction still open
+        afterwards is rolled back so the held connection never pins an
+        old WAL snapshot.
+        """
+        conn = self._conn
+        if conn is None:
+            with get_db() as conn:
+                yield conn
+            return
+        try:
+            yield conn
+        finally:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error as e:
+                logger.warning(f"AutoCapture dropping its connection: {e}")
+                self._release_connection()
+
+    def _release_connection(self) -> None:
+        """Hand the held connection back to the pool it came from."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.release(conn)
+
+    def _ensure_capture_queue(self) -> bool:
+        """Create capture_queue and its workflow_runs triggers; False if unavailable."""
+        try:
+            with self._connection() as conn:
+                for statement in _CAPTURE_QUEUE_SCHEMA:
+                    conn.execute(statement)
+                conn.commit()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"AutoCapture queue unavailable ({e}); polling every interval")
+            return False
+
+    def _queued_marker(self) -> Optional[int]:
+        """Highest queued marker id, or None when nothing is waiting."""
+        with self._connection() as conn:
+            return conn.execute("SELECT MAX(id) FROM capture_queue").fetchone()[0]
+
+    def _clear_queue(self, up_to: int) -> None:
+        """Drop markers handled by the last pass; newer ones wait for the next."""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM capture_queue WHERE id <= ?", (up_to,))
+            conn.commit()
 
     def stop(self):
         """Stop the auto-capture background loop."""
         self.running = False
         logger.info("AutoCapture stopped")
 
-    async def capture_new_failures(self) -> int:
+    async def capture_new_outcomes(self) -> Tuple[int, int]:
         """
-        Convert new workflow failures to learnings.
+        Convert new workflow failures and successes to learnings.
+
+        Failures capture failed/cancelled runs; successes capture completed
+        runs, so the system learns from what works, not just what fails.
+        Both come from one scan of workflow_runs and are committed together.
+        The DB work runs in a worker thread so the event loop keeps serving
+        requests meanwhile.
 
         Returns:
-            Number of failures captured
+            (failures captured, successes captured)
         """
-        with get_db() as conn:
-            cursor = conn.cursor()
-
-            # Find failures not yet captured
-            cursor.execute(
-                """
-                SELECT wr.id, wr.workflow_name, wr.error_message, wr.created_at
-                FROM workflow_runs wr
-                WHERE wr.status IN ('failed', 'cancelled')
-                AND wr.created_at > datetime('now', ?)
-                AND NOT EXISTS (
-                    SELECT 1 FROM learnings l
-                    WHERE l.filepath = 'workflow_runs/' || wr.id
-                    AND l.type = 'failure'
-                )
-                """,
-                (f"-{self.lookback_hours} hours",),
-            )
+        return await run_in_threadpool(self._capture_new_outcomes_sync)
 
-            failures = cursor.fetchall()
-            captured = 0
-
-            for f in failures:
-                run_id, workflow_name, error_message, created_at = f
-                title = f"Workflow failed: {workflow_name} [run:{run_id}]"
-                summary = error_message or "No error message"
-
-                try:
-                    cursor.execute(
-                        """
-                        INSERT INTO learnings (type, filepath, title, summary, domain, severity, created_at)
-                        VALUES ('failure', ?, ?, ?, 'workflow', 3, ?)
-                        """,
-                        (f"workflow_runs/{run_id}", title, summary, created_at),
-                    )
-                    learning_id = cursor.lastrowid
-                    captured += 1
-
-                    # Auto-create Kanban task from failure
-                    # TODO(kanban): Move feature flag check into create_task_from_failure for centralization
-                    if KANBAN_AUTO_CREATE_ENABLED and KANBAN_AVAILABLE:
-                        try:
-                            create_task_from_failure(
-                                learning_id=learning_id,
-                                title=f"Fix: {title}",
-                                summary=summary,
-                                domain='workflow'
-                            )
-                        except Exception as kanban_error:
-                            logger.warning(f"Failed to create Kanban task for failure {learning_id}: {kanban_error}")
-
-                except Exception as e:
-                    logger.warning(f"Failed to capture run {run_id}: {e}")
-
-            if captured > 0:
-                # Record capture metric
-                cursor.execute(
-                    """
-                    INSERT INTO metrics (metric_type, metric_name, metric_value, context)
-                    VALUES ('auto_failure_capture', 'background_job', ?, 'auto_capture.py')
-                    """,
-                    (captured,),
-                )
+    def _capture_new_outcomes_sync(self) -> Tuple[int, int]:
+        """Blocking body of capture_new_outcomes."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_UNCAPTURED_RUNS, {"lookback": f"-{self.lookback_hours} hours"})
+
+            rows = []
+            for kind, run_id, workflow_name, payload, created_at, completed_nodes, total_nodes in cursor.fetchall():
+                filepath = f"workflow_runs/{run_id}"
+                if kind == "failure":
+                    rows.append((kind, filepath, f"Workflow failed: {workflow_name} [run:{run_id}]",
+                                 payload or "No error message", 3, created_at))
+                else:
+                    rows.append((kind, filepath, f"Workflow completed: {workflow_name} [run:{run_id}]",
+                                 self._success_summary(run_id, payload, completed_nodes, total_nodes),
+                                 1, created_at))
+
+            inserted = _insert_learnings(cursor, rows)
+            failed = [row for row in inserted if row[0] == "failure"]
+            failures = len(failed)
+            successes = len(inserted) - failures
+
+            if inserted:
+                # Record capture metrics
+                metrics = [("auto_failure_capture", failures), ("auto_success_capture", successes)]
+                cursor.executemany(_INSERT_METRIC, [m for m in metrics if m[1] > 0])
                 conn.commit()
-                self.stats["failures_captured"] += captured
-                self.stats["total_captured"] += captured
-
-            self.last_check = datetime.now()
-            return captured
-
-    async def capture_new_successes(self) -> int:
-        """
-        Convert new workflow successes to learnings.
-
-        Captures completed workflow runs as success learnings, enabling
-        the system to learn from what works, not just what fails.
+                self.stats["failures_captured"] += failures
+                self.stats["successes_captured"] += successes
+                self.stats["total_captured"] += failures + successes
 
-        Returns:
-            Number of successes captured
-        """
-        with get_db() as conn:
-            cursor = conn.cursor()
+                # Auto-create Kanban tasks from failures, after the commit so
+                # kanban_automation's own connection is not blocked by ours
+                # TODO(kanban): Move feature flag check into create_task_from_failure for centralization
+                if failed and KANBAN_AUTO_CREATE_ENABLED and KANBAN_AVAILABLE:
+                    self._create_failure_tasks(cursor, failed)
 
-            # Find completed runs not yet captured as successes
+            self.last_check = datetime.now()
+            return failures, successes
+
+    def _create_failure_tasks(self, cursor, inserted: List[Tuple]) -> None:
+        """Create a Kanban task for each newly captured failure learning."""
+        # The capture query excluded runs that already had a failure
+        # learning, so each filepath maps to exactly the row inserted
+        filepaths = [row[1] for row in inserted]
+        learning_ids = {}
+        for start in range(0, len(filepaths), 500):
+            chunk = filepaths[start:start + 500]
             cursor.execute(
-                """
-                SELECT wr.id, wr.workflow_name, wr.output_json, wr.created_at,
-                       wr.completed_nodes, wr.total_nodes
-                FROM workflow_runs wr
-                WHERE wr.status = 'completed'
-                AND wr.created_at > datetime('now', ?)
-                AND NOT EXISTS (
-                    SELECT 1 FROM learnings l
-                    WHERE l.filepath = 'workflow_runs/' || wr.id
-                    AND l.type = 'success'
-                )
-                """,
-                (f"-{self.lookback_hours} hours",),
+                f"SELECT filepath, id FROM learnings WHERE type = 'failure' "
+                f"AND filepath IN ({','.join('?' * len(chunk))})",
+                chunk,
             )
+            learning_ids.update(cursor.fetchall())
 
-            successes = cursor.fetchall()
-            captured = 0
-
-            for s in successes:
-                run_id, workflow_name, output_json, created_at, completed_nodes, total_nodes = s
-                title = f"Workflow completed: {workflow_name} [run:{run_id}]"
-
-                # Build summary from available data
-                summary_parts = []
-                if completed_nodes and total_nodes:
-                    summary_parts.append(f"Completed {completed_nodes}/{total_nodes} nodes")
-
-                # Parse outcome from output_json if available
-                outcome = "unknown"
-                reason = ""
-                if output_json and output_json != '{}':
-                    try:
-                        output_data = json.loads(output_json)
-                        outcome = output_data.get('outcome', 'unknown')
-                        reason = output_data.get('reason', '')
-                    except (json.JSONDecodeError, TypeError) as e:
-                        logger.warning(f"Could not parse output_json for run {run_id}: {e}")
-
-                if outcome != "unknown":
-                    summary_parts.append(f"Outcome: {outcome}")
-                    if reason:
-                        summary_parts.append(f"Reason: {reason}")
-                elif output_json and output_json != '{}':
-                    # Fallback: show truncated raw output if no parsed outcome
-                    output_preview = output_json[:200] + "..." if len(output_json) > 200 else output_json
-                    summary_parts.append(f"Output: {output_preview}")
-
-                summary = ". ".join(summary_parts) if summary_parts else "Workflow completed successfully"
-
-                try:
-                    cursor.execute(
-                        """
-                        INSERT INTO learnings (type, filepath, title, summary, domain, severity, created_at)
-                        VALUES ('success', ?, ?, ?, 'workflow', 1, ?)
-                        """,
-                        (f"workflow_runs/{run_id}", title, summary, created_at),
-                    )
-                    captured += 1
-                except Exception as e:
-                    logger.warning(f"Failed to capture success run {run_id}: {e}")
-
-            if captured > 0:
-                # Record capture metric
-                cursor.execute(
-                    """
-                    INSERT INTO metrics (metric_type, metric_name, metric_value, context)
-                    VALUES ('auto_success_capture', 'background_job', ?, 'auto_capture.py')
-                    """,
-                    (captured,),
+        for _, filepath, title, summary, _, _ in inserted:
+            learning_id = learning_ids.get(filepath)
+            try:
+                create_task_from_failure(
+                    learning_id=learning_id,
+                    title=f"Fix: {title}",
+                    summary=summary,
+                    domain='workflow'
                 )
-                conn.commit()
-                self.stats["successes_captured"] += captured
-                self.stats["total_captured"] += captured
-
-            return captured
+            except Exception as kanban_error:
+                logger.warning(f"Failed to create Kanban task for failure {learning_id}: {kanban_error}")
+
+    @staticmethod
+    def _success_summary(run_id, output_json, completed_nodes, total_nodes) -> str:
+        """Build a success learning's summary from the run's progress and output."""
+        summary_parts = []
+        if completed_nodes and total_nodes:
+            summary_parts.append(f"Completed {completed_nodes}/{total_nodes} nodes")
+
+        # Parse outcome from output_json if available
+        outcome = "unknown"
+        reason = ""
+        if output_json and output_json != '{}':
+            try:
+                output_data = orjson.loads(output_json)
+                outcome = output_data.get('outcome', 'unknown')
+                reason = output_data.get('reason', '')
+            except (orjson.JSONDecodeError, TypeError) as e:
+                logger.warning(f"Could not parse output_json for run {run_id}: {e}")
+
+        if outcome != "unknown":
+            summary_parts.append(f"Outcome: {outcome}")
+            if reason:
+                summary_parts.append(f"Reason: {reason}")
+        elif output_json and output_json != '{}':
+            # Fallback: show truncated raw output if no parsed outcome
+            output_preview = output_json[:200] + "..." if len(output_json) > 200 else output_json
+            summary_parts.append(f"Output: {output_preview}")
+
+        return ". ".join(summary_parts) if summary_parts else "Workflow completed successfully"
 
     def get_status(self) -> dict:
         """
@@ -291,6 +442,7 @@ class AutoCapture:
         """
         return {
             "running": self.running,
+            "queue_enabled": self.queue_enabled,
             "interval_seconds": self.interval,
             "lookback_hours": self.lookback_hours,
             "last_check": self.last_check.isoformat() if self.last_check else None,
@@ -4,20 +4,30 @@ WebSocket broadcast management for the Emergent Learning Dashboard.
 Provides ConnectionManager for handling real-time updates to connected clients.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import List
+from typing import Callable, List, Optional, Set
 
 from fastapi import WebSocket
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on broadcasts fanning out at once; extra scheduled updates wait
+MAX_CONCURRENT_BROADCASTS = 8
+
 
 class ConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
         self.last_state_hash = None
+        # Created on first use so it binds to the running loop (Python < 3.10)
+        self._broadcast_semaphore: Optional[asyncio.Semaphore] = None
+        # Strong references so scheduled broadcasts are not garbage collected
+        self._pending_broadcasts: Set[asyncio.Task] = set()
+        # In-process listeners notified of every update before fan-out
+        self._listeners: List[Callable[[str, dict], None]] = []
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
@@ -28,7 +38,7 @@ class ConnectionManager:
 
     async def broadcast(self, message: dict):
         dead_connections = []
-        for connection in self.active_connections:
+        for connection in list(self.active_connections):
             try:
                 await connection.send_json(message)
             except Exception as e:
@@ -37,11 +47,34 @@ class ConnectionManager:
 
         # Remove dead connections
         for conn in dead_connections:
-            self.active_connections.remove(conn)
+            if conn in self.active_connections:
+                self.active_connections.remove(conn)
+
+    def subscribe(self, listener: Callable[[str, dict], None]):
+        """Register a callback invoked with (update_type, data) for each update."""
+        self._listeners.append(listener)
 
     async def broadcast_update(self, update_type: str, data: dict):
-        await self.broadcast({
-            "type": update_type,
-            "timestamp": datetime.now().isoformat(),
-            "data": data
-        })
+        for listener in self._listeners:
+            try:
+                listener(update_type, data)
+            except Exception as e:
+                logger.warning(f"Broadcast listener failed for {update_type}: {e}")
+
+        if self._broadcast_semaphore is None:
+            self._broadcast_semaphore = asyncio.Semaphore(MAX_CONCURRENT_BROADCASTS)
+        async with self._broadcast_semaphore:
+            try:
+                await self.broadcast({
+                    "type": update_type,
+                    "timestamp": datetime.now().isoformat(),
+                    "data": data
+                })
+            except Exception as e:
+                logger.error(f"Broadcast of {update_type} failed: {e}")
+
+    def schedule_update(self, update_type: str, data: dict) -> None:
+        """Broadcast an update in the background without blocking the caller."""
+        task = asyncio.create_task(self.broadcast_update(update_type, data))
+        self._pending_broadcasts.add(task)
+        task.add_done_callback(self._pending_broadcasts.discard)
@@ -4,10 +4,15 @@ Database utility functions for the Claude Learning Companion Dashboard.
 Provides database connection management and helper functions for SQLite operations.
 """
 
+import logging
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Optional
 
+logger = logging.getLogger(__name__)
 
 # Database path
 CLC_PATH = Path.home() / ".claude" / "clc"
@@ -27,17 +32,238 @@ def escape_like(s: str) -> str:
     return s.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
 
 
+# Per-connection settings. journal_mode=WAL is persistent in the database
+# file, so it is set once at startup by enable_wal() instead.
+CONNECTION_PRAGMAS = [
+    # Safe with WAL: a crash can lose the last commits but never corrupts
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    # 64 MiB page cache (negative = KiB); the default is only 2 MiB
+    "PRAGMA cache_size=-64000",
+]
+
+
+# Connections kept open for reuse across requests and background jobs.
+# Requests run on FastAPI's threadpool, so this bounds concurrent DB users
+# rather than threads; extra callers wait up to POOL_WAIT_SECONDS.
+POOL_MAX_SIZE = 16
+POOL_WAIT_SECONDS = 10.0
+
+
+class ConnectionPool:
+    """Thread-safe pool of configured SQLite connections.
+
+    Connections are created on demand up to max_size and handed out most
+    recently used first, so a quiet dashboard keeps reusing one warm
+    connection (page cache, prepared statements). Any transaction left
+    open by a caller is rolled back before the connection is reused,
+    matching what close() did before pooling.
+    """
+
+    def __init__(self, path: str, max_size: int = POOL_MAX_SIZE, wait_seconds: float = POOL_WAIT_SECONDS):
+        self.path = path
+        self.max_size = max_size
+        self.wait_seconds = wait_seconds
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._active = 0
+        self._waits = 0
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        # timeout is SQLite's busy timeout: lock waits retry for up to 10s
+        # instead of failing with "database is locked". Pooled connections
+        # move between threadpool threads, but only one uses each at a time.
+        conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, open a new one, or wait for one to be released."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.max_size
+                if can_create:
+                    self._created += 1
+                else:
+                    self._waits += 1
+            if can_create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                try:
+                    conn = self._idle.get(timeout=self.wait_seconds)
+                except queue.Empty:
+                    raise sqlite3.OperationalError(
+                        f"No database connection available after {self.wait_seconds}s"
+                    ) from None
+        with self._lock:
+            self._active += 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection, discarding it if it cannot be reset."""
+        with self._lock:
+            self._active -= 1
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding pooled connection: {e}")
+            self._discard(conn)
+            return
+        if self._closed:
+            self._discard(conn)
+            return
+        self._idle.put(conn)
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._created -= 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def close_all(self) -> None:
+        """Close idle connections; ones still in use are closed on release."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    def stats(self) -> Dict[str, int]:
+        """Pool counters for the health endpoint."""
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "open": self._created,
+                "active": self._active,
+                "idle": self._idle.qsize(),
+                "waits": self._waits,
+            }
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(str(DB_PATH))
+    return _pool
+
+
+def close_pool() -> None:
+    """Close pooled connections - call at application shutdown."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close_all()
+
+
 @contextmanager
 def get_db():
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(str(DB_PATH), timeout=10.0)
-    conn.row_factory = sqlite3.Row
+    """Get a pooled database connection with row factory."""
+    pool = get_pool()
+    conn = pool.acquire()
     try:
         yield conn
     finally:
-        conn.close()
+        pool.release(conn)
+
+
+# Indexes matching the WHERE/ORDER BY patterns of the dashboard routers.
+# Created once at startup; each statement is idempotent.
+DASHBOARD_INDEXES = [
+    # /heuristics?domain=..., /graph/related/{id}, /graph/domain/{d}
+    "CREATE INDEX IF NOT EXISTS idx_heur_domain_conf ON heuristics(domain, confidence DESC)",
+    # /heuristics?golden_only=true
+    "CREATE INDEX IF NOT EXISTS idx_heur_golden_conf ON heuristics(is_golden, confidence DESC)",
+    # /heuristics?after=<confidence>:<id> keyset pagination
+    "CREATE INDEX IF NOT EXISTS idx_heur_conf_id ON heuristics(confidence DESC, id DESC)",
+    # /heuristics/{id} history lookup (tags = 'heuristic_id:N')
+    "CREATE INDEX IF NOT EXISTS idx_metrics_tags ON metrics(tags, timestamp DESC)",
+    # AutoCapture's already-captured check (filepath = 'workflow_runs/<id>')
+    "CREATE INDEX IF NOT EXISTS idx_learnings_filepath_type ON learnings(filepath, type)",
+    # /kanban/tasks board order
+    "CREATE INDEX IF NOT EXISTS idx_kanban_priority_created ON kanban_tasks(priority DESC, created_at ASC)",
+    # AutoCapture's recent failed/completed runs scans
+    "CREATE INDEX IF NOT EXISTS idx_runs_status_created ON workflow_runs(status, created_at)",
+]
+
+
+def enable_wal():
+    """Switch the database to WAL journaling - call once at application startup.
+
+    Readers no longer block the writer, and a commit appends to the WAL
+    instead of rewriting the rollback journal.
+    """
+    try:
+        with get_db() as conn:
+            mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Could not enable WAL mode: {e}")
+        return
+    if mode.lower() != "wal":
+        logger.warning(f"Database journal mode is {mode}, not WAL")
+
+
+def ensure_indexes():
+    """Create dashboard query indexes - call once at application startup.
+
+    Missing tables are skipped so a partially-migrated database does not
+    prevent the dashboard from starting. Newly created indexes are
+    ANALYZEd so the planner has statistics for them straight away.
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        existing = _index_names(cursor)
+        for statement in DASHBOARD_INDEXES:
+            try:
+                cursor.execute(statement)
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Skipping index ({e}): {statement}")
+        for name in sorted(_index_names(cursor) - existing):
+            cursor.execute(f'ANALYZE "{name}"')
+        conn.commit()
+
+
+def _index_names(cursor) -> set:
+    """Names of all indexes currently in the database."""
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    return {name for (name,) in cursor.fetchall()}
 
 
 def dict_from_row(row) -> dict:
     """Convert sqlite3.Row to dict."""
     return dict(row) if row else None
+
+
+def dicts_from_cursor(cursor) -> list:
+    """Fetch the remaining rows of an executed cursor as dicts.
+
+    Column names are read once from cursor.description and zipped with
+    each row, which is cheaper than dict(row) going through sqlite3.Row's
+    key lookups for every row.
+    """
+    columns = [d[0] for d in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -0,0 +1,47 @@
+"""
+HTTP conditional-request helpers for polled dashboard endpoints.
+
+Handlers derive an ETag from whatever cheaply identifies the state behind
+a response (file fingerprints, scan times) and answer a matching
+If-None-Match with 304 before building the body.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+
+# Short enough that a polling dashboard still sees changes promptly
+CACHE_MAX_AGE_SECONDS = 5
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the repr of parts."""
+    return '"' + hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest() + '"'
+
+
+def _cache_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": f"max-age={CACHE_MAX_AGE_SECONDS}"}
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the request's If-None-Match matches etag, else None."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = {tag.strip() for tag in header.split(",")}
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    if "*" in candidates or etag in candidates or f"W/{etag}" in candidates:
+        return Response(status_code=304, headers=_cache_headers(etag))
+    return None
+
+
+def etag_response(content: Any, etag: str) -> Response:
+    """JSON response carrying etag and the short Cache-Control window.
+
+    content may be already-serialized JSON bytes, which are sent as-is.
+    """
+    if isinstance(content, bytes):
+        return Response(content, media_type="application/json", headers=_cache_headers(etag))
+    return ORJSONResponse(content, headers=_cache_headers(etag))
@@ -6,6 +6,7 @@ Provides functions to build SQL WHERE clauses for time-based filtering.
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Tuple
 
 # Valid SQL column name pattern (alphanumeric and underscores only)
@@ -24,10 +25,19 @@ def validate_column_name(column: str) -> str:
     return column
 
 
+def _parse_iso(text: str) -> datetime:
+    """Parse an ISO timestamp, accepting a trailing 'Z' for UTC."""
+    return datetime.fromisoformat(text.replace('Z', '+00:00'))
+
+
+@lru_cache(maxsize=1024)
 def parse_time_params(at_time: Optional[str] = None, time_range: Optional[str] = None) -> Tuple[Optional[datetime], Optional[datetime]]:
     """
     Parse time filter parameters.
 
+    Results are memoized (datetimes are immutable), so the same filter
+    repeated across a page's requests is only parsed once.
+
     Args:
         at_time: ISO timestamp for point-in-time query (e.g., "2025-12-19T15:00:00Z")
         time_range: Time range as "start/end" (e.g., "2025-12-19T00:00:00Z/2025-12-19T23:59:59Z")
@@ -37,18 +47,15 @@ def parse_time_params(at_time: Optional[str] = None, time_range: Optional[str] =
     """
     if at_time:
         # Point-in-time query: return data as it existed at that moment
-        end = datetime.fromisoformat(at_time.replace('Z', '+00:00'))
-        return (None, end)
+        return (None, _parse_iso(at_time))
 
     if time_range:
         # Range query: return data within the range
-        parts = time_range.split('/')
-        if len(parts) != 2:
+        start, sep, end = time_range.partition('/')
+        if not sep or '/' in end:
             raise ValueError("time_range must be in format 'start/end'")
 
-        start = datetime.fromisoformat(parts[0].replace('Z', '+00:00'))
-        end = datetime.fromisoformat(parts[1].replace('Z', '+00:00'))
-        return (start, end)
+        return (_parse_iso(start), _parse_iso(end))
 
     return (None, None)
 
@@ -72,24 +79,32 @@ def build_time_filter(
     Raises:
         ValueError: If timestamp_column contains invalid characters
     """
-    # Validate column name to prevent SQL injection
-    validated_column = validate_column_name(timestamp_column)
-
-    conditions = []
     params = []
-
     if start_time:
-        conditions.append(f"{validated_column} >= ?")
         params.append(start_time.isoformat())
-
     if end_time:
-        conditions.append(f"{validated_column} <= ?")
         params.append(end_time.isoformat())
 
-    if conditions:
-        return (" AND ".join(conditions), params)
+    return (_time_clause(timestamp_column, bool(start_time), bool(end_time)), params)
+
+
+@lru_cache(maxsize=64)
+def _time_clause(timestamp_column: str, has_start: bool, has_end: bool) -> str:
+    """WHERE clause text for build_time_filter; memoized per column and bound set.
+
+    Raises:
+        ValueError: If timestamp_column contains invalid characters
+    """
+    # Validate column name to prevent SQL injection
+    validated_column = validate_column_name(timestamp_column)
 
-    return ("", [])
+    if has_start and has_end:
+        return f"{validated_column} >= ? AND {validated_column} <= ?"
+    if has_start:
+        return f"{validated_column} >= ?"
+    if has_end:
+        return f"{validated_column} <= ?"
+    return ""
 
 
 def apply_time_filter(
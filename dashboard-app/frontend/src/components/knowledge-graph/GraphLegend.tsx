@@ -10,9 +10,13 @@ export default function GraphLegend() {
         <div className="w-3 h-3 rounded-full bg-blue-500"></div>
         <span className="text-slate-300">Regular Heuristic</span>
       </div>
+      <div className="flex items-center space-x-2">
+        <div className="w-4 h-4 rounded-full border-2 border-dashed border-slate-400"></div>
+        <span className="text-slate-300">Domain Hub</span>
+      </div>
       <div className="flex items-center space-x-2">
         <div className="w-8 h-0.5 bg-slate-500"></div>
-        <span className="text-slate-300">Same Domain</span>
+        <span className="text-slate-300">In Domain</span>
       </div>
       <div className="flex items-center space-x-2">
         <div className="w-8 h-0.5 bg-slate-600 opacity-50"></div>
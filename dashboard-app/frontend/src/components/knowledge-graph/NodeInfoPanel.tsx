@@ -28,13 +28,14 @@ export default function NodeInfoPanel({ node, isSelected, onClose }: NodeInfoPan
             </span>
           </div>
           <h4 className="text-sm font-medium text-white mb-2">
-            {node.fullText}
+            {node.is_hub ? `Domain: ${node.domain}` : node.fullText}
           </h4>
           {node.explanation && (
             <p className="text-xs text-slate-400 mb-2">
               {node.explanation}
             </p>
           )}
+          {!node.is_hub && (
           <div className="flex items-center space-x-3 text-xs text-slate-400">
             <div>
               <span className="text-emerald-400">{node.times_validated}</span> validated
@@ -46,6 +47,7 @@ export default function NodeInfoPanel({ node, isSelected, onClose }: NodeInfoPan
               <span className="text-purple-400">{(node.confidence * 100).toFixed(0)}%</span> confidence
             </div>
           </div>
+          )}
         </div>
         {isSelected && onClose && (
           <button
@@ -1,10 +1,12 @@
 export interface GraphNode {
-  id: number
+  // Heuristic nodes use the numeric heuristic id; domain hubs use "domain_<name>"
+  id: number | string
   label: string
   fullText: string
   domain: string
   confidence: number
   is_golden: boolean
+  is_hub?: boolean
   times_validated: number
   times_violated: number
   explanation?: string
@@ -18,8 +20,8 @@ export interface GraphNode {
 
 export interface GraphEdge {
   id: number
-  source: number | GraphNode
-  target: number | GraphNode
+  source: number | string | GraphNode
+  target: number | string | GraphNode
   strength: number
   type: string
   label: string
@@ -36,6 +38,10 @@ export interface GraphData {
   }
 }
 
+// Resolve an edge endpoint to its node id (D3 replaces ids with node objects)
+export const endpointId = (endpoint: GraphEdge['source']): number | string =>
+  typeof endpoint === 'object' ? endpoint.id : endpoint
+
 export interface KnowledgeGraphProps {
   onNodeClick?: (node: GraphNode) => void
 }
@@ -1,7 +1,7 @@
 import { useEffect, useRef } from 'react'
 import * as d3 from 'd3'
 import { GraphNode, GraphEdge, GraphData } from './types'
-import { getColorForDomain } from './types'
+import { getColorForDomain, endpointId } from './types'
 
 interface UseD3GraphProps {
   graphData: GraphData | null
@@ -56,19 +56,17 @@ export function useD3Graph({
       filteredNodes = filteredNodes.filter(n => n.domain === filterDomain)
       const nodeIds = new Set(filteredNodes.map(n => n.id))
       filteredEdges = filteredEdges.filter(e => {
-        const sourceId = typeof e.source === 'number' ? e.source : e.source.id
-        const targetId = typeof e.target === 'number' ? e.target : e.target.id
-        return nodeIds.has(sourceId) && nodeIds.has(targetId)
+        return nodeIds.has(endpointId(e.source)) && nodeIds.has(endpointId(e.target))
       })
     }
 
     if (showGoldenOnly) {
-      filteredNodes = filteredNodes.filter(n => n.is_golden)
+      // Keep domain hubs that still have a golden member
+      const goldenDomains = new Set(filteredNodes.filter(n => n.is_golden).map(n => n.domain))
+      filteredNodes = filteredNodes.filter(n => n.is_golden || (n.is_hub && goldenDomains.has(n.domain)))
       const nodeIds = new Set(filteredNodes.map(n => n.id))
       filteredEdges = filteredEdges.filter(e => {
-        const sourceId = typeof e.source === 'number' ? e.source : e.source.id
-        const targetId = typeof e.target === 'number' ? e.target : e.target.id
-        return nodeIds.has(sourceId) && nodeIds.has(targetId)
+        return nodeIds.has(endpointId(e.source)) && nodeIds.has(endpointId(e.target))
       })
     }
 
@@ -101,7 +99,7 @@ export function useD3Graph({
 
     // Create arrow markers for edges
     svg.append('defs').selectAll('marker')
-      .data(['same_domain', 'keyword_similarity'])
+      .data(['belongs_to', 'keyword_similarity'])
       .join('marker')
       .attr('id', d => `arrow-${d}`)
       .attr('viewBox', '0 -5 10 10')
@@ -112,7 +110,7 @@ export function useD3Graph({
       .attr('orient', 'auto')
       .append('path')
       .attr('d', 'M0,-5L10,0L0,5')
-      .attr('fill', d => d === 'same_domain' ? '#64748b' : '#475569')
+      .attr('fill', d => d === 'belongs_to' ? '#64748b' : '#475569')
       .attr('opacity', 0.6)
 
     // Initialize node positions if not set
@@ -147,8 +145,8 @@ export function useD3Graph({
       .selectAll('line')
       .data(filteredEdges)
       .join('line')
-      .attr('stroke', d => d.type === 'same_domain' ? '#64748b' : '#475569')
-      .attr('stroke-opacity', d => d.type === 'same_domain' ? 0.6 : 0.3)
+      .attr('stroke', d => d.type === 'belongs_to' ? '#64748b' : '#475569')
+      .attr('stroke-opacity', d => d.type === 'belongs_to' ? 0.6 : 0.3)
       .attr('stroke-width', d => Math.max(1, d.strength * 3))
       .attr('marker-end', d => `url(#arrow-${d.type})`)
 
@@ -175,7 +173,7 @@ export function useD3Graph({
         }))
 
     // Add node circles
-    nodes.append('circle')
+    nodes.filter(d => !d.is_hub).append('circle')
       .attr('r', d => {
         // Size by confidence, with golden rules larger
         const baseSize = 8 + (d.confidence * 12)
@@ -186,6 +184,15 @@ export function useD3Graph({
       .attr('stroke-width', d => d.is_golden ? 3 : 1.5)
       .attr('opacity', 0.9)
 
+    // Domain hubs: hollow ring in the domain color
+    nodes.filter(d => !!d.is_hub).append('circle')
+      .attr('r', 14)
+      .attr('fill', '#0f172a')
+      .attr('stroke', d => getColorForDomain(d.domain))
+      .attr('stroke-width', 3)
+      .attr('stroke-dasharray', '4 2')
+      .attr('opacity', 0.9)
+
     // Add golden rule glow effect
     nodes.filter(d => d.is_golden)
       .insert('circle', 'circle')
@@ -201,9 +208,9 @@ export function useD3Graph({
       .attr('dx', 12)
       .attr('dy', 4)
       .attr('font-size', '11px')
-      .attr('font-weight', d => d.is_golden ? 'bold' : 'normal')
+      .attr('font-weight', d => d.is_golden || d.is_hub ? 'bold' : 'normal')
       .attr('fill', '#e2e8f0')
-      .attr('opacity', d => d.is_golden ? 0.9 : 0)
+      .attr('opacity', d => d.is_golden || d.is_hub ? 0.9 : 0)
       .text(d => d.label)
       .attr('pointer-events', 'none')
 
@@ -216,26 +223,24 @@ export function useD3Graph({
           .select('text')
           .attr('opacity', 0.9)
         // Highlight connected nodes
-        const connectedNodeIds = new Set<number>()
+        const connectedNodeIds = new Set<number | string>()
         filteredEdges.forEach(e => {
-          const sourceId = typeof e.source === 'number' ? e.source : e.source.id
-          const targetId = typeof e.target === 'number' ? e.target : e.target.id
+          const sourceId = endpointId(e.source)
+          const targetId = endpointId(e.target)
           if (sourceId === d.id) connectedNodeIds.add(targetId)
           if (targetId === d.id) connectedNodeIds.add(sourceId)
         })
 
         nodes.attr('opacity', n => n.id === d.id || connectedNodeIds.has(n.id) ? 1 : 0.2)
         links.attr('opacity', e => {
-          const sourceId = typeof e.source === 'number' ? e.source : e.source.id
-          const targetId = typeof e.target === 'number' ? e.target : e.target.id
-          return sourceId === d.id || targetId === d.id ? 0.8 : 0.1
+          return endpointId(e.source) === d.id || endpointId(e.target) === d.id ? 0.8 : 0.1
         })
       })
       .on('mouseleave', (event, d) => {
         if (!selectedNodeRef.current || selectedNodeRef.current.id !== d.id) {
           onHoverChange(null)
-          // Hide label unless golden
-          if (!d.is_golden) {
+          // Hide label unless golden or a domain hub
+          if (!d.is_golden && !d.is_hub) {
             d3.select(event.currentTarget)
               .select('text')
               .attr('opacity', 0)
@@ -243,7 +248,7 @@ export function useD3Graph({
         }
         // Reset highlights
         nodes.attr('opacity', 1)
-        links.attr('opacity', e => e.type === 'same_domain' ? 0.6 : 0.3)
+        links.attr('opacity', e => e.type === 'belongs_to' ? 0.6 : 0.3)
       })
       .on('click', (_, d) => {
         selectedNodeRef.current = d
@@ -9,22 +9,66 @@ When a checkpoint_trigger message is found:
 1. Returns additionalContext with a checkpoint reminder
 2. Marks the message as read to prevent duplicate reminders
 
+The hook polls, but cheaply: the watcher, and this hook after each scan
+or mark, keep index.json next to the blackboard listing its unread
+checkpoint triggers together with the blackboard signature they were
+computed from. While that signature is current, a call costs one stat()
+and a read of the tiny index, however long the message log grows. Any
+write to the blackboard changes its signature, so no separate notifier
+process is needed (and a stale index is ignored rather than trusted).
+
 Part of Phase 2: Proactive Context Management.
 """
 
 import json
+import mmap
 import sys
+import time
 import traceback
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional
 
+# orjson is optional: hooks run under whatever Python the user has, so the
+# stdlib is the fallback. Both write the indent=2 layout the read-flag patch
+# below relies on, and orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 # Use shared utilities
 from utils.file_locking import acquire_lock, release_lock, LockingNotSupportedError
 from utils.formatting import format_usage_percentage
 
 BLACKBOARD_FILE = Path.home() / ".claude" / "clc" / ".coordination" / "blackboard.json"
 LOCK_FILE = BLACKBOARD_FILE.with_suffix(".lock")
+# Unread checkpoint triggers of one blackboard version (see read_trigger_index)
+INDEX_FILE = BLACKBOARD_FILE.parent / "index.json"
+# Same key as watcher_loop.UNREAD_TRIGGERS_KEY
+UNREAD_TRIGGERS_KEY = "unread_checkpoint_triggers_to_claude-main"
+
+# A message's unread flag as json.dumps(..., indent=2) writes it, and its
+# same-width replacement, so marking a message read can patch the file in
+# place instead of re-serializing the whole blackboard
+READ_FALSE_TOKEN = b'"read": false'
+READ_TRUE_TOKEN = b'"read": true '
+# Unset read_at slot written by the watcher (watcher_loop.READ_AT_PLACEHOLDER)
+READ_AT_PLACEHOLDER_TOKEN = b'"read_at": "0000-00-00T00:00:00.000000+00:00"'
+
+# Unread triggers older than this belong to a finished session and are ignored
+TRIGGER_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Present in the raw file whenever any checkpoint_trigger message exists
+CHECKPOINT_TRIGGER_TOKEN = b'"checkpoint_trigger"'
 
 # Template for checkpoint reminder message shown to the agent
 CHECKPOINT_REMINDER_TEMPLATE = """
@@ -42,12 +86,19 @@ This is a proactive checkpoint to preserve context quality.
 """
 
 
-def get_hook_input() -> dict:
-    """Read hook input from stdin."""
+def drain_stdin():
+    """Discard hook input without decoding it.
+
+    This hook never looks at the tool payload, which can be large (whole file
+    contents on Write/Edit). Draining in fixed-size chunks keeps memory flat and
+    still lets Claude finish writing the pipe.
+    """
+    stream = getattr(sys.stdin, "buffer", sys.stdin)
     try:
-        return json.load(sys.stdin)
-    except (json.JSONDecodeError, OSError):
-        return {}
+        while stream.read(65536):
+            pass
+    except (OSError, ValueError):
+        pass
 
 
 def output_result(result: dict):
@@ -55,44 +106,120 @@ def output_result(result: dict):
     print(json.dumps(result))
 
 
-def check_checkpoint_trigger() -> Optional[dict]:
-    """Check blackboard for unread checkpoint_trigger messages.
+def blackboard_signature() -> str:
+    """Identify the current blackboard version without reading it.
+
+    Writers replace the file by rename (new inode) and the read-flag patch
+    rewrites it in place (new mtime), so inode, size and mtime together
+    change whenever its content does.
+
+    Raises:
+        OSError: If the blackboard cannot be stat'ed (e.g. missing).
+    """
+    st = BLACKBOARD_FILE.stat()
+    return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def message_time(msg: dict) -> float:
+    """Epoch seconds of a message's timestamp, or +inf if it has none.
+
+    The watcher writes aware UTC timestamps and the conductor (through the
+    plugin blackboard) naive local ones; timestamp() handles both.
+    """
+    try:
+        return datetime.fromisoformat(msg["timestamp"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return float("inf")
+
+
+def first_recent(triggers: list) -> Optional[dict]:
+    """Return the oldest trigger within TRIGGER_MAX_AGE_SECONDS, if any."""
+    cutoff = time.time() - TRIGGER_MAX_AGE_SECONDS
+    for msg in triggers:
+        if message_time(msg) >= cutoff:
+            return msg
+    return None
 
-    Uses file locking to prevent race conditions with concurrent writers.
+
+def read_trigger_index(signature: str) -> Optional[list]:
+    """Return the indexed unread triggers if the index matches ``signature``.
 
     Returns:
-        The first unread checkpoint_trigger message, or None if none found.
+        The unread checkpoint_trigger messages, or None if the index is
+        missing, unreadable or describes another blackboard version.
     """
-    if not BLACKBOARD_FILE.exists():
+    try:
+        index = json_loads(INDEX_FILE.read_bytes())
+    except (json.JSONDecodeError, OSError):
+        return None
+    if not isinstance(index, dict) or index.get("blackboard") != signature:
+        return None
+    triggers = index.get(UNREAD_TRIGGERS_KEY)
+    return triggers if isinstance(triggers, list) else None
+
+
+def write_trigger_index(signature: str, triggers: list):
+    """Record the unread triggers of blackboard version ``signature``.
+
+    Written by rename so readers never need the blackboard lock. Failures
+    are ignored: without an index the next call just scans the blackboard.
+    """
+    index = {"blackboard": signature, UNREAD_TRIGGERS_KEY: triggers}
+    temp_file = INDEX_FILE.with_suffix(".tmp")
+    try:
+        temp_file.write_bytes(json_dumps_indented(index))
+        temp_file.rename(INDEX_FILE)
+    except OSError:
+        pass
+
+
+def consume_checkpoint_trigger() -> Optional[dict]:
+    """Find the first unread checkpoint_trigger message and mark it read.
+
+    While INDEX_FILE matches the blackboard's signature and lists no recent
+    trigger, this returns without taking any lock. Otherwise the lookup
+    (from the index, or a scan that rebuilds it) and the mark happen under
+    one exclusive lock, so two hooks running at once cannot both deliver
+    the same reminder.
+
+    Returns:
+        The trigger that was marked read, or None if none found.
+    """
+    try:
+        signature = blackboard_signature()
+    except OSError:
+        return None
+    triggers = read_trigger_index(signature)
+    if triggers is not None and first_recent(triggers) is None:
         return None
 
     lock_fd = None
     lock_acquired = False
     try:
-        # Acquire exclusive lock to prevent race with concurrent writes
+        # Acquire exclusive lock to prevent race conditions
         LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
         lock_fd = open(LOCK_FILE, "w")
         acquire_lock(lock_fd)
         lock_acquired = True
 
-        bb = json.loads(BLACKBOARD_FILE.read_text())
-        messages = bb.get("messages", [])
-
-        for msg in messages:
-            msg_type = msg.get("type")
-            # Supported message format:
-            # - Current format: type="checkpoint_trigger" with content as dict/JSON
-            #
-            # Legacy format (type=None with content="checkpoint_trigger" as a string)
-            # is deprecated and no longer handled here because downstream code expects
-            # JSON/dict content and would fail on a plain string payload.
-            is_checkpoint_trigger = msg_type == "checkpoint_trigger"
-            if (
-                is_checkpoint_trigger
-                and msg.get("to") == "claude-main"
-                and not msg.get("read", False)
-            ):
-                return msg
+        # Nothing else can change the blackboard until the lock is released
+        signature = blackboard_signature()
+        triggers = read_trigger_index(signature)
+        if triggers is None:
+            triggers = find_unread_triggers()
+        trigger = first_recent(triggers)
+        if trigger is None:
+            write_trigger_index(signature, triggers)
+            return None
+
+        try:
+            mark_message_read(trigger.get("id", ""))
+        except (json.JSONDecodeError, OSError):
+            # Still deliver the reminder; it repeats until a mark succeeds
+            sys.stderr.write(f"[checkpoint-responder] Error marking message read:\n{traceback.format_exc()}\n")
+            return trigger
+        reindex_after_mark(triggers, trigger)
+        return trigger
     except (json.JSONDecodeError, OSError, LockingNotSupportedError, TimeoutError):
         sys.stderr.write(f"[checkpoint-responder] Error reading blackboard:\n{traceback.format_exc()}\n")
     finally:
@@ -104,69 +231,147 @@ def check_checkpoint_trigger() -> Optional[dict]:
     return None
 
 
+def reindex_after_mark(triggers: list, trigger: dict):
+    """Key the trigger index to the blackboard just marked, minus ``trigger``.
+
+    Must be called with the blackboard lock held.
+    """
+    try:
+        signature = blackboard_signature()
+    except OSError:
+        return
+    write_trigger_index(signature, [msg for msg in triggers if msg is not trigger])
+
+
+def find_unread_triggers() -> list:
+    """Scan the blackboard for recent unread checkpoint_trigger messages.
+
+    Messages are appended in time order, so the scan walks back from the
+    newest and stops at the first trigger older than TRIGGER_MAX_AGE_SECONDS:
+    every trigger before it is older still. Other messages cost a single
+    type lookup; only triggers have their timestamp parsed. Triggers are
+    returned oldest first. Must be called with the blackboard lock held.
+    """
+    with open(BLACKBOARD_FILE, "rb") as f:
+        if not f.seek(0, 2):
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The common case: no trigger was ever posted, skip the parse
+            if mm.find(CHECKPOINT_TRIGGER_TOKEN) == -1:
+                return []
+            bb = json_loads(mm[:])
+    messages = bb.get("messages", [])
+
+    cutoff = time.time() - TRIGGER_MAX_AGE_SECONDS
+    triggers = []
+    for msg in reversed(messages):
+        # Supported message format:
+        # - Current format: type="checkpoint_trigger" with content as dict/JSON
+        #
+        # Legacy format (type=None with content="checkpoint_trigger" as a string)
+        # is deprecated and no longer handled here because downstream code expects
+        # JSON/dict content and would fail on a plain string payload.
+        if msg.get("type") != "checkpoint_trigger":
+            continue
+        if message_time(msg) < cutoff:
+            break
+        if msg.get("to") == "claude-main" and not msg.get("read", False):
+            triggers.append(msg)
+    triggers.reverse()
+    return triggers
+
+
+def patch_read_flag(msg_id: str) -> bool:
+    """Overwrite a message's "read": false with "read": true in place.
+
+    Must be called with the blackboard lock held. Messages are written with
+    "id" as their first key, so the flag is searched for between the
+    message's id and the next "id" key; anything ambiguous (duplicate id,
+    zero or several flags in that span, other formatting) returns False
+    and the caller falls back to a full rewrite. If the message has the
+    watcher's fixed-width read_at slot, the timestamp is written into it.
+
+    Args:
+        msg_id: The ID of the message to mark as read.
+
+    Returns:
+        True if the flag was patched.
+    """
+    id_token = json.dumps({"id": msg_id})[1:-1].encode()
+    with open(BLACKBOARD_FILE, "r+b") as f:
+        if not f.seek(0, 2):
+            return False
+        with mmap.mmap(f.fileno(), 0) as mm:
+            start = mm.find(id_token)
+            if start == -1 or mm.find(id_token, start + 1) != -1:
+                return False
+            start += len(id_token)
+            end = mm.find(b'"id": ', start)
+            if end == -1:
+                end = len(mm)
+            flag = mm.find(READ_FALSE_TOKEN, start, end)
+            if flag == -1 or mm.find(READ_FALSE_TOKEN, flag + 1, end) != -1:
+                return False
+            mm[flag:flag + len(READ_TRUE_TOKEN)] = READ_TRUE_TOKEN
+            slot = mm.find(READ_AT_PLACEHOLDER_TOKEN, start, end)
+            if slot != -1:
+                read_at = datetime.now(timezone.utc).isoformat(timespec="microseconds").encode()
+                # The placeholder's value starts after '"read_at": "'
+                slot += len(READ_AT_PLACEHOLDER_TOKEN) - len(read_at) - 1
+                mm[slot:slot + len(read_at)] = read_at
+            mm.flush()
+    return True
+
+
 def mark_message_read(msg_id: str):
     """Mark a blackboard message as read.
 
-    Uses file locking to prevent race conditions with concurrent writers.
+    Must be called with the blackboard lock held. The flag is patched in
+    place when possible; otherwise the blackboard is rewritten with read_at
+    set as well.
 
     Args:
         msg_id: The ID of the message to mark as read.
+
+    Raises:
+        OSError, json.JSONDecodeError: If the blackboard cannot be updated.
     """
-    if not BLACKBOARD_FILE.exists():
+    # Fast path: flip the flag (and fill the read_at slot) in place
+    if patch_read_flag(msg_id):
         return
 
-    lock_fd = None
-    lock_acquired = False
-    try:
-        # Acquire exclusive lock to prevent race conditions
-        LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
-        lock_fd = open(LOCK_FILE, "w")
-        acquire_lock(lock_fd)
-        lock_acquired = True
-
-        # Re-read blackboard under lock (may have changed)
-        bb = json.loads(BLACKBOARD_FILE.read_text())
-        for msg in bb.get("messages", []):
-            if msg.get("id") == msg_id:
-                msg["read"] = True
-                msg["read_at"] = datetime.now(timezone.utc).isoformat()
-                break
+    bb = json_loads(BLACKBOARD_FILE.read_bytes())
+    for msg in bb.get("messages", []):
+        if msg.get("id") == msg_id:
+            msg["read"] = True
+            msg["read_at"] = datetime.now(timezone.utc).isoformat()
+            break
 
-        # Write atomically
-        temp_file = BLACKBOARD_FILE.with_suffix(".tmp")
-        temp_file.write_text(json.dumps(bb, indent=2))
-        temp_file.rename(BLACKBOARD_FILE)
-
-    except (json.JSONDecodeError, OSError, LockingNotSupportedError, TimeoutError):
-        sys.stderr.write(f"[checkpoint-responder] Error marking message read:\n{traceback.format_exc()}\n")
-    finally:
-        if lock_acquired:
-            release_lock(lock_fd)
-        if lock_fd:
-            lock_fd.close()
+    # Write atomically
+    temp_file = BLACKBOARD_FILE.with_suffix(".tmp")
+    temp_file.write_bytes(json_dumps_indented(bb))
+    temp_file.rename(BLACKBOARD_FILE)
 
 
 def main():
     """Main hook logic."""
-    # Read hook input (we don't use it, but must consume stdin)
-    get_hook_input()
+    # The hook input is unused; drain it so the writer never sees a broken pipe
+    drain_stdin()
 
-    # Check for checkpoint trigger
-    trigger = check_checkpoint_trigger()
+    # Check for checkpoint trigger, marking it read so we don't repeat
+    trigger = consume_checkpoint_trigger()
 
     if trigger:
-        # Mark as read so we don't repeat
-        msg_id = trigger.get("id", "")
-        mark_message_read(msg_id)
-
-        # Parse content: may be dict, JSON string, or other.
+        # Parse content: may be dict, JSON string, or other. The watcher writes
+        # a dict; conductor triggers (sent through the string-typed
+        # send_message API) and older watcher triggers carry a JSON string.
         # Parse failures (set to None), None values, and non-dict types are all
         # handled the same way (defaulting to empty dict) since these cases indicate
         # malformed/legacy data where we want graceful degradation to default values.
         content = trigger.get("content")
         if isinstance(content, str):
             try:
-                content = json.loads(content)
+                content = json_loads(content)
             except json.JSONDecodeError:
                 content = None
 
@@ -15,24 +15,29 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 
-# Add coordinator to path for imports
-coordinator_path = str(Path(__file__).parent.parent / "coordinator")
-sys.path.insert(0, coordinator_path)
+# Add repo root to path for the coordinator package
+repo_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, repo_root)
 
-# Import ClaimChain FIRST from coordinator/blackboard.py (before blackboard_v2 adds plugins path)
-import importlib.util
-spec = importlib.util.spec_from_file_location("coordinator_blackboard", Path(coordinator_path) / "blackboard.py")
-coordinator_blackboard = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(coordinator_blackboard)
-ClaimChain = coordinator_blackboard.ClaimChain
+# Resolved on the first Edit/Write; other tools never import the coordinator
+_BLACKBOARD_CLS = None
 
-# Use Phase 2 blackboard (reads from event_log) with fallback
-try:
-    from blackboard_v2 import BlackboardV2 as Blackboard
-except ImportError:
-    # Fallback: use original from coordinator
-    Blackboard = coordinator_blackboard.Blackboard
+
+def get_blackboard_class() -> type:
+    """Import and return the blackboard class used to look up claims.
+
+    Claim chains live only in the coordinator blackboard; BlackboardV2
+    has no claims API, so it is not used here.
+    """
+    global _BLACKBOARD_CLS
+    if _BLACKBOARD_CLS is None:
+        # Imported as coordinator.blackboard so it is cached as .pyc like any
+        # module and cannot shadow the plugin's "blackboard" module
+        import coordinator.blackboard as coordinator_blackboard
+        _BLACKBOARD_CLS = coordinator_blackboard.Blackboard
+    return _BLACKBOARD_CLS
 
 
 @dataclass
@@ -64,19 +69,28 @@ def get_current_agent_id() -> str:
 def get_project_root() -> str:
     """Get the project root directory.
 
-    Looks for .coordination directory or uses current working directory.
+    Uses CLC_PROJECT_ROOT if set; otherwise looks for a .coordination
+    directory above the current working directory, or uses the current
+    working directory itself.
     """
-    cwd = Path.cwd()
+    project_root = os.environ.get("CLC_PROJECT_ROOT")
+    if project_root:
+        return project_root
+    return _find_project_root(str(Path.cwd()))
+
 
+@lru_cache(maxsize=8)
+def _find_project_root(cwd: str) -> str:
+    """Walk up from ``cwd`` to the nearest directory containing .coordination."""
     # Walk up the directory tree looking for .coordination
-    current = cwd
+    current = Path(cwd)
     while current != current.parent:
         if (current / ".coordination").exists():
             return str(current)
         current = current.parent
 
     # Default to current working directory
-    return str(cwd)
+    return cwd
 
 
 def pre_tool_use(tool_name: str, tool_input: Dict[str, Any]) -> HookResult:
@@ -105,8 +119,19 @@ def pre_tool_use(tool_name: str, tool_input: Dict[str, Any]) -> HookResult:
 
     # Check if file is claimed
     try:
-        bb = Blackboard(project_root)
-        claim = bb.get_claim_for_file(file_path)
+        bb = get_blackboard_class()(project_root)
+        # A current claims index answers the common cases (own claim, no
+        # claim) without reading the blackboard; only a claim held by
+        # another agent needs the full chain for the message below
+        view = bb.claim_index_view()
+        if view is None:
+            claim = bb.get_claim_for_file(file_path)
+        else:
+            with view:
+                entry = view.find(file_path)
+            if entry is not None and entry.is_owned_by(agent_id):
+                return HookResult.allow()
+            claim = bb.get_claim_for_file(file_path) if entry is not None else None
 
         if claim is None:
             # File not claimed by anyone
@@ -134,8 +159,8 @@ def pre_tool_use(tool_name: str, tool_input: Dict[str, Any]) -> HookResult:
                 f"Claimed by: {claim.agent_id}\n"
                 f"Reason: {claim.reason}\n"
                 f"Chain ID: {claim.chain_id}\n"
-                f"Claimed at: {claim.claimed_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                f"Expires at: {claim.expires_at.strftime('%Y-%m-%d %H:%M:%S')} (TTL: {expires_in:.1f} min)\n\n"
+                f"Claimed at: {claim.claimed_at.isoformat(sep=' ', timespec='seconds')}\n"
+                f"Expires at: {claim.expires_at.isoformat(sep=' ', timespec='seconds')} (TTL: {expires_in:.1f} min)\n\n"
                 f"Options:\n"
                 f"  1. Wait for claim to expire (est. {time_left:.1f} min remaining)\n"
                 f"  2. Coordinate with {claim.agent_id} to release the claim\n"
@@ -0,0 +1,155 @@
+"""Tests for the in-place read-flag patch in hooks/checkpoint-responder.py."""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+# Import the module under test (hyphenated file name, so load it by path)
+import importlib.util
+_spec = importlib.util.spec_from_file_location(
+    'checkpoint_responder',
+    os.path.join(os.path.dirname(__file__), '..', 'hooks', 'checkpoint-responder.py')
+)
+checkpoint_responder = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(checkpoint_responder)
+
+READ_AT_PLACEHOLDER = "0000-00-00T00:00:00.000000+00:00"
+
+
+def _message(msg_id, msg_type="checkpoint_trigger", **extra):
+    message = {
+        "id": msg_id,
+        "type": msg_type,
+        "from": "watcher",
+        "to": "claude-main",
+        "content": {"reason": "context_60_percent"},
+        "read": False,
+    }
+    message.update(extra)
+    return message
+
+
+@pytest.fixture
+def blackboard(tmp_path, monkeypatch):
+    """Point the hook at a blackboard.json in a temp directory."""
+    path = tmp_path / "blackboard.json"
+    monkeypatch.setattr(checkpoint_responder, "BLACKBOARD_FILE", path)
+    return path
+
+
+def _write(path, messages, **dump_kwargs):
+    dump_kwargs.setdefault("indent", 2)
+    path.write_text(json.dumps({"messages": messages, "context": {}}, **dump_kwargs))
+
+
+def _messages(path):
+    return {m["id"]: m for m in json.loads(path.read_text())["messages"]}
+
+
+class TestPatchReadFlag:
+    """Tests for the in-place fast path."""
+
+    def test_patches_single_message_in_place(self, blackboard):
+        _write(blackboard, [_message("msg-1", "info"), _message("msg-2"), _message("msg-3")])
+        inode, size = blackboard.stat().st_ino, blackboard.stat().st_size
+
+        assert checkpoint_responder.patch_read_flag("msg-2")
+
+        assert (blackboard.stat().st_ino, blackboard.stat().st_size) == (inode, size)
+        messages = _messages(blackboard)
+        assert messages["msg-2"]["read"] is True
+        assert messages["msg-1"]["read"] is False
+        assert messages["msg-3"]["read"] is False
+        assert "read_at" not in messages["msg-2"]
+
+    def test_fills_read_at_slot(self, blackboard):
+        _write(blackboard, [_message("msg-1", read_at=READ_AT_PLACEHOLDER),
+                            _message("msg-2", read_at=READ_AT_PLACEHOLDER)])
+        size = blackboard.stat().st_size
+
+        assert checkpoint_responder.patch_read_flag("msg-1")
+
+        assert blackboard.stat().st_size == size
+        messages = _messages(blackboard)
+        read_at = datetime.fromisoformat(messages["msg-1"]["read_at"])
+        assert read_at.utcoffset() is not None
+        assert messages["msg-2"]["read_at"] == READ_AT_PLACEHOLDER
+        assert messages["msg-2"]["read"] is False
+
+    def test_id_prefix_is_not_a_match(self, blackboard):
+        _write(blackboard, [_message("msg-12"), _message("msg-1")])
+
+        assert checkpoint_responder.patch_read_flag("msg-1")
+
+        messages = _messages(blackboard)
+        assert messages["msg-1"]["read"] is True
+        assert messages["msg-12"]["read"] is False
+
+    def test_duplicate_id_is_refused(self, blackboard):
+        _write(blackboard, [_message("msg-1"), _message("msg-1")])
+        before = blackboard.read_bytes()
+
+        assert not checkpoint_responder.patch_read_flag("msg-1")
+        assert blackboard.read_bytes() == before
+
+    def test_ambiguous_flag_is_refused(self, blackboard):
+        # A nested "read": false inside the message makes the span ambiguous
+        _write(blackboard, [_message("msg-1", meta={"read": False}), _message("msg-2")])
+        before = blackboard.read_bytes()
+
+        assert not checkpoint_responder.patch_read_flag("msg-1")
+        assert blackboard.read_bytes() == before
+
+    def test_other_formatting_is_refused(self, blackboard):
+        _write(blackboard, [_message("msg-1")], indent=None, separators=(",", ":"))
+        before = blackboard.read_bytes()
+
+        assert not checkpoint_responder.patch_read_flag("msg-1")
+        assert blackboard.read_bytes() == before
+
+
+class TestMarkMessageRead:
+    """Tests for the full-rewrite fallback."""
+
+    def test_duplicate_id_falls_back_to_rewrite(self, blackboard):
+        _write(blackboard, [_message("msg-1", content="first"), _message("msg-1", content="second")])
+
+        checkpoint_responder.mark_message_read("msg-1")
+
+        messages = json.loads(blackboard.read_text())["messages"]
+        assert [m["read"] for m in messages] == [True, False]
+        assert "read_at" in messages[0]
+
+    def test_ambiguous_flag_falls_back_to_rewrite(self, blackboard):
+        _write(blackboard, [_message("msg-1", meta={"read": False})])
+
+        checkpoint_responder.mark_message_read("msg-1")
+
+        message = _messages(blackboard)["msg-1"]
+        assert message["read"] is True
+        assert message["meta"] == {"read": False}
+
+    @pytest.mark.parametrize("serializer", ["orjson", "stdlib"])
+    def test_rewrite_keeps_layout_patchable(self, blackboard, monkeypatch, serializer):
+        if serializer == "orjson":
+            orjson = pytest.importorskip("orjson")
+            monkeypatch.setattr(checkpoint_responder, "json_dumps_indented",
+                                lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        else:
+            monkeypatch.setattr(checkpoint_responder, "json_dumps_indented",
+                                lambda obj: json.dumps(obj, indent=2).encode())
+        _write(blackboard, [_message("msg-1"), _message("msg-2", read_at=READ_AT_PLACEHOLDER)],
+               indent=None, separators=(",", ":"))
+
+        checkpoint_responder.mark_message_read("msg-1")
+
+        messages = _messages(blackboard)
+        assert messages["msg-1"]["read"] is True
+        assert messages["msg-2"]["read"] is False
+        # The rewritten file is in the layout the fast path expects
+        assert checkpoint_responder.patch_read_flag("msg-2")
+        message = _messages(blackboard)["msg-2"]
+        assert message["read"] is True
+        assert message["read_at"] != READ_AT_PLACEHOLDER
@@ -10,6 +10,7 @@ Tests:
 5. Blocking info is returned correctly
 6. Multiple agents cannot claim overlapping files
 7. Same agent can claim files in multiple non-overlapping chains
+8. The claims.idx index agrees with get_claim_for_file and detects staleness
 """
 
 import sys
@@ -395,6 +396,40 @@ class TestClaimQueries:
         assert active[0].chain_id == chain2.chain_id
 
 
+class TestClaimIndex:
+    """Test the claims.idx fast path used by the enforcement hook."""
+
+    def test_index_matches_get_claim_for_file(self, blackboard):
+        """Test that index lookups agree with the full state read."""
+        chain1 = blackboard.claim_chain("agent-1", ["src/a.py", "src/b.py"])
+        chain2 = blackboard.claim_chain("agent-2", ["src/c.py"])
+        blackboard.release_chain("agent-2", chain2.chain_id)
+        blackboard.claim_chain("agent-3", ["src/d.py"], ttl_minutes=0.01)
+        time.sleep(1)
+
+        with blackboard.claim_index_view() as view:
+            entry = view.find("src/a.py")
+            assert entry.chain_id == chain1.chain_id
+            assert entry.is_owned_by("agent-1")
+            assert not entry.is_owned_by("agent-2")
+            assert view.find("./src/b.py").chain_id == chain1.chain_id
+            for path in ["src/c.py", "src/d.py", "src/e.py"]:
+                assert view.find(path) is None
+                assert blackboard.get_claim_for_file(path) is None
+
+    def test_stale_index_is_ignored(self, blackboard):
+        """Test that a blackboard written by something else disables the index."""
+        assert blackboard.claim_index_view() is None
+
+        blackboard.claim_chain("agent-1", ["src/main.py"])
+        blackboard.claim_index_view().close()
+
+        time.sleep(0.01)
+        state = blackboard.blackboard_file.read_text()
+        blackboard.blackboard_file.write_text(state + "\n")
+        assert blackboard.claim_index_view() is None
+
+
 class TestClaimChainDataclass:
     """Test ClaimChain dataclass serialization."""
 
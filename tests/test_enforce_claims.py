@@ -0,0 +1,75 @@
+"""Tests for claim enforcement in hooks/enforce_claims.py."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coordinator.blackboard import Blackboard
+
+# Import the hook by path (hooks/ is not a package)
+import importlib.util
+_spec = importlib.util.spec_from_file_location(
+    'enforce_claims',
+    os.path.join(os.path.dirname(__file__), '..', 'hooks', 'enforce_claims.py')
+)
+enforce_claims = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(enforce_claims)
+
+
+@pytest.fixture
+def blackboard(tmp_path, monkeypatch):
+    """A coordinator blackboard in a temp project the hook points at."""
+    monkeypatch.setenv("CLC_PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setenv("AGENT_ID", "agent-2")
+    return Blackboard(str(tmp_path))
+
+
+def _edit(file_path):
+    return enforce_claims.pre_tool_use("Edit", {"file_path": file_path})
+
+
+class TestPreToolUse:
+    def test_file_claimed_by_other_agent_is_denied(self, blackboard):
+        chain = blackboard.claim_chain("agent-1", ["src/a.py"], reason="refactor")
+        assert blackboard.claim_index_view() is not None
+
+        result = _edit("src/a.py")
+
+        assert not result.allowed
+        assert "Claimed by: agent-1" in result.message
+        assert chain.chain_id in result.message
+
+    def test_own_claim_is_allowed(self, blackboard):
+        blackboard.claim_chain("agent-2", ["src/a.py"])
+
+        assert _edit("src/a.py").allowed
+
+    def test_unclaimed_file_is_denied(self, blackboard):
+        blackboard.claim_chain("agent-1", ["src/a.py"])
+
+        result = _edit("src/b.py")
+
+        assert not result.allowed
+        assert "File not claimed" in result.message
+
+    def test_stale_index_falls_back_to_blackboard(self, blackboard):
+        blackboard.claim_chain("agent-1", ["src/a.py"])
+        time.sleep(0.01)
+        state = blackboard.blackboard_file.read_text()
+        blackboard.blackboard_file.write_text(state + "\n")
+        assert blackboard.claim_index_view() is None
+
+        result = _edit("src/a.py")
+
+        assert not result.allowed
+        assert "Claimed by: agent-1" in result.message
+
+    def test_other_tools_are_not_checked(self, blackboard):
+        blackboard.claim_chain("agent-1", ["src/a.py"])
+
+        assert enforce_claims.pre_tool_use("Read", {"file_path": "src/a.py"}).allowed
@@ -39,16 +39,53 @@ from utils.file_locking import acquire_lock, release_lock, LockingNotSupportedEr
 COORDINATION_DIR = Path.home() / ".claude" / "clc" / ".coordination"
 BLACKBOARD_FILE = COORDINATION_DIR / "blackboard.json"
 LOCK_FILE = BLACKBOARD_FILE.with_suffix(".lock")
+TRIGGER_INDEX_FILE = COORDINATION_DIR / "index.json"
 WATCHER_LOG = COORDINATION_DIR / "watcher-log.md"
 STOP_FILE = COORDINATION_DIR / "watcher-stop"
 DECISION_FILE = COORDINATION_DIR / "decision.md"
 
+# Fixed-width read_at slot the checkpoint responder overwrites in place with
+# isoformat(timespec="microseconds") when it marks a trigger read
+READ_AT_PLACEHOLDER = "0000-00-00T00:00:00.000000+00:00"
+
+# Key under which TRIGGER_INDEX_FILE lists unread triggers for the main agent,
+# read by the checkpoint responder instead of scanning the whole message log
+UNREAD_TRIGGERS_KEY = "unread_checkpoint_triggers_to_claude-main"
+
 
 def utc_timestamp_iso() -> str:
     """Return current UTC timestamp in ISO format."""
     return datetime.now(timezone.utc).isoformat()
 
 
+def write_trigger_index(bb: Dict[str, Any]):
+    """Index the unread checkpoint triggers of the blackboard just written.
+
+    Must be called with the blackboard lock held, right after the rename.
+    The index is keyed by the same inode:size:mtime_ns signature the
+    checkpoint responder computes, so it is ignored once anything else
+    writes the blackboard.
+    """
+    st = BLACKBOARD_FILE.stat()
+    triggers = [
+        msg for msg in bb.get("messages", [])
+        if msg.get("type") == "checkpoint_trigger"
+        and msg.get("to") == "claude-main"
+        and not msg.get("read", False)
+    ]
+    index = {
+        "blackboard": f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}",
+        UNREAD_TRIGGERS_KEY: triggers,
+    }
+    temp_file = TRIGGER_INDEX_FILE.with_suffix(".tmp")
+    try:
+        temp_file.write_text(json.dumps(index, indent=2))
+        temp_file.rename(TRIGGER_INDEX_FILE)
+    except OSError as exc:
+        # The trigger itself is posted; the responder falls back to a scan
+        print(f"Failed to write trigger index: {exc}", file=sys.stderr)
+
+
 def trigger_checkpoint_via_blackboard(reason: str, metrics: Optional[Dict] = None) -> Optional[str]:
     """Write checkpoint trigger message to blackboard.
 
@@ -106,12 +143,14 @@ def trigger_checkpoint_via_blackboard(reason: str, metrics: Optional[Dict] = Non
             "type": "checkpoint_trigger",
             "from": "watcher",
             "to": "claude-main",
-            "content": json.dumps({
+            # Stored as an object, not a JSON string, so readers parse it once
+            "content": {
                 "reason": reason,
                 "estimated_usage": metrics_dict.get("estimated_usage"),
                 "metrics": metrics_dict.get("metrics", {}),
-            }),
+            },
             "read": False,
+            "read_at": READ_AT_PLACEHOLDER,
             "timestamp": utc_timestamp_iso()
         }
 
@@ -121,6 +160,7 @@ def trigger_checkpoint_via_blackboard(reason: str, metrics: Optional[Dict] = Non
         temp_file = BLACKBOARD_FILE.with_suffix(".tmp")
         temp_file.write_text(json.dumps(bb, indent=2))
         temp_file.rename(BLACKBOARD_FILE)
+        write_trigger_index(bb)
 
         return msg_id
 